@@ -1,9 +1,13 @@
 import sys
+import time
 import argparse
 from pathlib import Path
 from solve import GraphAnalyzer
 from graphs.io import CSVLoader
 from graphs.algorithms import Algorithms
+from graphs.labeling import LandmarkLabels
+from graphs.temporal import TemporalEdgeIndex
+from graphs.temporal_paths import TemporalPaths, INFINITY
 from viz import GraphVisualizer
 
 from constants import (
@@ -14,11 +18,19 @@ from constants import (
     ENDERECOS_PATH,
     RECIFE_GLOBAL_PATH,
     MICRORREGIOES_PATH,
+    VORONOI_HUBS_PATH,
     EGO_BAIRRO_PATH,
     GRAUS_PATH,
+    CONECTIVIDADE_PATH,
     DISTANCIAS_ENDERECOS_PATH,
+    MATRIZ_DISTANCIAS_PATH,
+    CRITICIDADE_ARESTAS_PATH,
     PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH,
     DATA_DIR,
+    BITCOIN_ALPHA_PATH,
+    BITCOIN_TEMPORAL_CACHE_DIR,
+    JOHNSON_APSP_DIR,
+    LANDMARK_LABELS_DIR,
 )
 
 
@@ -36,8 +48,20 @@ class GraphCLI:
 Exemplos de uso:
   %(prog)s analyze                      # Executa análise completa do grafo -> ego_bairro.csv, graus.csv, microrregioes.json e recife_global.json
   %(prog)s path "Boa Viagem" "Graças"   # Encontra caminho entre bairros
+  %(prog)s path A B --streets           # Mostra os logradouros de cada trecho do caminho
+  %(prog)s path A B --k 5               # Lista as 5 rotas alternativas de menor custo
+  %(prog)s path A B --close "Pte."      # Recalcula a rota com as pontes fechadas
+  %(prog)s streets "Av. Norte" --notes  # Lista conexões que usam um logradouro
+  %(prog)s temporal 7188 --target 1     # Caminho temporal de chegada mais cedo no Bitcoin Alpha
   %(prog)s process                      # Processa dados de entrada -> bairros_unique.csv
   %(prog)s distances                    # Calcula distâncias em lote -> distancias_enderecos.csv e percurso_nova_descoberta_setubal.json
+  %(prog)s reach "Nova Descoberta" --max-cost 10  # Bairros alcançáveis dentro de um custo (isócrona)
+  %(prog)s criticality                  # Ranqueia conexões cujo fechamento mais encarece as rotas -> criticidade_arestas.csv
+  %(prog)s reweight Derby Graças 5.5    # Altera o peso de uma conexão e corrige só as árvores afetadas das rotas
+  %(prog)s apsp --transform shift:10    # Distâncias entre todos os pares do Bitcoin Alpha (Johnson) -> distances.npy
+  %(prog)s labels build --metric hops  # Constrói o índice de rótulos (pruned landmark labeling) do Bitcoin Alpha
+  %(prog)s labels query 7188 1          # Distância exata entre dois usuários lida apenas dos rótulos
+  %(prog)s matrix --targets Derby Boa Vista  # Matriz de distâncias de todos os bairros até os destinos -> matriz_distancias.csv
   %(prog)s visualize [json_file]        # Gera visualização de árvore de percurso a partir de JSON -> arvore_percurso.html e arvore_percurso.png
   %(prog)s interactive                  # Gera grafo interativo HTML com caminho destacado -> grafo_interativo.html
   %(prog)s plots                        # Gera todos os gráficos estáticos (densidade, subgrafo, histograma)
@@ -63,6 +87,67 @@ Exemplos de uso:
         )
         path_parser.add_argument("start", help="Bairro de origem")
         path_parser.add_argument("end", help="Bairro de destino")
+        path_parser.add_argument(
+            "--streets",
+            action="store_true",
+            help="Mostra os logradouros usados em cada trecho do caminho",
+        )
+        path_parser.add_argument(
+            "--via",
+            help="Força o caminho a passar por um logradouro (ex.: 'Pte. do Limoeiro')",
+        )
+        path_parser.add_argument(
+            "--close",
+            action="append",
+            default=[],
+            metavar="LOGRADOURO",
+            help="Fecha as conexões de um logradouro antes da busca (ex.: 'Pte.'; pode ser repetido)",
+        )
+        path_parser.add_argument(
+            "--avoid",
+            action="append",
+            default=[],
+            metavar="BAIRRO",
+            help="Bloqueia a passagem por um bairro (pode ser repetido)",
+        )
+        path_parser.add_argument(
+            "--k",
+            type=int,
+            default=1,
+            help="Lista as k rotas sem ciclos de menor custo (padrão: 1)",
+        )
+
+        # Comando: streets
+        streets_parser = subparsers.add_parser(
+            "streets", help="Lista as conexões entre bairros que usam um logradouro"
+        )
+        streets_parser.add_argument("street", help="Nome do logradouro (ex.: 'Av. Norte')")
+        streets_parser.add_argument(
+            "--notes",
+            action="store_true",
+            help="Também procura o logradouro nas observações das conexões",
+        )
+
+        # Comando: temporal
+        temporal_parser = subparsers.add_parser(
+            "temporal",
+            help="Caminhos temporais no Bitcoin Alpha (chegada mais cedo, partida mais tarde, mais rápido)",
+        )
+        temporal_parser.add_argument(
+            "sources", nargs="+", help="Usuário(s) de origem (vários = modo em lote)"
+        )
+        temporal_parser.add_argument("--target", help="Usuário de destino")
+        temporal_parser.add_argument(
+            "--mode",
+            choices=["earliest", "latest", "fastest"],
+            default="earliest",
+            help="Tipo de caminho temporal (padrão: earliest)",
+        )
+        temporal_parser.add_argument("--start", type=int, help="Início da janela (timestamp Unix)")
+        temporal_parser.add_argument("--end", type=int, help="Fim da janela (timestamp Unix)")
+        temporal_parser.add_argument(
+            "--duration", type=int, default=1, help="Duração de cada aresta em segundos (padrão: 1)"
+        )
 
         # Comando: process
         process_parser = subparsers.add_parser(
@@ -74,6 +159,121 @@ Exemplos de uso:
             "distances",
             help="Calcula distâncias em lote para pares de endereços -> distancias_enderecos.csv e percurso_nova_descoberta_setubal.json",
         )
+        distances_parser.add_argument(
+            "--workers",
+            type=int,
+            help="Número de processos para as buscas por origem (padrão: número de CPUs; 1 = sem paralelismo)",
+        )
+
+        # Comando: criticality
+        criticality_parser = subparsers.add_parser(
+            "criticality",
+            help="Ranqueia as conexões cujo fechamento mais encarece as rotas de enderecos.csv -> criticidade_arestas.csv",
+        )
+        criticality_parser.add_argument(
+            "--workers",
+            type=int,
+            help="Número de processos para recalcular as árvores afetadas (padrão: número de CPUs)",
+        )
+        criticality_parser.add_argument(
+            "--top", type=int, default=10, help="Quantas conexões mostrar no terminal (padrão: 10)"
+        )
+
+        # Comando: reweight
+        reweight_parser = subparsers.add_parser(
+            "reweight",
+            help="Altera o peso de uma conexão e atualiza incrementalmente as rotas de enderecos.csv",
+        )
+        reweight_parser.add_argument("first", help="Bairro de uma ponta da conexão")
+        reweight_parser.add_argument("second", help="Bairro da outra ponta da conexão")
+        reweight_parser.add_argument("weight", type=float, help="Novo peso da conexão")
+        reweight_parser.add_argument(
+            "--top", type=int, default=10, help="Quantas rotas alteradas mostrar no terminal (padrão: 10)"
+        )
+
+        # Comando: reach
+        reach_parser = subparsers.add_parser(
+            "reach",
+            help="Lista os vértices alcançáveis a partir de uma origem dentro de um custo ou número de saltos",
+        )
+        reach_parser.add_argument("start", help="Bairro (ou usuário, com --bitcoin) de origem")
+        reach_limit = reach_parser.add_mutually_exclusive_group(required=True)
+        reach_limit.add_argument("--max-cost", type=float, help="Custo máximo a partir da origem")
+        reach_limit.add_argument("--hops", type=int, help="Número máximo de saltos (arestas)")
+        reach_parser.add_argument(
+            "--bitcoin",
+            action="store_true",
+            help="Usa o grafo Bitcoin Alpha (custo = |rating|) em vez dos bairros do Recife",
+        )
+
+        # Comando: apsp
+        apsp_parser = subparsers.add_parser(
+            "apsp",
+            help="Distâncias entre todos os pares do Bitcoin Alpha com pesos negativos (Johnson) -> distances.npy",
+        )
+        apsp_parser.add_argument(
+            "--transform",
+            default="identity",
+            help="Transformação dos ratings (identity, abs, inverse_trust, shift:<c>, clip:<min>,<max>; padrão: identity)",
+        )
+        apsp_parser.add_argument(
+            "--workers",
+            type=int,
+            help="Número de processos para as execuções de Dijkstra (padrão: número de CPUs)",
+        )
+        apsp_parser.add_argument(
+            "--output", default=JOHNSON_APSP_DIR, help="Diretório da matriz e dos potenciais"
+        )
+
+        # Comando: labels
+        labels_parser = subparsers.add_parser(
+            "labels",
+            help="Índice de rótulos de marcos (pruned landmark labeling) para distâncias exatas no Bitcoin Alpha",
+        )
+        labels_parser.add_argument("action", choices=["build", "query"], help="Constrói o índice ou consulta uma distância")
+        labels_parser.add_argument("nodes", nargs="*", help="Origem e destino (apenas para query)")
+        labels_parser.add_argument(
+            "--metric",
+            choices=["hops", "weight"],
+            default="hops",
+            help="Número de saltos (BFS) ou custo |rating| (Dijkstra) (padrão: hops)",
+        )
+
+        # Comando: matrix
+        matrix_parser = subparsers.add_parser(
+            "matrix",
+            help="Calcula a matriz de distâncias origem-destino entre bairros -> matriz_distancias.csv",
+        )
+        matrix_parser.add_argument(
+            "--sources", nargs="+", help="Bairros de origem (padrão: todos os bairros)"
+        )
+        matrix_parser.add_argument(
+            "--targets", nargs="+", help="Bairros de destino (padrão: todos os bairros)"
+        )
+        matrix_parser.add_argument(
+            "--strategy",
+            choices=["auto", "forward", "reverse", "floyd"],
+            default="auto",
+            help="Buscas a partir das origens (forward), dos destinos no grafo reverso (reverse) "
+            "ou Floyd-Warshall denso (floyd); auto usa floyd em grafos pequenos e densos e, "
+            "nos demais, o lado com menos bairros (padrão: auto)",
+        )
+        matrix_parser.add_argument(
+            "--output",
+            default=str(MATRIZ_DISTANCIAS_PATH),
+            help=f"Arquivo de saída .csv, .npy ou .jsonl (padrão: {MATRIZ_DISTANCIAS_PATH})",
+        )
+        matrix_parser.add_argument(
+            "--format", choices=["csv", "npy", "jsonl"], help="Formato de saída (padrão: extensão do arquivo)"
+        )
+        matrix_parser.add_argument(
+            "--path",
+            nargs=2,
+            action="append",
+            default=[],
+            metavar=("ORIGEM", "DESTINO"),
+            help="Inclui o caminho completo para este par (pode ser repetido)",
+        )
 
         # Comando: visualize
         visualize_parser = subparsers.add_parser(
@@ -131,8 +331,10 @@ Exemplos de uso:
             print("Resultados salvos:")
             print(f"  • Métricas globais: {RECIFE_GLOBAL_PATH}")
             print(f"  • Microrregiões: {MICRORREGIOES_PATH}")
+            print(f"  • Células de Voronoi dos bairros com maior grau: {VORONOI_HUBS_PATH}")
             print(f"  • Redes ego: {EGO_BAIRRO_PATH}")
             print(f"  • Ranking por grau: {GRAUS_PATH}")
+            print(f"  • Pontes, articulações e componentes biconexos: {CONECTIVIDADE_PATH}")
             print("=" * 60)
 
             return 0
@@ -140,6 +342,25 @@ Exemplos de uso:
             print(f"❌ Erro ao executar análise: {e}", file=sys.stderr)
             return 1
 
+    @staticmethod
+    def _resolve_names(algorithms: Algorithms, names):
+        resolver = algorithms.get_resolver()
+        resolved_names = []
+        for name in names:
+            resolved = resolver.resolve(name)
+            if resolved is None:
+                print(f"❌ Bairro não encontrado: {name}", file=sys.stderr)
+                suggestions = resolver.suggest(name)
+                if suggestions:
+                    print("   Você quis dizer:", file=sys.stderr)
+                    for suggestion, score in suggestions:
+                        print(f"     • {suggestion} ({score:.2f})", file=sys.stderr)
+                return None
+            if resolved != name:
+                print(f"Interpretando '{name}' como '{resolved}'")
+            resolved_names.append(resolved)
+        return resolved_names
+
     def cmd_path(self, args) -> int:
         try:
             print("=" * 60)
@@ -151,12 +372,57 @@ Exemplos de uso:
             print("\nCarregando grafo...")
             algorithms.load_graph_from_csv(ADJACENCIES_PATH)
 
+            endpoints = self._resolve_names(algorithms, [args.start, args.end])
+            if endpoints is None:
+                return 1
+            args.start, args.end = endpoints
+
+            avoided = self._resolve_names(algorithms, args.avoid)
+            if avoided is None:
+                return 1
+            for street in args.close:
+                closed = algorithms.block_street(street)
+                print(f"Fechando {len(closed)} conexão(ões) pelo logradouro '{street}'")
+            if avoided:
+                algorithms.block_nodes(avoided)
+                print(f"Evitando: {', '.join(avoided)}")
+
+            if args.k > 1 and not args.via:
+                print(f"Buscando as {args.k} rotas de menor custo (Yen)...\n")
+                routes = algorithms.k_shortest_paths(args.start, args.end, args.k)
+                if not routes:
+                    print("Custo total: inf")
+                    print("Caminho: No path found")
+                for rank, (cost, nodes) in enumerate(routes, 1):
+                    print(f"{rank}. Custo {cost}: {' -> '.join(nodes)}")
+                    if args.streets:
+                        for hop in algorithms.path_streets(nodes):
+                            streets = ", ".join(hop["logradouros"]) or "N/A"
+                            print(f"     • {hop['origem']} → {hop['destino']}: {streets}")
+                print("=" * 60)
+                return 0
+
             print("Executando Dijkstra...\n")
-            cost, path = algorithms.dijkstra(args.start, args.end)
+            if args.via:
+                cost, path = algorithms.route_via_street(args.start, args.end, args.via)
+                print(f"Passando por: {args.via}")
+            else:
+                cost, path = algorithms.dijkstra(args.start, args.end)
             print(f"Custo total: {cost}")
             print(f"Caminho: {path}")
 
-            if args.start == "Nova Descoberta" and args.end == "Boa Viagem (Setúbal)":
+            if args.streets and cost != float("inf"):
+                print("\nLogradouros por trecho:")
+                for hop in algorithms.path_streets(path, args.via):
+                    streets = ", ".join(hop["logradouros"]) or "N/A"
+                    print(f"  • {hop['origem']} → {hop['destino']}: {streets}")
+
+            if (
+                args.start == "Nova Descoberta"
+                and args.end == "Boa Viagem (Setúbal)"
+                and not args.via
+                and not algorithms.mask
+            ):
                 import json
 
                 result = {
@@ -185,6 +451,109 @@ Exemplos de uso:
             print(f"❌ Erro ao buscar caminho: {e}", file=sys.stderr)
             return 1
 
+    def cmd_streets(self, args) -> int:
+        try:
+            print("=" * 60)
+            print(f"CONEXÕES PELO LOGRADOURO: {args.street}")
+            print("=" * 60)
+
+            algorithms = Algorithms()
+            algorithms.load_graph_from_csv(ADJACENCIES_PATH)
+
+            edges = algorithms.streets.lookup(args.street, include_notes=args.notes)
+            if not edges:
+                print("\nNenhuma conexão encontrada para esse logradouro.")
+                print("=" * 60)
+                return 1
+
+            print(f"\n{len(edges)} conexão(ões) encontrada(s):")
+            for edge in edges:
+                print(f"  • {edge.origem} ↔ {edge.destino} (peso {edge.peso})")
+                print(f"    Logradouro: {edge.logradouro or 'N/A'}")
+                if edge.observacao:
+                    print(f"    Observação: {edge.observacao}")
+
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao consultar logradouro: {e}", file=sys.stderr)
+            return 1
+
+    def cmd_temporal(self, args) -> int:
+        try:
+            from datetime import datetime, timezone
+
+            def fmt(timestamp: int) -> str:
+                return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%d/%m/%Y")
+
+            print("=" * 60)
+            print(f"CAMINHOS TEMPORAIS ({args.mode.upper()}) - BITCOIN ALPHA")
+            print("=" * 60)
+
+            print("\nCarregando índice temporal...")
+            index = TemporalEdgeIndex.cached(BITCOIN_ALPHA_PATH, BITCOIN_TEMPORAL_CACHE_DIR)
+            engine = TemporalPaths(index, duration=args.duration)
+            first, last = index.time_range()
+            print(f"  ✓ {len(index)} arestas entre {fmt(first)} e {fmt(last)}")
+
+            if len(args.sources) > 1:
+                sources, arrival = engine.earliest_arrival_batch(args.sources, args.start, args.end)
+                target_id = index.node_ids.get(args.target) if args.target else None
+                print(f"\nChegada mais cedo para {len(sources)} origens:")
+                for row, source in enumerate(sources):
+                    reachable = int((arrival[row] < INFINITY).sum())
+                    line = f"  • {source}: {reachable} usuários alcançáveis"
+                    if target_id is not None:
+                        value = int(arrival[row, target_id])
+                        line += f", chega em {args.target}: {fmt(value) if value < INFINITY else 'inalcançável'}"
+                    print(line)
+
+            elif args.mode == "earliest":
+                source = args.sources[0]
+                arrival, parents = engine.earliest_arrival(source, args.start, args.end)
+                print(f"\nUsuários alcançáveis a partir de {source}: {len(arrival)}")
+                if args.target:
+                    if args.target not in arrival:
+                        print(f"Nenhum caminho temporal até {args.target}")
+                    else:
+                        print(f"Chegada mais cedo em {args.target}: {fmt(arrival[args.target])}")
+                        for previous, node, departure in engine.build_path(parents, source, args.target):
+                            print(f"  • {previous} → {node} em {fmt(departure)}")
+
+            elif args.mode == "latest":
+                if not args.target:
+                    print("❌ O modo 'latest' exige --target", file=sys.stderr)
+                    return 1
+                departure = engine.latest_departure(args.target, args.start, args.end)
+                source = args.sources[0]
+                print(f"\nUsuários que ainda alcançam {args.target}: {len(departure)}")
+                if source in departure:
+                    print(f"Partida mais tarde de {source}: {fmt(departure[source])}")
+                else:
+                    print(f"{source} não alcança {args.target} na janela")
+
+            else:
+                source = args.sources[0]
+                fastest = engine.fastest(source, args.start, args.end)
+                print(f"\nUsuários alcançáveis a partir de {source}: {len(fastest)}")
+                if args.target:
+                    if args.target not in fastest:
+                        print(f"Nenhum caminho temporal até {args.target}")
+                    else:
+                        departure, arrival_time = fastest[args.target]
+                        print(
+                            f"Caminho mais rápido até {args.target}: parte em {fmt(departure)}, "
+                            f"chega em {fmt(arrival_time)} ({arrival_time - departure} s)"
+                        )
+
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao calcular caminhos temporais: {e}", file=sys.stderr)
+            return 1
+
     def cmd_process(self, args) -> int:
         try:
             print("=" * 60)
@@ -201,6 +570,243 @@ Exemplos de uso:
             print(f"❌ Erro ao processar dados: {e}", file=sys.stderr)
             return 1
 
+    def cmd_reach(self, args) -> int:
+        try:
+            limit = f"custo ≤ {args.max_cost:g}" if args.max_cost is not None else f"{args.hops} salto(s)"
+            print("=" * 60)
+            print(f"ALCANCE A PARTIR DE {args.start} ({limit})")
+            print("=" * 60)
+
+            algorithms = Algorithms()
+            print("\nCarregando grafo...")
+            if args.bitcoin:
+                algorithms.load_graph_from_csv(BITCOIN_ALPHA_PATH)
+                graph = algorithms.weight_view("abs")
+                start = args.start
+                if start not in algorithms.graph:
+                    print(f"❌ Usuário não encontrado: {start}", file=sys.stderr)
+                    return 1
+            else:
+                algorithms.load_graph_from_csv(ADJACENCIES_PATH)
+                graph = algorithms.graph
+                resolved = self._resolve_names(algorithms, [args.start])
+                if resolved is None:
+                    return 1
+                start = resolved[0]
+
+            reached = algorithms.isochrone(start, args.max_cost, args.hops, graph)
+            print(f"\n{len(reached)} vértice(s) alcançado(s):")
+            for node, distance in reached.items():
+                print(f"  • {node}: {distance:g}")
+
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao calcular alcance: {e}", file=sys.stderr)
+            return 1
+
+    def cmd_apsp(self, args) -> int:
+        try:
+            print("=" * 60)
+            print("DISTÂNCIAS ENTRE TODOS OS PARES (JOHNSON)")
+            print("=" * 60)
+
+            algorithms = Algorithms()
+            print("\nCarregando grafo...")
+            algorithms.load_graph_from_csv(BITCOIN_ALPHA_PATH)
+            graph = algorithms.weight_view(args.transform, cache=True)
+
+            print("Calculando potenciais e executando Dijkstra por origem...\n")
+            report = algorithms.all_pairs_johnson(graph, output_dir=args.output, workers=args.workers)
+
+            print(f"Vértices: {report['vertices']}  Arestas: {report['arestas']}  Pesos: {report['visao']}")
+            reused = " (reutilizados)" if report["potenciais_reutilizados"] else ""
+            print(f"Potenciais: {report['tempo_potenciais_s']:.3f}s{reused}")
+
+            if report["ciclo_negativo"] is not None:
+                print("\n⚠ Ciclo negativo detectado: " + " -> ".join(report["ciclo_negativo"]))
+                print("  Caminhos mínimos entre todos os pares não estão definidos para estes pesos.")
+                print("=" * 60)
+                return 1
+
+            print(f"Dijkstra ({report['origens']} origens): {report['tempo_dijkstra_s']:.3f}s")
+            print(f"\n✓ Matriz salva em: {report['matriz']}")
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao calcular distâncias entre todos os pares: {e}", file=sys.stderr)
+            return 1
+
+    def cmd_labels(self, args) -> int:
+        directory = Path(LANDMARK_LABELS_DIR) / args.metric
+        try:
+            if args.action == "build":
+                print("=" * 60)
+                print(f"ÍNDICE DE RÓTULOS DE MARCOS ({args.metric})")
+                print("=" * 60)
+
+                algorithms = Algorithms()
+                print("\nCarregando grafo...")
+                algorithms.load_graph_from_csv(BITCOIN_ALPHA_PATH)
+
+                print("Construindo rótulos em ordem de grau...\n")
+                labels = algorithms.landmark_labels(args.metric)
+                labels.save(str(directory))
+
+                report = labels.report
+                print(f"Tempo de construção: {report['tempo_construcao_s']:.2f}s")
+                print(f"Entradas (saída/entrada): {report['entradas_saida']} / {report['entradas_entrada']}")
+                print(
+                    f"Rótulo médio (saída/entrada): {report['media_rotulo_saida']:.1f} / "
+                    f"{report['media_rotulo_entrada']:.1f}  Maior: {report['maior_rotulo']}"
+                )
+                print(f"Tamanho em disco: {report['bytes'] / 1024 / 1024:.2f} MB")
+                print(f"\n✓ Índice salvo em: {directory}")
+                print("=" * 60)
+                return 0
+
+            if len(args.nodes) != 2:
+                print("❌ Informe exatamente uma origem e um destino", file=sys.stderr)
+                return 1
+            meta_path = directory / "labels.json"
+            if not meta_path.exists() or meta_path.stat().st_mtime < Path(BITCOIN_ALPHA_PATH).stat().st_mtime:
+                print(
+                    f"❌ Índice ausente ou desatualizado. Execute: cli.py labels build --metric {args.metric}",
+                    file=sys.stderr,
+                )
+                return 1
+
+            labels = LandmarkLabels.load(str(directory))
+            source, target = args.nodes
+            for node in (source, target):
+                if node not in labels.node_ids:
+                    print(f"❌ Usuário não encontrado: {node}", file=sys.stderr)
+                    return 1
+
+            start_time = time.perf_counter()
+            distance, hub = labels.query(source, target)
+            elapsed = time.perf_counter() - start_time
+            if distance == float("inf"):
+                print(f"{source} -> {target}: sem caminho")
+            else:
+                print(f"{source} -> {target}: {distance:g} (marco {hub}, {elapsed * 1e6:.0f} µs)")
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro no índice de rótulos: {e}", file=sys.stderr)
+            return 1
+
+    def cmd_matrix(self, args) -> int:
+        try:
+            print("=" * 60)
+            print("MATRIZ DE DISTÂNCIAS ORIGEM-DESTINO")
+            print("=" * 60)
+
+            algorithms = Algorithms()
+            print("\nCarregando grafo...")
+            algorithms.load_graph_from_csv(ADJACENCIES_PATH)
+
+            sources = self._resolve_names(algorithms, args.sources or sorted(algorithms.graph))
+            targets = self._resolve_names(algorithms, args.targets or sorted(algorithms.graph))
+            pairs = self._resolve_names(algorithms, [name for pair in args.path for name in pair])
+            if sources is None or targets is None or pairs is None:
+                return 1
+
+            table = algorithms.distance_table(
+                sources, targets, strategy=args.strategy, paths=zip(pairs[::2], pairs[1::2])
+            )
+            print(f"\n{len(table.sources)} origem(ns) × {len(table.targets)} destino(s)")
+            print(f"Estratégia: {table.strategy}")
+            for (source, target), path in table.paths.items():
+                print(f"  • {source} → {target}: {path}")
+
+            output = table.save(args.output, args.format)
+            print(f"\n✓ Matriz salva em: {output}")
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao calcular matriz de distâncias: {e}", file=sys.stderr)
+            return 1
+
+    def cmd_criticality(self, args) -> int:
+        try:
+            print("=" * 60)
+            print("CRITICIDADE DAS CONEXÕES PARA AS ROTAS DE ENDEREÇOS")
+            print("=" * 60)
+
+            algorithms = Algorithms()
+            print("\nCarregando grafo...")
+            algorithms.load_graph_from_csv(ADJACENCIES_PATH)
+
+            print("Recalculando as árvores afetadas por cada fechamento...\n")
+            ranking = algorithms.edge_criticality(workers=args.workers)
+
+            print(f"\nTop {args.top} conexões mais críticas:")
+            for entry in ranking[: args.top]:
+                print(
+                    f"  • {entry['origem']} ↔ {entry['destino']} ({entry['logradouro'] or 'N/A'}): "
+                    f"+{entry['aumento_total']:g} de custo, {entry['rotas_desconectadas']} rota(s) desconectada(s)"
+                )
+
+            print(f"\n✓ Resultados salvos em: {CRITICIDADE_ARESTAS_PATH}")
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao calcular criticidade: {e}", file=sys.stderr)
+            return 1
+
+    def cmd_reweight(self, args) -> int:
+        try:
+            print("=" * 60)
+            print("ATUALIZAÇÃO DINÂMICA DE PESO")
+            print("=" * 60)
+
+            algorithms = Algorithms()
+            print("\nCarregando grafo...")
+            algorithms.load_graph_from_csv(ADJACENCIES_PATH)
+            names = self._resolve_names(algorithms, [args.first, args.second])
+            if names is None:
+                return 1
+            first, second = names
+
+            pairs = list(dict.fromkeys(algorithms.resolved_pairs()))
+            origins = list(dict.fromkeys(origin for origin, _ in pairs))
+            targets = list(dict.fromkeys(target for _, target in pairs))
+            print(f"Calculando árvores de caminhos mínimos de {len(origins)} origens...")
+            for origin in origins:
+                algorithms.cached_tree(origin)
+            table = algorithms.distance_table(origins, targets, strategy="forward")
+            before = table.distances.copy()
+
+            print(f"\nAlterando o peso de {first} ↔ {second} para {args.weight:g}:")
+            for report in algorithms.set_connection_weight(first, second, args.weight, tables=[table]):
+                logradouro = algorithms.edges.get(report["aresta"])["logradouro"] or "N/A"
+                print(
+                    f"  • {logradouro}: {report['peso_anterior']:g} → {report['peso']:g}, "
+                    f"{report['vertices_afetados']} vértice(s) afetado(s) em {report['arvores_atualizadas']} árvore(s), "
+                    f"{report['tempo_s'] * 1000:.2f} ms"
+                )
+
+            rows, columns = table.positions()
+            changed = [
+                (origin, target, before[rows[origin], columns[target]], table.distances[rows[origin], columns[target]])
+                for origin, target in pairs
+                if before[rows[origin], columns[target]] != table.distances[rows[origin], columns[target]]
+            ]
+            print(f"\n{len(changed)} de {len(pairs)} rota(s) de enderecos.csv mudaram de custo")
+            for origin, target, old_cost, new_cost in changed[: args.top]:
+                print(f"  • {origin} → {target}: {old_cost:g} → {new_cost:g}")
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print(f"❌ Erro ao atualizar peso: {e}", file=sys.stderr)
+            return 1
+
     def cmd_distances(self, args) -> int:
         try:
             print("=" * 60)
@@ -212,7 +818,7 @@ Exemplos de uso:
             algorithms.load_graph_from_csv(ADJACENCIES_PATH)
 
             print("Calculando distâncias...\n")
-            algorithms.compute_distances_batch()
+            algorithms.compute_distances_batch(workers=args.workers)
 
             print(f"\n✓ Resultados salvos em: {DISTANCIAS_ENDERECOS_PATH}")
             print("=" * 60)
@@ -582,8 +1188,16 @@ Exemplos de uso:
         command_map = {
             "analyze": self.cmd_analyze,
             "path": self.cmd_path,
+            "streets": self.cmd_streets,
+            "temporal": self.cmd_temporal,
             "process": self.cmd_process,
             "distances": self.cmd_distances,
+            "matrix": self.cmd_matrix,
+            "apsp": self.cmd_apsp,
+            "labels": self.cmd_labels,
+            "reach": self.cmd_reach,
+            "criticality": self.cmd_criticality,
+            "reweight": self.cmd_reweight,
             "visualize": self.cmd_visualize,
             "interactive": self.cmd_interactive,
             "plots": self.cmd_plots,
@@ -11,14 +11,22 @@ ADJACENCIES_PATH = str(DATA_DIR / "adjacencias_bairros.csv")
 ENDERECOS_PATH = str(DATA_DIR / "enderecos.csv")
 BAIRROS_RECIFE_PATH = str(DATA_DIR / "bairros_recife.csv")
 BAIRROS_UNIQUE_PATH = str(DATA_DIR / "bairros_unique.csv")
+BITCOIN_ALPHA_PATH = str(DATA_DIR / "bitcoin_alpha.csv")
+BITCOIN_TEMPORAL_CACHE_DIR = str(DATA_DIR / "cache" / "bitcoin_alpha_temporal")
+JOHNSON_APSP_DIR = str(DATA_DIR / "cache" / "bitcoin_alpha_johnson")
+LANDMARK_LABELS_DIR = str(DATA_DIR / "cache" / "bitcoin_alpha_labels")
 
 RECIFE_GLOBAL_PATH = str(PART1_DIR / "1.3 Métricas globais e por grupo" / "recife_global.json")
 MICRORREGIOES_PATH = str(PART1_DIR / "1.3 Métricas globais e por grupo" / "microrregioes.json")
+VORONOI_HUBS_PATH = str(PART1_DIR / "1.3 Métricas globais e por grupo" / "voronoi_hubs.json")
 EGO_BAIRRO_PATH = str(PART1_DIR / "1.3 Métricas globais e por grupo" / "ego_bairro.csv")
 
 GRAUS_PATH = str(PART1_DIR / "1.4 Graus e Rankings" / "graus.csv")
+CONECTIVIDADE_PATH = str(PART1_DIR / "1.4 Graus e Rankings" / "conectividade.json")
 
 DISTANCIAS_ENDERECOS_PATH = str(PART1_DIR / "1.6 Distância entre endereços X e Y" / "distancias_enderecos.csv")
+CRITICIDADE_ARESTAS_PATH = str(PART1_DIR / "1.6 Distância entre endereços X e Y" / "criticidade_arestas.csv")
+MATRIZ_DISTANCIAS_PATH = str(PART1_DIR / "1.6 Distância entre endereços X e Y" / "matriz_distancias.csv")
 PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH = str(
     PART1_DIR / "1.6 Distância entre endereços X e Y" / "percurso_nova_descoberta_setubal.json"
 )
@@ -1,81 +1,1397 @@
+import os
 import csv
 import json
+import math
 import heapq
+import time
 from pathlib import Path
-from collections import deque
-from typing import Dict, List, Tuple, Optional, Set
+from collections import OrderedDict, deque
+from itertools import chain, tee
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, Optional, Set
+
+import numpy as np
+
+from graphs.cache import VIEW_TYPES, ShortestPathCache, base_graph, chain_fingerprint, graph_fingerprint, view_name
+from graphs.components import Components
+from graphs.connectivity import biconnectivity
+from graphs.csr import CSRGraph
+from graphs.dag import dag_paths, insert_arc, topological_order
+from graphs.dynamic import INFINITY, update_tree
+from graphs.edges import EdgeStore, CostView
+from graphs.floyd import FLOYD_DENSITY_FACTOR, dense_weights, floyd_warshall, matrix_path
+from graphs.johnson import (
+    NegativeCycleError,
+    distance_rows,
+    johnson_potentials,
+    load_potentials,
+    open_matrix,
+    reweight,
+    save_potentials,
+)
+from graphs.labeling import LandmarkLabels
+from graphs.masks import MaskedView, SearchMask
+from graphs.matrix import DistanceTable
+from graphs.paths import (
+    DIAL_MAX_WEIGHT,
+    STRATEGIES,
+    ShortestPaths,
+    WeightStats,
+    bellman_ford_paths,
+    bfs_paths,
+    dial_paths,
+    weight_stats,
+)
+from graphs.reorder import reorder
+from graphs.streets import StreetIndex
+from graphs.temporal import TemporalEdgeIndex
+from graphs.weights import IDENTITY, WEIGHT_TRANSFORMS, UndirectedView, WeightedView, WeightTransform, get_transform
+from utils.normalize import NAME_ALIASES, normalize_name
+from utils.resolver import NameResolver
+from constants import (
+    ADJACENCIES_PATH,
+    ENDERECOS_PATH,
+    DISTANCIAS_ENDERECOS_PATH,
+    PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH,
+    CRITICIDADE_ARESTAS_PATH,
+    JOHNSON_APSP_DIR,
+)
+
+PARALLEL_MIN_ORIGINS = 64
+ROUTE_CHUNK_PAIRS = 4096
+ROUTE_CHUNKS_PER_WORKER = 2
+BATCH_PROGRESS_ROWS = 50_000
+FINGERPRINT_SLOTS = 8
+JOHNSON_CHUNK_ROWS = 64
+
+_route_worker: Optional["Algorithms"] = None
+_johnson_columns: Optional[Tuple[Dict[str, int], np.ndarray]] = None
+
+
+def _init_route_worker(
+    graph: Dict[str, List[Tuple[str, float]]], edge_ids: Optional[Dict[str, List[int]]] = None
+) -> None:
+    global _route_worker
+    _route_worker = Algorithms(graph)
+    if edge_ids is not None:
+        _route_worker.edge_ids = edge_ids
+        _route_worker.reverse_edge_ids = edge_ids
+
+
+def _init_johnson_worker(
+    graph: Dict[str, List[Tuple[str, float]]], nodes: List[str], potentials: np.ndarray
+) -> None:
+    global _johnson_columns
+    _init_route_worker(graph)
+    _johnson_columns = ({node: i for i, node in enumerate(nodes)}, potentials)
+
+
+def _johnson_chunk(sources: List[str]) -> np.ndarray:
+    index, potentials = _johnson_columns
+    return distance_rows(_route_worker.shortest_path_tree, sources, index, potentials)
+
+
+def _route_chunk(pairs: List[Tuple[Optional[str], Optional[str]]]) -> List[Optional[Tuple[float, str]]]:
+    return _route_worker.route_chunk(pairs)
+
+
+def _route_origin_without(edge_id: int, origin: str, targets: List[str]) -> Dict[str, float]:
+    return _route_worker.costs_without(edge_id, origin, targets)
 
-from constants import ADJACENCIES_PATH, ENDERECOS_PATH, DISTANCIAS_ENDERECOS_PATH, PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH
 
 class Algorithms:
 
     def __init__(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None):
         self.graph = graph or {}
+        self.resolver: Optional[NameResolver] = None
+        self.streets = StreetIndex()
+        self.edges = EdgeStore()
+        self.edge_heads: Dict[Tuple[str, str], int] = {}
+        self.edge_ids: Dict[str, List[int]] = {}
+        self.temporal: Optional[TemporalEdgeIndex] = None
+        self.directed = False
+        self.reverse_graph: Dict[str, List[Tuple[str, float]]] = self.graph
+        self.in_degrees: Dict[str, int] = {}
+        self.out_degrees: Dict[str, int] = {}
+        self.reverse_edge_ids: Dict[str, List[int]] = self.edge_ids
+        self.mask = SearchMask()
+        self.path_cache = ShortestPathCache()
+        self._fingerprints: "OrderedDict[int, Tuple[Mapping, Tuple[int, int], str]]" = OrderedDict()
+        self._components: Optional[Components] = None
+        self._acyclic: Optional[bool] = None
+        self._topological_order: Optional[List[str]] = None
+        self._topological_position: Dict[str, int] = {}
+        self._weight_stats: Dict[Tuple[str, str], WeightStats] = {}
+        self._negative_weights: Dict[str, Tuple[WeightTransform, int]] = {}
     
     def load_graph_from_csv(self, file_path: str) -> Dict[str, List[Tuple[str, float]]]:
         graph = {}
+        reverse_graph: Dict[str, List[Tuple[str, float]]] = {}
+        edge_ids: Dict[str, List[int]] = {}
+        reverse_edge_ids: Dict[str, List[int]] = {}
+        edges = EdgeStore()
+        heads: Dict[Tuple[str, str], int] = {}
+        streets = StreetIndex()
+        directed = 'bitcoin' in file_path
         with open(file_path, "r", encoding="utf-8") as file:
             reader = csv.reader(file)
             next(reader)
-            if 'bitcoin' in file_path:
+            if directed:
                 for row in reader:
                     if len(row) < 3:
                         continue
                     source, destination, weight = row[0], row[1], float(row[2])
+                    timestamp = int(row[3]) if len(row) > 3 and row[3].strip() else 0
                     if source not in graph:
                         graph[source] = []
+                        reverse_graph[source] = []
+                        edge_ids[source] = []
+                        reverse_edge_ids[source] = []
                     if destination not in graph:
                         graph[destination] = []
+                        reverse_graph[destination] = []
+                        edge_ids[destination] = []
+                        reverse_edge_ids[destination] = []
+                    edge_id = edges.add(
+                        source, destination, weight, timestamp=timestamp, next_parallel=heads.get((source, destination), -1)
+                    )
+                    heads[(source, destination)] = edge_id
                     graph[source].append((destination, weight))
+                    reverse_graph[destination].append((source, weight))
+                    edge_ids[source].append(edge_id)
+                    reverse_edge_ids[destination].append(edge_id)
             else:  
                 for row in reader:
                     if len(row) < 3:
                         continue
-                    source, destination, *_, weight = row
+                    source, destination, *details, weight = row
+                    source, destination = normalize_name(source), normalize_name(destination)
                     if weight.strip():
                         weight = float(weight)
+                        logradouro = details[0] if details else ""
+                        observacao = details[1] if len(details) > 1 else ""
                         if source not in graph:
                             graph[source] = []
+                            edge_ids[source] = []
                         if destination not in graph:
                             graph[destination] = []
+                            edge_ids[destination] = []
+                        pair = (source, destination) if source <= destination else (destination, source)
+                        edge_id = edges.add(
+                            source, destination, weight, logradouro, observacao, next_parallel=heads.get(pair, -1)
+                        )
+                        heads[pair] = edge_id
+                        streets.add(source, destination, logradouro, observacao, weight)
                         graph[source].append((destination, weight))
+                        edge_ids[source].append(edge_id)
                         graph[destination].append((source, weight))
+                        edge_ids[destination].append(edge_id)
         
         self.graph = graph
+        self.directed = directed
+        self.reverse_graph = reverse_graph if directed else graph
+        self.out_degrees = {node: len(neighbors) for node, neighbors in graph.items()}
+        self.in_degrees = {node: len(neighbors) for node, neighbors in self.reverse_graph.items()}
+        self.edge_ids = edge_ids
+        self.reverse_edge_ids = reverse_edge_ids if directed else edge_ids
+        self.edges = edges
+        self.edge_heads = heads
+        self.mask = SearchMask(len(edges), len(edges.nodes))
+        self._fingerprints.clear()
+        self._components = None
+        self._acyclic = None
+        self._topological_order = None
+        self._weight_stats = {}
+        self._negative_weights = {}
+        self.resolver = None
+        self.streets = streets
         return graph
 
-    def dijkstra(self, start: str, end: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> Tuple[float, str]:
+    def load_temporal_index(self, file_path: str) -> TemporalEdgeIndex:
+        self.temporal = TemporalEdgeIndex.from_csv(file_path)
+        return self.temporal
+
+    def predecessors(self, node: str) -> List[Tuple[str, float]]:
+        return self.reverse_graph.get(node, [])
+
+    def successors(self, node: str) -> List[Tuple[str, float]]:
+        return self.graph.get(node, [])
+
+    def degree_ranking(self, direction: str = "in", top: Optional[int] = None) -> List[Tuple[str, int]]:
+        if direction not in ("in", "out"):
+            raise ValueError("Direção deve ser 'in' ou 'out'")
+        degrees = self.in_degrees if direction == "in" else self.out_degrees
+        ranking = sorted(degrees.items(), key=lambda item: (-item[1], item[0]))
+        return ranking[:top] if top is not None else ranking
+
+    def landmark_labels(self, metric: str = "hops", transform="abs") -> LandmarkLabels:
+        order = sorted(
+            self.graph,
+            key=lambda node: (-(self.in_degrees.get(node, 0) + self.out_degrees.get(node, 0)), node),
+        )
+        if metric == "hops":
+            graph = self.search_graph()
+        else:
+            graph = self.search_graph(self.weight_view(transform, cache=True))
+            if self.weight_stats(graph).negative:
+                raise ValueError("Rótulos ponderados exigem pesos não negativos; use uma transformação como abs")
+        return LandmarkLabels.build(graph, self._reverse_of(graph), order, metric)
+
+    def backward_shortest_path_tree(self, target: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        return self.shortest_path_tree(target, self._reverse_of(self.search_graph()))
+
+    def search_graph(self, graph: Optional[Mapping] = None) -> Mapping:
+        graph = graph or self.graph
+        if not self.mask or isinstance(graph, MaskedView):
+            return graph
+
+        edge_ids = None
+        base = base_graph(graph)
+        if self.edge_ids and base is self.graph:
+            undirected, view = False, graph
+            while view is not base:
+                undirected = undirected or isinstance(view, UndirectedView)
+                view = view.graph
+            if undirected:
+                edge_ids = lambda node: self.edge_ids.get(node, []) + self.reverse_edge_ids.get(node, [])
+            else:
+                edge_ids = lambda node: self.edge_ids.get(node, ())
+        elif self.edge_ids and base is self.reverse_graph:
+            edge_ids = lambda node: self.reverse_edge_ids.get(node, ())
+        return MaskedView(graph, self.mask, self.edges.node_ids, edge_ids)
+
+    def _masked_adjacency(self) -> Tuple[Dict[str, List[Tuple[str, float]]], Dict[str, List[int]]]:
+        if not self.mask:
+            return self.graph, self.edge_ids
+
+        def blocked(node: str) -> bool:
+            node_id = self.edges.node_ids.get(node)
+            return node_id is not None and self.mask.node_blocked(node_id)
+
+        adjacency: Dict[str, List[Tuple[str, float]]] = {}
+        edge_ids: Dict[str, List[int]] = {}
+        for node, neighbors in self.graph.items():
+            adjacency[node], edge_ids[node] = [], []
+            if blocked(node):
+                continue
+            for (neighbor, weight), edge_id in zip(neighbors, self.edge_ids.get(node, ())):
+                if not self.mask.edge_blocked(edge_id) and not blocked(neighbor):
+                    adjacency[node].append((neighbor, weight))
+                    edge_ids[node].append(edge_id)
+        return adjacency, edge_ids
+
+    def _reverse_of(self, graph: Mapping) -> Mapping:
+        transforms, view = [], graph
+        while isinstance(view, VIEW_TYPES):
+            if isinstance(view, UndirectedView):
+                return graph
+            if isinstance(view, WeightedView):
+                transforms.append(view.transform)
+            view = view.graph
+        if view is not self.graph:
+            return self.reversed(graph)
+        if not self.directed:
+            return graph
+
+        reverse = self.reverse_graph
+        for transform in reversed(transforms):
+            reverse = WeightedView(reverse, transform)
+        return self.search_graph(reverse)
+
+    def block_edges(self, edge_ids: Iterable[int]) -> List[int]:
+        edge_ids = [edge_id for edge_id in edge_ids if not self.mask.edge_blocked(edge_id)]
+        self.mask.block_edges(edge_ids)
+        return edge_ids
+
+    def block_connection(self, first: str, second: str) -> List[int]:
+        return self.block_edges(edge_id for neighbor, edge_id in self.incident_edges(first) if neighbor == second)
+
+    def block_street(self, street: str, include_notes: bool = False) -> List[int]:
+        edges = self.streets.lookup(street, include_notes=include_notes)
+        if not edges:
+            raise ValueError(f"Logradouro não encontrado: {street}")
+        return self.block_edges(edge.edge_id for edge in edges)
+
+    def block_nodes(self, nodes: Iterable[str]) -> List[int]:
+        node_ids = [self.edges.node_id(node) for node in nodes if node in self.graph]
+        node_ids = [node_id for node_id in node_ids if not self.mask.node_blocked(node_id)]
+        self.mask.block_nodes(node_ids)
+        return node_ids
+
+    def clear_mask(self) -> None:
+        self.mask.clear()
+
+    @contextmanager
+    def masked(
+        self, edges: Iterable[int] = (), nodes: Iterable[str] = (), streets: Iterable[str] = ()
+    ) -> Iterator[SearchMask]:
+        edge_ids = self.block_edges(edges)
+        for street in streets:
+            edge_ids += self.block_street(street)
+        node_ids = self.block_nodes(nodes)
+        try:
+            yield self.mask
+        finally:
+            self.mask.unblock_edges(edge_ids)
+            self.mask.unblock_nodes(node_ids)
+
+    def undirected_view(self) -> Mapping:
+        if not self.directed:
+            return self.graph
+        return UndirectedView(self.graph, self.reverse_graph)
+
+    def biconnectivity(self) -> Dict:
+        graph = self.search_graph(self.undirected_view())
+
+        def incident(node: str):
+            seen: Dict[str, int] = {}
+            for neighbor, _ in graph[node]:
+                pair = (node, neighbor) if node <= neighbor else (neighbor, node)
+                if self.directed:
+                    yield neighbor, pair
+                else:
+                    occurrence = seen.get(neighbor, 0)
+                    seen[neighbor] = occurrence + 1
+                    yield neighbor, (pair, occurrence)
+
+        return biconnectivity(list(graph), incident)
+
+    def components(self) -> Components:
+        if self._components is None:
+            self._components = Components(self.graph, directed=self.directed)
+        return self._components
+
+    def _subgraph_of_loaded(self, graph: Mapping) -> bool:
+        while isinstance(graph, VIEW_TYPES):
+            if isinstance(graph, UndirectedView):
+                return False
+            graph = graph.graph
+        return graph is self.graph
+
+    def may_reach(self, start: str, end: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> bool:
+        if not self._subgraph_of_loaded(graph or self.graph):
+            return True
+        return self.components().may_reach(start, end)
+
+    def topological_order(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> Optional[List[str]]:
+        graph = graph or self.graph
+        if not self._subgraph_of_loaded(graph):
+            return topological_order(graph)
+        if self._acyclic is None:
+            self._topological_order = topological_order(self.graph)
+            self._acyclic = self._topological_order is not None
+            self._topological_position = {node: i for i, node in enumerate(self._topological_order or ())}
+        return self._topological_order
+
+    def path_strategy(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> str:
+        return "dag" if self.topological_order(graph) is not None else "dijkstra"
+
+    def dag_tree(
+        self,
+        start: str,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        longest: bool = False,
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        order = self.topological_order(graph)
+        if order is None:
+            raise ValueError("O grafo possui ciclos; caminhos em ordem topológica exigem um DAG")
+        return dag_paths(graph, order, start, longest=longest)
+
+    def weight_stats(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> WeightStats:
+        graph = graph or self.graph
+        while isinstance(graph, MaskedView):
+            graph = graph.graph
+        key = (self.fingerprint(graph), view_name(graph))
+        if key not in self._weight_stats:
+            self._weight_stats[key] = weight_stats(graph)
+        return self._weight_stats[key]
+
+    def choose_strategy(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> str:
+        stats = self.weight_stats(graph)
+        if stats.uniform and not stats.negative:
+            return "bfs"
+        if self.topological_order(graph) is not None:
+            return "dag"
+        if stats.negative:
+            return "bellman_ford"
+        if stats.integral and stats.maximum <= DIAL_MAX_WEIGHT:
+            return "dial"
+        return "dijkstra"
+
+    def shortest_paths(
+        self,
+        start: str,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        strategy: str = "auto",
+    ) -> ShortestPaths:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estratégia desconhecida: {strategy}. Opções: {', '.join(STRATEGIES)}")
+        graph = self.search_graph(graph)
+        stats = self.weight_stats(graph)
+        automatic = strategy == "auto"
+        if automatic:
+            strategy = self.choose_strategy(graph)
+
+        negative_cycle = False
+        if automatic and strategy in ("dag", "dijkstra"):
+            distances, parents = self.cached_tree(start, graph)
+        elif strategy == "bfs":
+            distances, parents = bfs_paths(graph, start, stats.maximum)
+        elif strategy == "dial":
+            distances, parents = dial_paths(graph, start, int(stats.maximum))
+        elif strategy == "dag":
+            distances, parents = self.dag_tree(start, graph)
+        elif strategy == "dijkstra":
+            distances, parents = self.shortest_path_tree(start, graph)
+        else:
+            distances, parents, negative_cycle = bellman_ford_paths(graph, start)
+
+        return ShortestPaths(start, distances, parents, strategy, negative_cycle, stats)
+
+    def longest_paths(
+        self, start: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        return self.dag_tree(start, graph, longest=True)
+
+    def weight_view(self, transform, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None, cache: bool = False) -> WeightedView:
         graph = graph or self.graph
+        return WeightedView(graph, get_transform(transform), cache=cache)
+
+    def parallel_edges(self, first: str, second: str) -> List[int]:
+        pair = (first, second) if self.directed or first <= second else (second, first)
+        return list(self.edges.parallel(self.edge_heads.get(pair, -1)))
+
+    def incident_edges(self, node: str):
+        return zip((neighbor for neighbor, _ in self.graph.get(node, [])), self.edge_ids.get(node, []))
+
+    def cost_view(self, column: str = "weight") -> CostView:
+        return CostView(self.graph, self.incident_edges, self.edges.column(column))
+
+    def get_resolver(self) -> NameResolver:
+        if self.resolver is None:
+            self.resolver = NameResolver(self.graph.keys(), aliases=NAME_ALIASES)
+        return self.resolver
+
+    def resolve_name(self, name: str, fuzzy: bool = True) -> Optional[str]:
+        return self.get_resolver().resolve(name, fuzzy=fuzzy)
+
+    def build_csr(
+        self,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        directed: bool = True,
+        ordering: str = "rcm",
+    ) -> CSRGraph:
+        graph = graph or self.graph
+        return reorder(CSRGraph.from_adjacency(graph, directed=directed), ordering)
+
+    @staticmethod
+    def _graph_signature(graph: Mapping) -> Tuple[int, int]:
+        return len(graph), sum(map(len, graph.values()))
+
+    def fingerprint(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> str:
+        base = base_graph(graph or self.graph)
+        signature = self._graph_signature(base)
+        entry = self._fingerprints.get(id(base))
+        if entry is None or entry[0] is not base or entry[1] != signature:
+            entry = (base, signature, graph_fingerprint(base))
+            self._fingerprints[id(base)] = entry
+            while len(self._fingerprints) > FINGERPRINT_SLOTS:
+                self._fingerprints.popitem(last=False)
+        else:
+            self._fingerprints.move_to_end(id(base))
+        return entry[2]
+
+    def graph_changed(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> None:
+        base = base_graph(graph or self.graph)
+        self._fingerprints.pop(id(base), None)
+        if base is self.graph or base is self.reverse_graph:
+            self._components = None
+            self._acyclic = None
+            self._topological_order = None
+            self._weight_stats = {}
+            self._negative_weights = {}
+
+    def cached_tree(
+        self, start: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        strategy = self.path_strategy(graph)
+        key = self.path_cache.key(self.fingerprint(graph), start, strategy, view_name(graph))
+        if strategy == "dag":
+            return self.path_cache.get_or_compute(key, lambda: self.dag_tree(start, graph))
+        return self.path_cache.get_or_compute(key, lambda: self.shortest_path_tree(start, graph))
+
+    def bounded_tree(
+        self, start: str, targets: Iterable[str], graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        strategy = self.path_strategy(graph)
+        if strategy != "dijkstra":
+            return self.cached_tree(start, graph)
+        tree = self.path_cache.get(self.path_cache.key(self.fingerprint(graph), start, strategy, view_name(graph)))
+        return tree if tree is not None else self.shortest_path_tree(start, graph, targets)
+
+    def hop_tree(
+        self, start: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        key = self.path_cache.key(self.fingerprint(graph), start, "bfs", view_name(graph))
+        return self.path_cache.get_or_compute(key, lambda: bfs_paths(graph, start))
+
+    def negative_weights(self, transform="identity") -> int:
+        transform = get_transform(transform)
+        if transform.name not in self._negative_weights:
+            weights = transform.vector(self.edges.as_numpy("weight"))
+            self._negative_weights[transform.name] = (transform, int(np.count_nonzero(weights < 0)))
+        return self._negative_weights[transform.name][1]
+
+    def _dynamic_view(self, name: str) -> Optional[Tuple[Mapping, Mapping, WeightTransform]]:
+        transform = WEIGHT_TRANSFORMS.get(name)
+        if transform is None or self.negative_weights(transform):
+            return None
+        if transform is IDENTITY:
+            return self.graph, self.reverse_graph, transform
+        return WeightedView(self.graph, transform), WeightedView(self.reverse_graph, transform), transform
+
+    def _count_weight(self, weight: Optional[float], sign: int) -> None:
+        if weight is None:
+            return
+        for name, (transform, count) in self._negative_weights.items():
+            self._negative_weights[name] = (transform, count + sign * (transform(weight) < 0))
+        self._weight_stats = {}
+
+    def _arc_slots(self, source: str, target: str) -> List[Tuple[Dict, Dict, str]]:
+        slots = [(self.graph, self.edge_ids, source)]
+        if self.directed:
+            slots.append((self.reverse_graph, self.reverse_edge_ids, target))
+        elif target != source:
+            slots.append((self.graph, self.edge_ids, target))
+        return slots
+
+    def _edge_pair(self, source: str, target: str) -> Tuple[str, str]:
+        return (source, target) if self.directed or source <= target else (target, source)
+
+    def _edge_endpoints(self, edge_id: int) -> Tuple[str, str, float]:
+        weight = self.edges.weight[edge_id]
+        if math.isnan(weight):
+            raise ValueError(f"Aresta removida: {edge_id}")
+        return self.edges.nodes[self.edges.source[edge_id]], self.edges.nodes[self.edges.target[edge_id]], weight
+
+    def _replace_weight(self, edge_id: int, source: str, target: str, weight: float) -> None:
+        for adjacency, edge_ids, node in self._arc_slots(source, target):
+            neighbors = adjacency[node]
+            for position, candidate in enumerate(edge_ids[node]):
+                if candidate == edge_id:
+                    neighbors[position] = (neighbors[position][0], weight)
+
+        self._count_weight(self.edges.weight[edge_id], -1)
+        self._count_weight(weight, 1)
+        self.edges.weight[edge_id] = weight
+        if edge_id < len(self.streets.edges):
+            self.streets.edges[edge_id].peso = weight
+
+    def _insert_edge(
+        self, source: str, target: str, weight: float, logradouro: str, observacao: str, timestamp: int
+    ) -> int:
+        added = [node for node in dict.fromkeys((source, target)) if node not in self.graph]
+        for node in added:
+            self.graph[node] = []
+            self.edge_ids[node] = []
+            self.out_degrees[node] = self.in_degrees[node] = 0
+            if self.directed:
+                self.reverse_graph[node] = []
+                self.reverse_edge_ids[node] = []
+        if added:
+            self.resolver = None
+
+        pair = self._edge_pair(source, target)
+        edge_id = self.edges.add(
+            source, target, weight, logradouro, observacao, timestamp, next_parallel=self.edge_heads.get(pair, -1)
+        )
+        self.edge_heads[pair] = edge_id
+        if not self.directed and len(self.streets) == edge_id:
+            self.streets.add(source, target, logradouro, observacao, weight)
+
+        self.graph[source].append((target, weight))
+        self.edge_ids[source].append(edge_id)
+        if self.directed:
+            self.reverse_graph[target].append((source, weight))
+            self.reverse_edge_ids[target].append(edge_id)
+        else:
+            self.graph[target].append((source, weight))
+            self.edge_ids[target].append(edge_id)
+        self._count_degrees(source, target, 1)
+        self._count_weight(weight, 1)
+
+        if self._components is not None:
+            self._components.add_edge(source, target)
+        if self._acyclic:
+            arcs = [(source, target)] if self.directed else [(source, target), (target, source)]
+            for arc_source, arc_target in arcs:
+                if not insert_arc(
+                    self._topological_order, self._topological_position, self.graph, self.reverse_graph, arc_source, arc_target
+                ):
+                    self._acyclic, self._topological_order, self._topological_position = False, None, {}
+                    break
+        return edge_id
+
+    def _delete_edge(self, edge_id: int, source: str, target: str) -> None:
+        for adjacency, edge_ids, node in self._arc_slots(source, target):
+            for _ in range(2 if node == source == target and not self.directed else 1):
+                position = edge_ids[node].index(edge_id)
+                del adjacency[node][position]
+                del edge_ids[node][position]
+
+        pair = self._edge_pair(source, target)
+        following = self.edges.next_parallel[edge_id]
+        if self.edge_heads.get(pair) == edge_id:
+            if following >= 0:
+                self.edge_heads[pair] = following
+            else:
+                del self.edge_heads[pair]
+        else:
+            for candidate in self.edges.parallel(self.edge_heads.get(pair, -1)):
+                if self.edges.next_parallel[candidate] == edge_id:
+                    self.edges.next_parallel[candidate] = following
+                    break
+        self.edges.next_parallel[edge_id] = -1
+
+        self._count_weight(self.edges.weight[edge_id], -1)
+        self.edges.weight[edge_id] = math.nan
+        if edge_id < len(self.streets.edges):
+            self.streets.remove(edge_id)
+        self._count_degrees(source, target, -1)
+
+        components = self._components
+        on_cycle = components is None or components.strong[source] == components.strong[target]
+        if components is not None:
+            components.remove_edge(source, target, self.reverse_graph)
+        if self._acyclic is False and (on_cycle if self.directed else not any(self.graph.values())):
+            self._acyclic, self._topological_order = None, None
+
+    def _count_degrees(self, source: str, target: str, sign: int) -> None:
+        nodes = [(self.out_degrees, source), (self.in_degrees, target)]
+        if not self.directed:
+            nodes += [(self.out_degrees, target), (self.in_degrees, source)]
+        for degrees, node in nodes:
+            degrees[node] = degrees.get(node, 0) + sign
+
+    def _edge_report(self, edge_id: int, source: str, target: str, previous: Optional[float], weight: Optional[float]) -> Dict:
+        return {
+            "aresta": edge_id,
+            "origem": source,
+            "destino": target,
+            "peso_anterior": previous,
+            "peso": weight,
+            "arvores_atualizadas": 0,
+            "arvores_descartadas": 0,
+            "vertices_afetados": 0,
+            "celulas_atualizadas": 0,
+            "linhas_recalculadas": 0,
+        }
+
+    def _apply_edge_change(
+        self,
+        report: Dict,
+        graph: Mapping,
+        tables: List[DistanceTable],
+        previous: Optional[float],
+        weight: Optional[float],
+        mutate,
+    ) -> Dict:
+        start_time = time.perf_counter()
+        if self._dynamic_view(view_name(graph)) is not None:
+            for table in tables:
+                for table_source in table.sources:
+                    self.cached_tree(table_source, graph)
+
+        entry = self._fingerprints.get(id(self.graph))
+        fingerprint = entry[2] if entry is not None and entry[0] is self.graph else None
+        edge_id = mutate()
+        source, target = report["origem"], report["destino"]
+        report["aresta"] = edge_id
+
+        changes: Dict[Tuple, Set[str]] = {}
+        if fingerprint is not None:
+            arcs = [(source, target)]
+            if not self.directed and source != target:
+                arcs.append((target, source))
+            reweight = previous is not None and weight is not None
+            strategy = self.path_strategy()
+            views = {}
+            for key, tree in self.path_cache.trees(fingerprint):
+                if key[2] == "bfs":
+                    if reweight:
+                        changes[key[1:]] = set()
+                    continue
+                if key[2] != strategy:
+                    continue
+                if key[3] not in views:
+                    views[key[3]] = self._dynamic_view(key[3])
+                if views[key[3]] is None:
+                    continue
+                forward, reverse, transform = views[key[3]]
+                before = INFINITY if previous is None else transform(previous)
+                after = INFINITY if weight is None else transform(weight)
+                changed: Set[str] = set()
+                for arc_source, arc_target in arcs:
+                    changed.update(update_tree(forward, reverse, tree, arc_source, arc_target, before, after))
+                changes[key[1:]] = changed
+                report["vertices_afetados"] += len(changed)
+
+            replacement = chain_fingerprint(fingerprint, (edge_id, previous, weight))
+            self._fingerprints[id(self.graph)] = (self.graph, self._graph_signature(self.graph), replacement)
+            patched = {(fingerprint,) + key for key in changes}
+            report["arvores_descartadas"] = self.path_cache.rekey(fingerprint, replacement, patched)
+            report["arvores_atualizadas"] = sum(key[1] != "bfs" for key in changes)
+
+        for table in tables:
+            self._patch_table(table, graph, changes, report)
+
+        report["tempo_s"] = time.perf_counter() - start_time
+        return report
+
+    def set_edge_weight(
+        self,
+        edge_id: int,
+        weight: float,
+        tables: Iterable[DistanceTable] = (),
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+    ) -> Dict:
+        source, target, previous = self._edge_endpoints(edge_id)
+        report = self._edge_report(edge_id, source, target, previous, weight)
+        if weight == previous:
+            report["tempo_s"] = 0.0
+            return report
+
+        def mutate() -> int:
+            self._replace_weight(edge_id, source, target, weight)
+            return edge_id
+
+        return self._apply_edge_change(report, self.search_graph(graph), list(tables), previous, weight, mutate)
+
+    def add_edge(
+        self,
+        source: str,
+        target: str,
+        weight: float,
+        tables: Iterable[DistanceTable] = (),
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        logradouro: str = "",
+        observacao: str = "",
+        timestamp: int = 0,
+    ) -> Dict:
+        report = self._edge_report(len(self.edges), source, target, None, weight)
+        return self._apply_edge_change(
+            report,
+            self.search_graph(graph),
+            list(tables),
+            None,
+            weight,
+            lambda: self._insert_edge(source, target, weight, logradouro, observacao, timestamp),
+        )
+
+    def remove_edge(
+        self,
+        edge_id: int,
+        tables: Iterable[DistanceTable] = (),
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+    ) -> Dict:
+        source, target, previous = self._edge_endpoints(edge_id)
+        report = self._edge_report(edge_id, source, target, previous, None)
+
+        def mutate() -> int:
+            self._delete_edge(edge_id, source, target)
+            return edge_id
+
+        return self._apply_edge_change(report, self.search_graph(graph), list(tables), previous, None, mutate)
+
+    def set_connection_weight(
+        self,
+        first: str,
+        second: str,
+        weight: float,
+        tables: Iterable[DistanceTable] = (),
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+    ) -> List[Dict]:
+        edge_ids = [edge_id for neighbor, edge_id in self.incident_edges(first) if neighbor == second]
+        if not edge_ids:
+            raise ValueError(f"Conexão não encontrada: {first} -> {second}")
+        tables = list(tables)
+        return [self.set_edge_weight(edge_id, weight, tables, graph) for edge_id in dict.fromkeys(edge_ids)]
+
+    def _patch_table(self, table: DistanceTable, graph: Mapping, changes: Dict[Tuple, Set[str]], report: Dict) -> None:
+        _, columns = table.positions()
+        fingerprint, strategy, name = self.fingerprint(graph), self.path_strategy(graph), view_name(graph)
+        touched: Dict[str, Iterable[str]] = {}
+
+        for source in table.sources:
+            changed = changes.get((source, strategy, name))
+            tree = None
+            if changed is not None:
+                tree = self.path_cache.get(self.path_cache.key(fingerprint, source, strategy, name))
+            if tree is None:
+                tree, changed = self.cached_tree(source, graph), columns
+                report["linhas_recalculadas"] += 1
+            touched[source] = changed
+            report["celulas_atualizadas"] += table.patch_row(source, *tree, changed)
+
+        for pair in list(table.paths):
+            source, target = pair
+            if target not in touched.get(source, ()):
+                continue
+            distances, parents = self.cached_tree(source, graph)
+            if target in distances:
+                table.paths[pair] = " -> ".join(self.build_path(parents, target))
+            else:
+                del table.paths[pair]
+
+    def dijkstra(self, start: str, end: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> Tuple[float, str]:
+        graph = self.search_graph(graph)
         if not graph:
             return float("inf"), "Grafo não carregado"
-        
-        priority_queue = [(0, start, [])]
-        visited = set()
+        if not self.may_reach(start, end, graph):
+            return float("inf"), "No path found"
+
+        distances, parents = self.bounded_tree(start, [end], graph)
+        if end not in distances:
+            return float("inf"), "No path found"
+        return distances[end], " -> ".join(self.build_path(parents, end))
+    
+    def shortest_path_tree(
+        self,
+        start: str,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        targets: Optional[Iterable[str]] = None,
+        max_cost: Optional[float] = None,
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        max_cost = float("inf") if max_cost is None else max_cost
+        distances: Dict[str, float] = {start: 0.0}
+        parents: Dict[str, Optional[str]] = {start: None}
+        settled = set()
+        remaining = set(targets) if targets is not None else None
+        priority_queue = [(0.0, start)]
+
+        while priority_queue:
+            current_weight, current_node = heapq.heappop(priority_queue)
+            if current_node in settled:
+                continue
+            settled.add(current_node)
+            if remaining is not None:
+                remaining.discard(current_node)
+                if not remaining:
+                    break
+
+            for neighbor, weight in graph.get(current_node, []):
+                candidate = current_weight + weight
+                if candidate > max_cost:
+                    continue
+                if neighbor not in settled and candidate < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = current_node
+                    heapq.heappush(priority_queue, (candidate, neighbor))
+
+        return distances, parents
+
+    def multi_source_dijkstra(
+        self, sources: Iterable[str], graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, str], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        distances: Dict[str, float] = {}
+        nearest: Dict[str, str] = {}
+        parents: Dict[str, Optional[str]] = {}
+        for source in sources:
+            if source in graph and source not in distances:
+                distances[source] = 0.0
+                nearest[source] = source
+                parents[source] = None
+        settled = set()
+        priority_queue = [(0.0, source) for source in distances]
+        heapq.heapify(priority_queue)
 
         while priority_queue:
-            current_weight, current_node, path = heapq.heappop(priority_queue)
+            current_weight, current_node = heapq.heappop(priority_queue)
+            if current_node in settled:
+                continue
+            settled.add(current_node)
 
-            if current_node in visited:
+            for neighbor, weight in graph.get(current_node, []):
+                candidate = current_weight + weight
+                if neighbor not in settled and candidate < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = candidate
+                    nearest[neighbor] = nearest[current_node]
+                    parents[neighbor] = current_node
+                    heapq.heappush(priority_queue, (candidate, neighbor))
+
+        return distances, nearest, parents
+
+    def voronoi_cells(
+        self, sources: Iterable[str], graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Dict:
+        graph = self.search_graph(graph)
+        sources = list(dict.fromkeys(sources))
+        distances, nearest, _ = self.multi_source_dijkstra(sources, graph)
+
+        cells = {
+            source: {"centro": source, "bairros": [], "tamanho": 0, "raio": 0.0, "arestas_fronteira": 0}
+            for source in sources
+            if source in nearest
+        }
+        for node, hub in nearest.items():
+            cell = cells[hub]
+            cell["bairros"].append(node)
+            cell["tamanho"] += 1
+            cell["raio"] = max(cell["raio"], distances[node])
+
+        boundary = []
+        seen = set()
+        for node, neighbors in graph.items():
+            if node not in nearest:
                 continue
+            for neighbor, weight in neighbors:
+                if neighbor not in nearest or nearest[neighbor] == nearest[node]:
+                    continue
+                pair = (node, neighbor) if self.directed else tuple(sorted((node, neighbor)))
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                boundary.append(
+                    {
+                        "origem": pair[0],
+                        "destino": pair[1],
+                        "celula_origem": nearest[pair[0]],
+                        "celula_destino": nearest[pair[1]],
+                        "peso": weight,
+                    }
+                )
+                cells[nearest[pair[0]]]["arestas_fronteira"] += 1
+                cells[nearest[pair[1]]]["arestas_fronteira"] += 1
+
+        for cell in cells.values():
+            cell["bairros"].sort()
+
+        return {
+            "centros": [source for source in sources if source in cells],
+            "celulas": list(cells.values()),
+            "fronteira": boundary,
+            "nao_alcancados": sorted(node for node in graph if node not in nearest),
+        }
+
+    def bounded_bfs(
+        self, start: str, max_hops: int, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Tuple[Dict[str, int], Dict[str, Optional[str]]]:
+        graph = self.search_graph(graph)
+        hops: Dict[str, int] = {start: 0}
+        parents: Dict[str, Optional[str]] = {start: None}
+        frontier = [start]
+
+        for depth in range(1, max_hops + 1):
+            next_frontier = []
+            for node in frontier:
+                for neighbor, _ in graph.get(node, []):
+                    if neighbor not in hops:
+                        hops[neighbor] = depth
+                        parents[neighbor] = node
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return hops, parents
+
+    def isochrone(
+        self,
+        start: str,
+        max_cost: Optional[float] = None,
+        max_hops: Optional[int] = None,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+    ) -> Dict[str, float]:
+        if (max_cost is None) == (max_hops is None):
+            raise ValueError("Informe exatamente um limite: custo máximo ou número de saltos")
+        graph = self.search_graph(graph)
+        if start not in graph:
+            return {}
+        if max_hops is not None:
+            reached, _ = self.bounded_bfs(start, max_hops, graph)
+        else:
+            reached, _ = self.shortest_path_tree(start, graph, max_cost=max_cost)
+        return dict(sorted(reached.items(), key=lambda item: (item[1], item[0])))
+
+    def ego_network(
+        self,
+        node: str,
+        hops: int = 1,
+        max_cost: Optional[float] = None,
+        both_directions: bool = False,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        graph = graph or self.graph
+        if node not in graph:
+            return {}
+
+        search = self.search_graph(self.undirected_view() if both_directions and graph is self.graph else graph)
+        graph = self.search_graph(graph)
+        if max_cost is not None:
+            ball = self.shortest_path_tree(node, search, max_cost=max_cost)[0]
+        else:
+            ball = self.bounded_bfs(node, hops, search)[0]
+
+        return {
+            current: [(neighbor, weight) for neighbor, weight in graph[current] if neighbor in ball]
+            for current in ball
+        }
+
+    def route_targets(
+        self, start: str, targets: Iterable[str], graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> Dict[str, Tuple[float, str]]:
+        graph = self.search_graph(graph)
+        targets = list(dict.fromkeys(targets))
+        distances, parents = self.bounded_tree(start, targets, graph)
+
+        routes = {}
+        for target in targets:
+            if target in distances:
+                routes[target] = (distances[target], " -> ".join(self.build_path(parents, target)))
+            else:
+                routes[target] = (float("inf"), "No path found")
+        return routes
+
+    def route_chunk(
+        self,
+        pairs: List[Tuple[Optional[str], Optional[str]]],
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+    ) -> List[Optional[Tuple[float, str]]]:
+        graph = self.search_graph(graph)
+        targets_by_origin: Dict[str, Dict[str, None]] = {}
+        for origin, target in pairs:
+            if origin is not None and target is not None:
+                targets_by_origin.setdefault(origin, {})[target] = None
+
+        routes = {origin: self.route_targets(origin, targets, graph) for origin, targets in targets_by_origin.items()}
+        return [
+            routes[origin][target] if origin is not None and target is not None else None
+            for origin, target in pairs
+        ]
+
+    def route_pairs(
+        self,
+        pairs: Iterable[Tuple[Optional[str], Optional[str]]],
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        workers: Optional[int] = None,
+    ) -> Iterator[Optional[Tuple[float, str]]]:
+        graph = self.search_graph(graph)
+        pairs = iter(pairs)
+        chunks = iter(lambda: [pair for _, pair in zip(range(ROUTE_CHUNK_PAIRS), pairs)], [])
+        head = list(zip(range(2), chunks))
+        chunks = chain((chunk for _, chunk in head), chunks)
+
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        single = len(head) < 2 and len({origin for _, chunk in head for origin, _ in chunk}) < PARALLEL_MIN_ORIGINS
+        if workers <= 1 or single:
+            for chunk in chunks:
+                yield from self.route_chunk(chunk, graph)
+            return
+
+        adjacency = {node: list(graph[node]) for node in graph}
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_route_worker, initargs=(adjacency,)
+        ) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_route_chunk, chunk))
+                while pending and (pending[0].done() or len(pending) >= workers * ROUTE_CHUNKS_PER_WORKER):
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def distance_table(
+        self,
+        sources: Iterable[str],
+        targets: Iterable[str],
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        strategy: str = "auto",
+        paths: Iterable[Tuple[str, str]] = (),
+    ) -> DistanceTable:
+        graph = self.search_graph(graph)
+        sources = list(dict.fromkeys(sources))
+        targets = list(dict.fromkeys(targets))
+        wanted = [(source, target) for source, target in paths]
+
+        if strategy == "auto":
+            if self.prefers_floyd(graph, min(len(sources), len(targets))):
+                strategy = "floyd"
+            else:
+                strategy = "reverse" if len(targets) < len(sources) else "forward"
+        if strategy not in ("forward", "reverse", "floyd"):
+            raise ValueError("Estratégia deve ser 'auto', 'forward', 'reverse' ou 'floyd'")
+
+        distances = np.full((len(sources), len(targets)), np.inf)
+        found: Dict[Tuple[str, str], str] = {}
+
+        if strategy == "floyd":
+            nodes = list(graph)
+            index = {node: i for i, node in enumerate(nodes)}
+            dist, pred = floyd_warshall(dense_weights(graph, nodes))
+            rows = [index.get(source) for source in sources]
+            columns = [index.get(target) for target in targets]
+            for i, row in enumerate(rows):
+                if row is not None:
+                    distances[i] = [dist[row, column] if column is not None else np.inf for column in columns]
+            for source, target in wanted:
+                if source in index and target in index and np.isfinite(dist[index[source], index[target]]):
+                    path = matrix_path(pred, index[source], index[target])
+                    found[(source, target)] = " -> ".join(nodes[node] for node in path)
+        elif strategy == "forward":
+            for i, source in enumerate(sources):
+                reached, parents = self.bounded_tree(source, targets, graph)
+                distances[i] = [reached.get(target, np.inf) for target in targets]
+                for pair in wanted:
+                    if pair[0] == source and pair[1] in reached:
+                        found[pair] = " -> ".join(self.build_path(parents, pair[1]))
+        else:
+            reverse = self._reverse_of(graph)
+            order = self.topological_order(graph)
+            for j, target in enumerate(targets):
+                if order is not None:
+                    reached, parents = dag_paths(reverse, order[::-1], target)
+                else:
+                    reached, parents = self.shortest_path_tree(target, reverse, sources)
+                distances[:, j] = [reached.get(source, np.inf) for source in sources]
+                for pair in wanted:
+                    if pair[1] == target and pair[0] in reached:
+                        found[pair] = " -> ".join(self.build_path(parents, pair[0])[::-1])
+
+        return DistanceTable(sources, targets, distances, strategy, found)
+
+    def prefers_floyd(self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None, searches: Optional[int] = None) -> bool:
+        graph = graph or self.graph
+        nodes = len(graph)
+        searches = nodes if searches is None else searches
+        edges = max(self.weight_stats(graph).edges, 1)
+        return nodes ** 3 <= FLOYD_DENSITY_FACTOR * searches * edges * math.log2(max(nodes, 2))
+
+    def all_pairs_shortest_paths(
+        self, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None, strategy: str = "auto"
+    ) -> DistanceTable:
+        graph = self.search_graph(graph)
+        nodes = list(graph)
+        if strategy == "auto":
+            strategy = "floyd" if self.prefers_floyd(graph) else "forward"
+        if strategy != "floyd":
+            return self.distance_table(nodes, nodes, graph, strategy)
+        dist, pred = floyd_warshall(dense_weights(graph, nodes))
+        return DistanceTable(nodes, nodes, dist, "floyd", predecessors=pred)
+
+    def all_pairs_johnson(
+        self,
+        graph: Optional[Dict[str, List[Tuple[str, float]]]] = None,
+        output_dir: str = JOHNSON_APSP_DIR,
+        sources: Optional[Iterable[str]] = None,
+        workers: Optional[int] = None,
+        chunk_rows: int = JOHNSON_CHUNK_ROWS,
+    ) -> Dict:
+        graph = self.search_graph(graph)
+        nodes = list(graph)
+        sources = nodes if sources is None else list(dict.fromkeys(sources))
+        report = {
+            "vertices": len(nodes),
+            "arestas": sum(len(graph[node]) for node in nodes),
+            "origens": len(sources),
+            "visao": view_name(graph),
+            "potenciais_reutilizados": False,
+            "ciclo_negativo": None,
+            "matriz": None,
+        }
 
-            path = path + [current_node]
-            visited.add(current_node)
+        start_time = time.perf_counter()
+        key = f"{self.fingerprint(graph)}:{view_name(graph)}"
+        potentials = load_potentials(output_dir, key)
+        if potentials is not None and potentials.keys() == set(nodes):
+            report["potenciais_reutilizados"] = True
+        else:
+            try:
+                potentials = johnson_potentials(graph)
+            except NegativeCycleError as error:
+                report["ciclo_negativo"] = error.cycle
+                report["tempo_potenciais_s"] = time.perf_counter() - start_time
+                return report
+            save_potentials(output_dir, nodes, potentials, key)
+        report["tempo_potenciais_s"] = time.perf_counter() - start_time
 
+        start_time = time.perf_counter()
+        reweighted = reweight(graph, potentials)
+        column_potentials = np.array([potentials[node] for node in nodes], dtype=np.float64)
+        index = {node: i for i, node in enumerate(nodes)}
+        matrix = open_matrix(output_dir, sources, nodes)
+        chunks = [sources[i : i + chunk_rows] for i in range(0, len(sources), chunk_rows)]
+
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers <= 1 or len(sources) < PARALLEL_MIN_ORIGINS:
+            search = lambda source: self.shortest_path_tree(source, reweighted)
+            for number, chunk in enumerate(chunks):
+                row = number * chunk_rows
+                matrix[row : row + len(chunk)] = distance_rows(search, chunk, index, column_potentials)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_johnson_worker,
+                initargs=(reweighted, nodes, column_potentials),
+            ) as executor:
+                for number, rows in enumerate(executor.map(_johnson_chunk, chunks)):
+                    row = number * chunk_rows
+                    matrix[row : row + len(rows)] = rows
+        matrix.flush()
+        del matrix
+
+        report["tempo_dijkstra_s"] = time.perf_counter() - start_time
+        report["matriz"] = str(Path(output_dir) / "distances.npy")
+        return report
+
+    @staticmethod
+    def reversed(graph) -> Dict[str, List[Tuple[str, float]]]:
+        reverse: Dict[str, List[Tuple[str, float]]] = {node: [] for node in graph}
+        for node in graph:
+            for neighbor, weight in graph[node]:
+                reverse.setdefault(neighbor, []).append((node, weight))
+        return reverse
+
+    def k_shortest_paths(
+        self, start: str, end: str, k: int, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None
+    ) -> List[Tuple[float, List[str]]]:
+        graph = self.search_graph(graph)
+        if k <= 0 or start not in graph or end not in graph:
+            return []
+
+        reverse = self._reverse_of(graph)
+        to_end, _ = self.shortest_path_tree(end, reverse)
+        if start not in to_end:
+            return []
+
+        first = self._spur_search(start, end, graph, to_end, set(), set())
+        accepted: List[Tuple[float, List[str], List[float]]] = [first]
+        deviations = [0]
+        candidates: List[Tuple[float, List[str], List[float], int]] = []
+        seen = {tuple(first[1])}
+
+        while len(accepted) < k:
+            _, path, prefix = accepted[-1]
+            for i in range(deviations[-1], len(path) - 1):
+                spur_node = path[i]
+                root = path[: i + 1]
+                blocked_edges = {
+                    other[i + 1] for _, other, _ in accepted if len(other) > i + 1 and other[: i + 1] == root
+                }
+                spur = self._spur_search(spur_node, end, graph, to_end, set(root[:-1]), blocked_edges)
+                if spur is None:
+                    continue
+                spur_cost, spur_path, spur_prefix = spur
+                candidate = root[:-1] + spur_path
+                key = tuple(candidate)
+                if key in seen:
+                    continue
+                seen.add(key)
+                candidate_prefix = prefix[:i] + [prefix[i] + cost for cost in spur_prefix]
+                heapq.heappush(candidates, (prefix[i] + spur_cost, candidate, candidate_prefix, i))
+
+            if not candidates:
+                break
+            cost, path, prefix, deviation = heapq.heappop(candidates)
+            accepted.append((cost, path, prefix))
+            deviations.append(deviation)
+
+        return [(cost, path) for cost, path, _ in accepted]
+
+    @staticmethod
+    def _spur_search(
+        start: str,
+        end: str,
+        graph,
+        to_end: Dict[str, float],
+        blocked_nodes: Set[str],
+        blocked_edges: Set[str],
+    ) -> Optional[Tuple[float, List[str], List[float]]]:
+        if start not in to_end:
+            return None
+        distances: Dict[str, float] = {start: 0.0}
+        parents: Dict[str, Optional[str]] = {start: None}
+        settled = set()
+        priority_queue = [(to_end[start], start)]
+
+        while priority_queue:
+            _, current_node = heapq.heappop(priority_queue)
+            if current_node in settled:
+                continue
             if current_node == end:
-                return current_weight, " -> ".join(path)
+                path = [end]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return distances[end], path, [distances[node] for node in path]
+            settled.add(current_node)
 
+            current_weight = distances[current_node]
             for neighbor, weight in graph.get(current_node, []):
-                if neighbor not in visited:
-                    heapq.heappush(
-                        priority_queue, (current_weight + weight, neighbor, path) # type: ignore
-                    )
+                if neighbor in blocked_nodes or neighbor in settled or neighbor not in to_end:
+                    continue
+                if current_node == start and neighbor in blocked_edges:
+                    continue
+                candidate = current_weight + weight
+                if candidate < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = current_node
+                    heapq.heappush(priority_queue, (candidate + to_end[neighbor], neighbor))
+
+        return None
+
+    @staticmethod
+    def build_path(parents: Dict[str, Optional[str]], end: str) -> List[str]:
+        if end not in parents:
+            return []
+        path = []
+        node: Optional[str] = end
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        return path[::-1]
+
+    def path_streets(self, path, via: Optional[str] = None) -> List[Dict]:
+        if isinstance(path, str):
+            path = [node.strip() for node in path.split("->")]
+        preferred = [edge.edge_id for edge in self.streets.lookup(via)] if via else []
+        return self.streets.path_streets(path, self.mask.edge_blocked, preferred)
+
+    def route_via_street(self, start: str, end: str, street: str) -> Tuple[float, str]:
+        edges = self.streets.lookup(street)
+        if not edges:
+            return float("inf"), f"Logradouro não encontrado: {street}"
+
+        from_start, start_parents = self.cached_tree(start)
+        from_end, end_parents = self.cached_tree(end)
+
+        best_cost, best_hop = float("inf"), None
+        for edge in edges:
+            if self.mask.edge_blocked(edge.edge_id):
+                continue
+            for first, second in ((edge.origem, edge.destino), (edge.destino, edge.origem)):
+                cost = from_start.get(first, float("inf")) + edge.peso + from_end.get(second, float("inf"))
+                if cost < best_cost:
+                    best_cost, best_hop = cost, (first, second)
+
+        if best_hop is None:
+            return float("inf"), "No path found"
+
+        first, second = best_hop
+        path = self.build_path(start_parents, first) + self.build_path(end_parents, second)[::-1]
+        return best_cost, " -> ".join(path)
 
-        return float("inf"), "No path found"
-    
     def bfs(self,
         start: str, graph: Dict[str, List[Tuple[str, float]]]
     ) -> Tuple[Dict[str, int], List[Set[str]]]:
 
+        graph = self.search_graph(graph)
         if start not in graph:
             return {}, []
 
@@ -115,6 +1431,7 @@ class Algorithms:
         start: str, graph: Dict[str, List[Tuple[str, float]]]
     ) -> Tuple[List[str], List[Tuple[str, str]], bool]:
 
+        graph = self.search_graph(graph)
         if start not in graph:
             return [], [], False
 
@@ -143,8 +1460,11 @@ class Algorithms:
 
     
     def bellman_ford(self, start: str, graph: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> Dict[str, float]:
-        graph = graph or self.graph
+        graph = self.search_graph(graph)
         distances = {node: float("inf") for node in graph}
+        if self.topological_order(graph) is not None:
+            distances.update(self.dag_tree(start, graph)[0])
+            return distances
         distances[start] = 0.0
         
         num_nodes = len(graph)
@@ -163,39 +1483,177 @@ class Algorithms:
         return distances
     
     
-    def compute_distances_batch(self, addresses_path: str = ENDERECOS_PATH, output_path: str = DISTANCIAS_ENDERECOS_PATH) -> None:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        
+    def read_address_pairs(
+        self, addresses_path: str = ENDERECOS_PATH
+    ) -> Iterator[Tuple[List[str], Optional[str], Optional[str]]]:
+        resolved: Dict[str, Optional[str]] = {}
         with open(addresses_path, "r", encoding="utf-8") as file:
             reader = csv.reader(file)
-            next(reader)  
+            next(reader)
+            for row in reader:
+                if not row:
+                    continue
+                for name in row[2:4]:
+                    if name not in resolved:
+                        resolved[name] = self.resolve_name(name, fuzzy=False)
+                yield row, resolved[row[2]], resolved[row[3]]
+
+    def resolved_pairs(self, addresses_path: str = ENDERECOS_PATH) -> List[Tuple[str, str]]:
+        return [
+            (origin, target)
+            for _, origin, target in self.read_address_pairs(addresses_path)
+            if origin is not None and target is not None
+        ]
+
+    def tree_edge_ids(self, distances: Dict[str, float], parents: Dict[str, Optional[str]], end: str) -> List[int]:
+        edge_ids = []
+        node = end
+        while parents.get(node) is not None:
+            parent = parents[node]
+            for (neighbor, weight), edge_id in zip(self.graph[parent], self.edge_ids[parent]):
+                if neighbor == node and distances[parent] + weight == distances[node]:
+                    edge_ids.append(edge_id)
+                    break
+            node = parent
+        return edge_ids[::-1]
+
+    def costs_without(self, edge_id: int, origin: str, targets: List[str]) -> Dict[str, float]:
+        with self.masked(edges=[edge_id]):
+            distances, _ = self.shortest_path_tree(origin, targets=targets)
+        return {target: distances.get(target, float("inf")) for target in targets}
+
+    def edge_criticality(
+        self,
+        addresses_path: str = ENDERECOS_PATH,
+        output_path: str = CRITICIDADE_ARESTAS_PATH,
+        workers: Optional[int] = None,
+    ) -> List[Dict]:
+        pairs = self.resolved_pairs(addresses_path)
+        demand: Dict[Tuple[str, str], int] = {}
+        for pair in pairs:
+            demand[pair] = demand.get(pair, 0) + 1
+
+        targets_by_origin: Dict[str, List[str]] = {}
+        for origin, target in demand:
+            targets_by_origin.setdefault(origin, []).append(target)
+
+        baseline: Dict[Tuple[str, str], float] = {}
+        origins_by_edge: Dict[int, Dict[str, None]] = {}
+        for origin, targets in targets_by_origin.items():
+            distances, parents = self.shortest_path_tree(origin, self.graph, targets)
+            for target in targets:
+                baseline[(origin, target)] = distances.get(target, float("inf"))
+                for edge_id in self.tree_edge_ids(distances, parents, target):
+                    origins_by_edge.setdefault(edge_id, {})[origin] = None
+
+        tasks = [(edge_id, origin) for edge_id, origins in origins_by_edge.items() for origin in origins]
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers <= 1 or len(tasks) < PARALLEL_MIN_ORIGINS:
+            results = [self.costs_without(edge_id, origin, targets_by_origin[origin]) for edge_id, origin in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_route_worker, initargs=self._masked_adjacency()
+            ) as executor:
+                futures = [
+                    executor.submit(_route_origin_without, edge_id, origin, targets_by_origin[origin])
+                    for edge_id, origin in tasks
+                ]
+                results = [future.result() for future in futures]
+
+        ranking: Dict[int, Dict] = {}
+        for (edge_id, origin), costs in zip(tasks, results):
+            edge = self.edges.get(edge_id)
+            entry = ranking.setdefault(
+                edge_id,
+                {
+                    "aresta": edge_id,
+                    "origem": edge["origem"],
+                    "destino": edge["destino"],
+                    "logradouro": edge["logradouro"],
+                    "peso": edge["weight"],
+                    "rotas_afetadas": 0,
+                    "rotas_desconectadas": 0,
+                    "aumento_total": 0.0,
+                    "aumento_maximo": 0.0,
+                },
+            )
+            for target, cost in costs.items():
+                before = baseline[(origin, target)]
+                if before == float("inf"):
+                    continue
+                routes = demand[(origin, target)]
+                if cost == float("inf"):
+                    entry["rotas_desconectadas"] += routes
+                elif cost > before:
+                    entry["rotas_afetadas"] += routes
+                    entry["aumento_total"] += (cost - before) * routes
+                    entry["aumento_maximo"] = max(entry["aumento_maximo"], cost - before)
+
+        ranked = sorted(
+            ranking.values(),
+            key=lambda entry: (-entry["rotas_desconectadas"], -entry["aumento_total"], entry["aresta"]),
+        )
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            fieldnames = [
+                "aresta", "origem", "destino", "logradouro", "peso",
+                "rotas_afetadas", "rotas_desconectadas", "aumento_total", "aumento_maximo",
+            ]
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(ranked)
+
+        print(f"✓ {len(ranked)} conexões em caminhos mínimos analisadas ({len(tasks)} árvores recalculadas)")
+        print(f"✓ Criticidade das conexões salva em {output_path}")
+        return ranked
+
+    def compute_distances_batch(
+        self,
+        addresses_path: str = ENDERECOS_PATH,
+        output_path: str = DISTANCIAS_ENDERECOS_PATH,
+        workers: Optional[int] = None,
+    ) -> None:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        records, pairs = tee(self.read_address_pairs(addresses_path))
+        routes = self.route_pairs(((origin, target) for _, origin, target in pairs), workers=workers)
+        distinct: Set[Tuple[str, str]] = set()
+
+        with open(output_path, "w", newline='', encoding="utf-8") as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(["X", "Y", "bairro_X", "bairro_Y", "custo", "caminho"])
             
-            with open(output_path, "w", newline='', encoding="utf-8") as outfile:
-                writer = csv.writer(outfile)
-                writer.writerow(["X", "Y", "bairro_X", "bairro_Y", "custo", "caminho"])
+            count = routed = 0
+            for (row, resolved_x, resolved_y), route in zip(records, routes):
+                x, y, bairro_x, bairro_y = row[:4]
+                if route is None:
+                    missing = bairro_x if resolved_x is None else bairro_y
+                    weight, path = float("inf"), f"Bairro não encontrado: {missing}"
+                else:
+                    bairro_x, bairro_y = resolved_x, resolved_y
+                    weight, path = route
+                    distinct.add((bairro_x, bairro_y))
+                    routed += 1
+                writer.writerow([x, y, bairro_x, bairro_y, weight, path])
+                count += 1
+
+                if bairro_x == "Nova Descoberta" and bairro_y == "Boa Viagem (Setúbal)":
+                    Path(PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH).parent.mkdir(parents=True, exist_ok=True)
+                    with open(PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH, "w", encoding="utf-8") as f:
+                        json.dump({
+                            "origem": bairro_x,
+                            "destino": bairro_y,
+                            "custo": weight,
+                            "caminho": path
+                        }, f, indent=2, ensure_ascii=False)
+                    print(f"✓ Caminho Nova Descoberta → Boa Viagem (Setúbal) salvo em {PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH}")
                 
-                count = 0
-                for row in reader:
-                    x, y, bairro_x, bairro_y = row
-                    weight, path = self.dijkstra(bairro_x, bairro_y)
-                    writer.writerow([x, y, bairro_x, bairro_y, weight, path])
-                    count += 1
-
-                    if bairro_x == "Nova Descoberta" and bairro_y == "Boa Viagem (Setúbal)":
-                        Path(PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH).parent.mkdir(parents=True, exist_ok=True)
-                        with open(PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH, "w", encoding="utf-8") as f:
-                            json.dump({
-                                "origem": bairro_x,
-                                "destino": bairro_y,
-                                "custo": weight,
-                                "caminho": path
-                            }, f, indent=2, ensure_ascii=False)
-                        print(f"✓ Caminho Nova Descoberta → Boa Viagem (Setúbal) salvo em {PERCURSO_NOVA_DESCOBERTA_SETUBAL_PATH}")
-                    
-                    if count % 10 == 0:
-                        print(f"  Processados {count} pares de endereços...")
+                if count % BATCH_PROGRESS_ROWS == 0:
+                    print(f"  Processados {count} pares de endereços...")
         
         print(f"✓ Distâncias salvas em {output_path}")
+        print(f"  {routed} pares, {len(distinct)} distintos, {len({origin for origin, _ in distinct})} origens")
 
 def main():
 
@@ -0,0 +1,177 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Set, Tuple
+
+from graphs.masks import MaskedView
+from graphs.weights import UndirectedView, WeightedView
+
+VIEW_TYPES = (WeightedView, UndirectedView, MaskedView)
+
+PathTree = Tuple[Dict[str, float], Dict[str, Optional[str]]]
+
+
+def graph_fingerprint(graph: Mapping) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for node, neighbors in graph.items():
+        digest.update(repr((node, list(neighbors))).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def chain_fingerprint(fingerprint: str, change: Tuple) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((fingerprint, change)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _Flight:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[PathTree] = None
+        self.error: Optional[BaseException] = None
+
+
+class ShortestPathCache:
+
+    def __init__(self, max_entries: int = 2_000_000, max_trees: Optional[int] = None):
+        if max_entries <= 0:
+            raise ValueError("A capacidade do cache deve ser positiva")
+        self.max_entries = max_entries
+        self.max_trees = max_trees
+        self._trees: "OrderedDict[Hashable, PathTree]" = OrderedDict()
+        self._pending: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.entries = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(fingerprint: str, source: str, algorithm: str = "dijkstra", weights: str = "identity") -> Tuple:
+        return (fingerprint, source, algorithm, weights)
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._trees
+
+    def get(self, key: Hashable) -> Optional[PathTree]:
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is None:
+                self.misses += 1
+            else:
+                self._trees.move_to_end(key)
+                self.hits += 1
+            return tree
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], PathTree]) -> PathTree:
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.hits += 1
+                return tree
+
+            flight = self._pending.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._pending[key] = flight
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+        except BaseException as error:
+            flight.error = error
+            raise
+        else:
+            self._store(key, flight.value)
+        finally:
+            with self._lock:
+                del self._pending[key]
+            flight.done.set()
+
+        return flight.value
+
+    def _store(self, key: Hashable, tree: PathTree) -> None:
+        size = len(tree[0])
+        with self._lock:
+            if key in self._trees:
+                self.entries -= len(self._trees.pop(key)[0])
+            if size > self.max_entries:
+                return
+            self._trees[key] = tree
+            self.entries += size
+            while self.entries > self.max_entries or (
+                self.max_trees is not None and len(self._trees) > self.max_trees
+            ):
+                _, evicted = self._trees.popitem(last=False)
+                self.entries -= len(evicted[0])
+                self.evictions += 1
+
+    def invalidate(self, fingerprint: Optional[str] = None) -> int:
+        with self._lock:
+            if fingerprint is None:
+                removed = len(self._trees)
+                self._trees.clear()
+                self.entries = 0
+                return removed
+            stale = [key for key in self._trees if key[0] == fingerprint]
+            for key in stale:
+                self.entries -= len(self._trees.pop(key)[0])
+            return len(stale)
+
+    def trees(self, fingerprint: str) -> List[Tuple[Hashable, PathTree]]:
+        with self._lock:
+            return [(key, tree) for key, tree in self._trees.items() if key[0] == fingerprint]
+
+    def rekey(self, fingerprint: str, replacement: str, keep: Set[Hashable]) -> int:
+        with self._lock:
+            dropped = 0
+            trees: "OrderedDict[Hashable, PathTree]" = OrderedDict()
+            for key, tree in self._trees.items():
+                if key[0] != fingerprint:
+                    trees[key] = tree
+                elif key in keep:
+                    trees[(replacement,) + tuple(key[1:])] = tree
+                else:
+                    dropped += 1
+            self._trees = trees
+            self.entries = sum(len(tree[0]) for tree in trees.values())
+            return dropped
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "trees": len(self._trees),
+                "entries": self.entries,
+            }
+
+
+def view_name(graph: Mapping) -> str:
+    names = []
+    while isinstance(graph, VIEW_TYPES):
+        names.append(graph.name)
+        graph = graph.graph
+    return ".".join(reversed(names)) or "identity"
+
+
+def base_graph(graph: Mapping) -> Mapping:
+    while isinstance(graph, VIEW_TYPES):
+        graph = graph.graph
+    return graph
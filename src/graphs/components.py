@@ -0,0 +1,228 @@
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Set
+
+
+class UnionFind:
+
+    def __init__(self, items: Iterable[str] = ()):
+        self.parent: Dict[str, str] = {}
+        self.size: Dict[str, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: str) -> None:
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item: str) -> str:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: str, second: str) -> bool:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return False
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+        return True
+
+
+def weakly_connected_components(graph: Mapping) -> Dict[str, int]:
+    sets = UnionFind(graph)
+    for node in graph:
+        for neighbor, _ in graph[node]:
+            sets.add(neighbor)
+            sets.union(node, neighbor)
+
+    ids: Dict[str, int] = {}
+    labels: Dict[str, int] = {}
+    for node in sets.parent:
+        root = sets.find(node)
+        if root not in ids:
+            ids[root] = len(ids)
+        labels[node] = ids[root]
+    return labels
+
+
+def strongly_connected_components(graph: Mapping) -> Dict[str, int]:
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    labels: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    counter = 0
+    components = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            descended = False
+            for neighbor, _ in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    descended = True
+                    break
+                if neighbor in on_stack:
+                    low[node] = min(low[node], index[neighbor])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    labels[member] = components
+                    if member == node:
+                        break
+                components += 1
+
+    return labels
+
+
+def condensation(graph: Mapping, labels: Dict[str, int]) -> Dict[int, Set[int]]:
+    dag: Dict[int, Set[int]] = {component: set() for component in set(labels.values())}
+    for node in graph:
+        source = labels[node]
+        for neighbor, _ in graph[node]:
+            target = labels[neighbor]
+            if source != target:
+                dag[source].add(target)
+    return dag
+
+
+class Components:
+
+    def __init__(self, graph: Mapping, directed: bool = True):
+        self.directed = directed
+        self.weak = weakly_connected_components(graph)
+        self.strong = strongly_connected_components(graph) if directed else self.weak
+        self._dag = None
+        self._graph = graph
+
+    @property
+    def weak_count(self) -> int:
+        return len(set(self.weak.values()))
+
+    @property
+    def strong_count(self) -> int:
+        return len(set(self.strong.values()))
+
+    def sizes(self, strong: bool = False) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for component in (self.strong if strong else self.weak).values():
+            counts[component] = counts.get(component, 0) + 1
+        return counts
+
+    def condensation(self) -> Dict[int, Set[int]]:
+        if self._dag is None:
+            self._dag = condensation(self._graph, self.strong)
+        return self._dag
+
+    def _relabel(self, labels: Dict[str, int], nodes: Iterable[str], label: int) -> None:
+        for node in nodes:
+            labels[node] = label
+
+    def _new_label(self, labels: Dict[str, int]) -> int:
+        return max(labels.values(), default=-1) + 1
+
+    def _reached(self, start: str, target: str, neighbors, allowed=None) -> Set[str]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in neighbors(node):
+                if neighbor in seen or (allowed is not None and not allowed(neighbor)):
+                    continue
+                if neighbor == target:
+                    return set()
+                seen.add(neighbor)
+                stack.append(neighbor)
+        return seen
+
+    def add_edge(self, source: str, target: str) -> None:
+        added = [node for node in dict.fromkeys((source, target)) if node not in self.weak]
+        for node in added:
+            self.weak[node] = self._new_label(self.weak)
+        first, second = self.weak[source], self.weak[target]
+        if first != second:
+            members = [node for node, label in self.weak.items() if label == second]
+            self._relabel(self.weak, members, first)
+        if not self.directed:
+            return
+
+        for node in added:
+            if node == target and node != source:
+                self.strong[node] = min(self.strong.values(), default=0) - 1
+            else:
+                self.strong[node] = max(self.strong.values(), default=-1) + 1
+            if self._dag is not None:
+                self._dag[self.strong[node]] = set()
+
+        if self.strong[source] < self.strong[target]:
+            self.strong = strongly_connected_components(self._graph)
+            self._dag = None
+        elif self.strong[source] > self.strong[target] and self._dag is not None:
+            self._dag[self.strong[source]].add(self.strong[target])
+
+    def remove_edge(self, source: str, target: str, reverse: Mapping) -> None:
+        def forward(node):
+            return (neighbor for neighbor, _ in self._graph.get(node, ()))
+
+        def undirected(node):
+            yield from forward(node)
+            if reverse is not self._graph:
+                yield from (neighbor for neighbor, _ in reverse.get(node, ()))
+
+        if source != target:
+            split = self._reached(source, target, undirected)
+            if split:
+                self._relabel(self.weak, split, self._new_label(self.weak))
+        if not self.directed:
+            return
+
+        component = self.strong[source]
+        if component != self.strong[target]:
+            self._dag = None
+        elif source != target and self._reached(source, target, forward, lambda node: self.strong[node] == component):
+            self.strong = strongly_connected_components(self._graph)
+            self._dag = None
+
+    def may_reach(self, source: str, target: str) -> bool:
+        if source not in self.weak or target not in self.weak:
+            return source == target
+        if self.weak[source] != self.weak[target]:
+            return False
+        return self.strong[source] >= self.strong[target]
+
+    def summary(self) -> Dict[str, int]:
+        weak_sizes = self.sizes()
+        strong_sizes = self.sizes(strong=True)
+        return {
+            "componentes_fracos": len(weak_sizes),
+            "maior_componente_fraco": max(weak_sizes.values(), default=0),
+            "componentes_fortes": len(strong_sizes),
+            "maior_componente_forte": max(strong_sizes.values(), default=0),
+            "arestas_condensacao": sum(len(targets) for targets in self.condensation().values()),
+        }
@@ -0,0 +1,72 @@
+from typing import Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+Incident = Callable[[str], Iterable[Tuple[str, Hashable]]]
+
+
+def biconnectivity(nodes: Iterable[str], incident: Incident) -> Dict:
+    disc: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    articulation: Set[str] = set()
+    bridges: List[Tuple[str, str, Hashable]] = []
+    components: List[List[str]] = []
+    edge_stack: List[Tuple[str, str]] = []
+    counter = 0
+
+    for root in nodes:
+        if root in disc:
+            continue
+        disc[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        stack = [(root, None, iter(incident(root)))]
+
+        while stack:
+            node, parent_key, neighbors = stack[-1]
+            descended = False
+            for neighbor, key in neighbors:
+                if key == parent_key:
+                    continue
+                if neighbor not in disc:
+                    disc[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    edge_stack.append((node, neighbor))
+                    stack.append((neighbor, key, iter(incident(neighbor))))
+                    descended = True
+                    break
+                if disc[neighbor] < disc[node]:
+                    low[node] = min(low[node], disc[neighbor])
+                    edge_stack.append((node, neighbor))
+            if descended:
+                continue
+
+            stack.pop()
+            if not stack:
+                continue
+            parent = stack[-1][0]
+            low[parent] = min(low[parent], low[node])
+
+            if low[node] > disc[parent]:
+                bridges.append((parent, node, parent_key))
+            if low[node] >= disc[parent]:
+                if parent == root:
+                    root_children += 1
+                else:
+                    articulation.add(parent)
+                component = set()
+                while True:
+                    first, second = edge_stack.pop()
+                    component.add(first)
+                    component.add(second)
+                    if first == parent and second == node:
+                        break
+                components.append(sorted(component))
+
+        if root_children > 1:
+            articulation.add(root)
+
+    components.sort(key=lambda component: (-len(component), component))
+    return {
+        "articulacoes": sorted(articulation),
+        "pontes": bridges,
+        "componentes_biconexos": components,
+    }
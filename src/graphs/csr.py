@@ -0,0 +1,225 @@
+import heapq
+from typing import Dict, List, Tuple, Optional, Sequence
+
+import numpy as np
+
+
+class CSRGraph:
+
+    def __init__(
+        self,
+        nodes: Sequence[str],
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        weights: Sequence[float],
+        edge_ids: Optional[Sequence[int]] = None,
+        directed: bool = True,
+    ):
+        self.nodes: List[str] = list(nodes)
+        self.index: Dict[str, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        weights = np.asarray(weights)
+        if weights.dtype != np.float32:
+            weights = weights.astype(np.float64, copy=False)
+        self.weights = weights
+        if edge_ids is None:
+            edge_ids = np.arange(len(self.indices), dtype=np.int64)
+        self.edge_ids = np.asarray(edge_ids, dtype=np.int64)
+        self.directed = directed
+        self.original_ids = np.arange(len(self.nodes), dtype=np.int64)
+        self._lists: Optional[Tuple[List[int], List[int], List[float]]] = None
+        self._reverse: Optional["CSRGraph"] = None
+
+    @classmethod
+    def from_adjacency(
+        cls, graph: Dict[str, List[Tuple[str, float]]], directed: bool = True
+    ) -> "CSRGraph":
+        nodes = list(graph.keys())
+        index = {node: i for i, node in enumerate(nodes)}
+
+        indptr = [0]
+        indices: List[int] = []
+        weights: List[float] = []
+        for node in list(nodes):
+            for neighbor, weight in graph[node]:
+                if neighbor not in index:
+                    index[neighbor] = len(nodes)
+                    nodes.append(neighbor)
+                indices.append(index[neighbor])
+                weights.append(weight)
+            indptr.append(len(indices))
+
+        indptr.extend([len(indices)] * (len(nodes) + 1 - len(indptr)))
+        csr = cls(nodes, indptr, indices, weights, directed=directed)
+        if directed:
+            csr.reverse()
+        return csr
+
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def in_degrees(self) -> np.ndarray:
+        return np.bincount(self.indices, minlength=self.num_nodes())
+
+    def reverse(self) -> "CSRGraph":
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            n = self.num_nodes()
+            rows = np.repeat(np.arange(n, dtype=np.int64), self.out_degrees())
+            order = np.argsort(self.indices, kind="stable")
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(self.in_degrees(), out=indptr[1:])
+
+            reverse = CSRGraph.__new__(CSRGraph)
+            reverse.__dict__.update(self.__dict__)
+            reverse.indptr = indptr
+            reverse.indices = rows[order].astype(np.int32)
+            reverse.weights = self.weights[order]
+            reverse.edge_ids = self.edge_ids[order]
+            reverse._lists = None
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def predecessors(self, node_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        return self.reverse().neighbors(node_id)
+
+    def neighbors(self, node_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.indptr[node_id], self.indptr[node_id + 1]
+        return self.indices[start:end], self.weights[start:end]
+
+    def as_lists(self) -> Tuple[List[int], List[int], List[float]]:
+        if self._lists is None:
+            self._lists = (
+                self.indptr.tolist(),
+                self.indices.tolist(),
+                self.weights.tolist(),
+            )
+        return self._lists
+
+    def to_adjacency(self) -> Dict[str, List[Tuple[str, float]]]:
+        indptr, indices, weights = self.as_lists()
+        graph: Dict[str, List[Tuple[str, float]]] = {}
+        for u, node in enumerate(self.nodes):
+            graph[node] = [
+                (self.nodes[indices[k]], weights[k])
+                for k in range(indptr[u], indptr[u + 1])
+            ]
+        return graph
+
+    def view(self, transform) -> "CSRGraph":
+        view = CSRGraph.__new__(CSRGraph)
+        view.__dict__.update(self.__dict__)
+        view.weights = np.asarray(transform.vector(self.weights), dtype=np.float32)
+        view._lists = None
+        view._reverse = None
+        return view
+
+    def relabel(self, order: Sequence[int]) -> "CSRGraph":
+        order = np.asarray(order, dtype=np.int64)
+        n = self.num_nodes()
+        if len(order) != n or len(np.unique(order)) != n:
+            raise ValueError("A ordem deve ser uma permutação de todos os vértices")
+
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.arange(n, dtype=np.int64)
+
+        degrees = self.out_degrees()[order]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+
+        rows = np.repeat(np.arange(n, dtype=np.int64), degrees)
+        offsets = np.arange(len(self.indices), dtype=np.int64) - indptr[rows]
+        positions = self.indptr[order][rows] + offsets
+
+        indices = rank[self.indices[positions]]
+        sort = np.lexsort((indices, rows))
+        positions = positions[sort]
+
+        relabeled = CSRGraph(
+            [self.nodes[old] for old in order],
+            indptr,
+            indices[sort],
+            self.weights[positions],
+            self.edge_ids[positions],
+            directed=self.directed,
+        )
+        relabeled.original_ids = self.original_ids[order]
+        return relabeled
+
+    def bfs(self, start: str) -> Dict[str, int]:
+        if start not in self.index:
+            return {}
+
+        distances = np.full(self.num_nodes(), -1, dtype=np.int64)
+        frontier = np.array([self.index[start]], dtype=np.int64)
+        distances[frontier] = 0
+        level = 0
+
+        while frontier.size:
+            level += 1
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            reached = self.indices[positions]
+            frontier = np.unique(reached[distances[reached] < 0]).astype(np.int64)
+            distances[frontier] = level
+
+        reached = np.flatnonzero(distances >= 0)
+        return {self.nodes[u]: int(distances[u]) for u in reached}
+
+    def dijkstra(self, start: str) -> Dict[str, float]:
+        if start not in self.index:
+            return {}
+
+        indptr, indices, weights = self.as_lists()
+        inf = float("inf")
+        distances = [inf] * self.num_nodes()
+        source = self.index[start]
+        distances[source] = 0.0
+        heap = [(0.0, source)]
+
+        while heap:
+            distance, u = heapq.heappop(heap)
+            if distance > distances[u]:
+                continue
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                candidate = distance + weights[k]
+                if candidate < distances[v]:
+                    distances[v] = candidate
+                    heapq.heappush(heap, (candidate, v))
+
+        return {self.nodes[u]: d for u, d in enumerate(distances) if d < inf}
+
+    def pagerank(
+        self, damping: float = 0.85, iterations: int = 50, tolerance: float = 1e-10
+    ) -> Dict[str, float]:
+        n = self.num_nodes()
+        if n == 0:
+            return {}
+
+        degrees = self.out_degrees()
+        rows = np.repeat(np.arange(n, dtype=np.int64), degrees)
+        dangling = degrees == 0
+        inverse_degree = np.where(dangling, 0.0, 1.0 / np.maximum(degrees, 1))
+        rank = np.full(n, 1.0 / n)
+
+        for _ in range(iterations):
+            contributions = (rank * inverse_degree)[rows]
+            updated = np.bincount(self.indices, weights=contributions, minlength=n)
+            updated = damping * (updated + rank[dangling].sum() / n) + (1 - damping) / n
+            converged = np.abs(updated - rank).sum() < tolerance
+            rank = updated
+            if converged:
+                break
+
+        return dict(zip(self.nodes, rank.tolist()))
@@ -0,0 +1,82 @@
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PathTree = Tuple[Dict[str, float], Dict[str, Optional[str]]]
+
+
+def topological_order(graph: Mapping) -> Optional[List[str]]:
+    in_degree: Dict[str, int] = {node: 0 for node in graph}
+    for node in graph:
+        for neighbor, _ in graph[node]:
+            in_degree[neighbor] = in_degree.get(neighbor, 0) + 1
+
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    order: List[str] = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for neighbor, _ in graph.get(node, ()):
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if len(order) < len(in_degree):
+        return None
+    return order
+
+
+def _bounded_reach(graph: Mapping, start: str, allowed) -> List[str]:
+    seen = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for neighbor, _ in graph.get(node, ()):
+            if neighbor not in seen and allowed(neighbor):
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return list(seen)
+
+
+def insert_arc(
+    order: List[str], position: Dict[str, int], graph: Mapping, reverse: Mapping, source: str, target: str
+) -> bool:
+    for node in (source, target):
+        if node not in position:
+            position[node] = len(order)
+            order.append(node)
+    if source == target:
+        return False
+    if position[source] < position[target]:
+        return True
+
+    low, high = position[target], position[source]
+    forward = _bounded_reach(graph, target, lambda node: position[node] <= high)
+    if source in forward:
+        return False
+    backward = _bounded_reach(reverse, source, lambda node: position[node] >= low)
+
+    nodes = sorted(backward, key=position.__getitem__) + sorted(forward, key=position.__getitem__)
+    for slot, node in zip(sorted(position[node] for node in nodes), nodes):
+        position[node] = slot
+        order[slot] = node
+    return True
+
+
+def dag_paths(graph: Mapping, order: Sequence[str], start: str, longest: bool = False) -> PathTree:
+    sign = -1.0 if longest else 1.0
+    distances: Dict[str, float] = {start: 0.0}
+    parents: Dict[str, Optional[str]] = {start: None}
+
+    for node in order:
+        if node not in distances:
+            continue
+        base = distances[node]
+        for neighbor, weight in graph.get(node, ()):
+            candidate = base + weight
+            current = distances.get(neighbor)
+            if current is None or sign * candidate < sign * current:
+                distances[neighbor] = candidate
+                parents[neighbor] = node
+
+    return distances, parents
@@ -0,0 +1,102 @@
+import heapq
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Set, Tuple
+
+INFINITY = float("inf")
+
+PathTree = Tuple[Dict[str, float], Dict[str, Optional[str]]]
+
+
+def lower_edge(graph: Mapping, tree: PathTree, source: str, target: str, weight: float) -> Dict[str, float]:
+    distances, parents = tree
+    if source not in distances:
+        return {}
+    candidate = distances[source] + weight
+    if candidate >= distances.get(target, INFINITY):
+        return {}
+
+    distances[target] = candidate
+    parents[target] = source
+    changed = {target: candidate}
+    frontier = [(candidate, target)]
+    while frontier:
+        distance, node = heapq.heappop(frontier)
+        if distance > distances[node]:
+            continue
+        for neighbor, cost in graph.get(node, ()):
+            candidate = distance + cost
+            if candidate < distances.get(neighbor, INFINITY):
+                distances[neighbor] = candidate
+                parents[neighbor] = node
+                changed[neighbor] = candidate
+                heapq.heappush(frontier, (candidate, neighbor))
+    return changed
+
+
+def subtree(graph: Mapping, parents: Dict[str, Optional[str]], root: str) -> Set[str]:
+    affected = {root}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for neighbor, _ in graph.get(node, ()):
+            if neighbor not in affected and parents.get(neighbor) == node:
+                affected.add(neighbor)
+                stack.append(neighbor)
+    return affected
+
+
+def raise_edge(
+    graph: Mapping, reverse: Mapping, tree: PathTree, source: str, target: str, previous: float
+) -> Dict[str, float]:
+    distances, parents = tree
+    if parents.get(target) != source or distances[source] + previous != distances[target]:
+        return {}
+
+    affected = subtree(graph, parents, target)
+    frontier: List[Tuple[float, str]] = []
+    for node in affected:
+        del distances[node]
+        del parents[node]
+    for node in affected:
+        best, parent = INFINITY, None
+        for predecessor, cost in reverse.get(node, ()):
+            if predecessor in affected or predecessor not in distances:
+                continue
+            if distances[predecessor] + cost < best:
+                best, parent = distances[predecessor] + cost, predecessor
+        if parent is not None:
+            distances[node] = best
+            parents[node] = parent
+            frontier.append((best, node))
+    heapq.heapify(frontier)
+
+    while frontier:
+        distance, node = heapq.heappop(frontier)
+        if distance > distances[node]:
+            continue
+        for neighbor, cost in graph.get(node, ()):
+            if neighbor not in affected:
+                continue
+            candidate = distance + cost
+            if candidate < distances.get(neighbor, INFINITY):
+                distances[neighbor] = candidate
+                parents[neighbor] = node
+                heapq.heappush(frontier, (candidate, neighbor))
+
+    return {node: distances.get(node, INFINITY) for node in affected}
+
+
+def update_tree(
+    graph: Mapping,
+    reverse: Mapping,
+    tree: PathTree,
+    source: str,
+    target: str,
+    previous: float,
+    weight: float,
+) -> Dict[str, float]:
+    if weight < previous:
+        return lower_edge(graph, tree, source, target, weight)
+    if weight > previous:
+        return raise_edge(graph, reverse, tree, source, target, previous)
+    return {}
@@ -0,0 +1,130 @@
+from array import array
+from collections.abc import Mapping
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+
+class EdgeStore:
+
+    COLUMNS = ("weight", "logradouro", "observacao", "timestamp")
+
+    def __init__(self):
+        self.nodes: List[str] = []
+        self.node_ids: Dict[str, int] = {}
+        self.labels: List[str] = [""]
+        self.label_ids: Dict[str, int] = {"": 0}
+
+        self.source = array("i")
+        self.target = array("i")
+        self.next_parallel = array("i")
+        self.weight = array("d")
+        self.logradouro = array("i")
+        self.observacao = array("i")
+        self.timestamp = array("q")
+
+    def __len__(self) -> int:
+        return len(self.weight)
+
+    def node_id(self, node: str) -> int:
+        node_id = self.node_ids.get(node)
+        if node_id is None:
+            node_id = len(self.nodes)
+            self.node_ids[node] = node_id
+            self.nodes.append(node)
+        return node_id
+
+    def label_id(self, label) -> int:
+        if label is None:
+            return 0
+        label = str(label).strip()
+        label_id = self.label_ids.get(label)
+        if label_id is None:
+            label_id = len(self.labels)
+            self.label_ids[label] = label_id
+            self.labels.append(label)
+        return label_id
+
+    def add(
+        self,
+        source: str,
+        target: str,
+        weight: float = 1.0,
+        logradouro: str = "",
+        observacao: str = "",
+        timestamp: int = 0,
+        next_parallel: int = -1,
+    ) -> int:
+        edge_id = len(self.weight)
+        self.source.append(self.node_id(source))
+        self.target.append(self.node_id(target))
+        self.next_parallel.append(next_parallel)
+        self.weight.append(weight)
+        self.logradouro.append(self.label_id(logradouro))
+        self.observacao.append(self.label_id(observacao))
+        self.timestamp.append(int(timestamp))
+        return edge_id
+
+    def column(self, name: str) -> array:
+        if name not in self.COLUMNS:
+            raise ValueError(f"Coluna desconhecida: {name}. Opções: {', '.join(self.COLUMNS)}")
+        return getattr(self, name)
+
+    def as_numpy(self, name: str) -> np.ndarray:
+        column = self.column(name)
+        return np.frombuffer(column, dtype=column.typecode) if len(column) else np.array([])
+
+    def parallel(self, head: int) -> Iterator[int]:
+        while head >= 0:
+            yield head
+            head = self.next_parallel[head]
+
+    def get(self, edge_id: int) -> Dict:
+        return {
+            "origem": self.nodes[self.source[edge_id]],
+            "destino": self.nodes[self.target[edge_id]],
+            "weight": self.weight[edge_id],
+            "logradouro": self.labels[self.logradouro[edge_id]],
+            "observacao": self.labels[self.observacao[edge_id]],
+            "timestamp": self.timestamp[edge_id],
+        }
+
+    def nbytes(self) -> int:
+        columns = (
+            self.source,
+            self.target,
+            self.next_parallel,
+            self.weight,
+            self.logradouro,
+            self.observacao,
+            self.timestamp,
+        )
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def bytes_per_edge(self) -> float:
+        return self.nbytes() / len(self) if len(self) else 0.0
+
+
+class CostView(Mapping):
+
+    def __init__(
+        self,
+        nodes: Collection[str],
+        incident: Callable[[str], Iterable[Tuple[str, int]]],
+        costs: Sequence[float],
+    ):
+        self.nodes = nodes
+        self.incident = incident
+        self.costs = costs
+
+    def __getitem__(self, node: str) -> List[Tuple[str, float]]:
+        if node not in self.nodes:
+            raise KeyError(node)
+        costs = self.costs
+        return [(neighbor, costs[edge_id]) for neighbor, edge_id in self.incident(node)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
@@ -0,0 +1,98 @@
+from collections.abc import Mapping
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from graphs.johnson import NegativeCycleError
+
+FLOYD_BLOCK = 512
+FLOYD_BLOCK_MIN_NODES = 2048
+FLOYD_DENSITY_FACTOR = 20
+
+
+def dense_weights(graph: Mapping, nodes: Sequence[str]) -> np.ndarray:
+    index = {node: i for i, node in enumerate(nodes)}
+    weights = np.full((len(nodes), len(nodes)), np.inf)
+    for node in nodes:
+        row = weights[index[node]]
+        for neighbor, weight in graph[node]:
+            column = index.get(neighbor)
+            if column is not None and weight < row[column]:
+                row[column] = weight
+    np.fill_diagonal(weights, np.minimum(weights.diagonal(), 0.0))
+    return weights
+
+
+def _relax(dist: np.ndarray, pred: np.ndarray, k: int, rows: slice, columns: slice) -> None:
+    candidate = dist[rows, k, None] + dist[None, k, columns]
+    better = candidate < dist[rows, columns]
+    np.copyto(dist[rows, columns], candidate, where=better)
+    np.copyto(pred[rows, columns], pred[None, k, columns], where=better)
+
+
+def _blocked(dist: np.ndarray, pred: np.ndarray, block: int) -> None:
+    n = len(dist)
+    tiles = [slice(start, min(start + block, n)) for start in range(0, n, block)]
+    for panel in tiles:
+        pivots = range(panel.start, panel.stop)
+        for k in pivots:
+            _relax(dist, pred, k, panel, panel)
+
+        others = [tile for tile in tiles if tile != panel]
+        for tile in others:
+            for k in pivots:
+                _relax(dist, pred, k, panel, tile)
+                _relax(dist, pred, k, tile, panel)
+
+        for rows in others:
+            if not np.isfinite(dist[rows, panel]).any():
+                continue
+            for columns in others:
+                for k in pivots:
+                    _relax(dist, pred, k, rows, columns)
+
+
+def floyd_warshall(weights: np.ndarray, block: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(weights)
+    dist = np.array(weights, dtype=np.float64)
+    pred = np.where(np.isfinite(dist), np.arange(n, dtype=np.int32)[:, None], np.int32(-1))
+    np.fill_diagonal(pred, -1)
+    everything = slice(0, n)
+
+    if block is None:
+        block = FLOYD_BLOCK if n >= FLOYD_BLOCK_MIN_NODES else n
+    if block >= n:
+        for k in range(n):
+            _relax(dist, pred, k, everything, everything)
+    else:
+        _blocked(dist, pred, block)
+
+    negative = np.flatnonzero(dist.diagonal() < 0)
+    if len(negative):
+        raise NegativeCycleError([str(node) for node in negative_cycle(pred, int(negative[0]))])
+    return dist, pred
+
+
+def negative_cycle(pred: np.ndarray, node: int) -> List[int]:
+    walk = [node]
+    current = int(pred[node, node])
+    seen = {node}
+    while current not in seen and current >= 0:
+        seen.add(current)
+        walk.append(current)
+        current = int(pred[node, current])
+    start = walk.index(current) if current in walk else 0
+    cycle = walk[start:][::-1]
+    return cycle + [cycle[0]]
+
+
+def matrix_path(pred: np.ndarray, source: int, target: int) -> List[int]:
+    if source == target:
+        return [source]
+    if pred[source, target] < 0:
+        return []
+    path = [target]
+    while target != source:
+        target = int(pred[source, target])
+        path.append(target)
+    return path[::-1]
@@ -1,6 +1,8 @@
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Iterator, Tuple
 from dataclasses import dataclass
 
+from graphs.edges import EdgeStore, CostView
+
 @dataclass
 class GraphMetrics:
     ordem: int
@@ -16,31 +18,55 @@ class GraphMetrics:
 
 class Graph:
     def __init__(self):
-        self.adjacencies: Dict[str, Set[str]] = {}
-        self.weights: Dict[Tuple[str, str], float] = {}
+        self.adjacencies: Dict[str, Dict[str, int]] = {}
+        self.edges = EdgeStore()
 
     def add_node(self, node: str) -> None:
         if node not in self.adjacencies:
-            self.adjacencies[node] = set()
-
-    def add_edge(self, first_node: str, second_node: str, weight: float = 1.0) -> None:
+            self.adjacencies[node] = {}
+
+    def add_edge(
+        self,
+        first_node: str,
+        second_node: str,
+        weight: float = 1.0,
+        logradouro: str = "",
+        observacao: str = "",
+        timestamp: int = 0,
+    ) -> int:
         self.add_node(first_node)
         self.add_node(second_node)
 
-        self.adjacencies[first_node].add(second_node)
-        self.weights[(first_node, second_node)] = weight
+        head = self.adjacencies[first_node].get(second_node, -1)
+        edge_id = self.edges.add(
+            first_node, second_node, weight, logradouro, observacao, timestamp, head
+        )
+
+        self.adjacencies[first_node][second_node] = edge_id
+        self.adjacencies[second_node][first_node] = edge_id
 
-        self.adjacencies[second_node].add(first_node)
-        self.weights[(second_node, first_node)] = weight
+        return edge_id
 
     def get_neighbors(self, node: str) -> Set[str]:
-        return self.adjacencies.get(node, set())
+        return set(self.adjacencies.get(node, ()))
+
+    def get_edge_ids(self, first_node: str, second_node: str) -> List[int]:
+        head = self.adjacencies.get(first_node, {}).get(second_node, -1)
+        return list(self.edges.parallel(head))
+
+    def incident_edges(self, node: str) -> Iterator[Tuple[str, int]]:
+        for neighbor, head in self.adjacencies.get(node, {}).items():
+            for edge_id in self.edges.parallel(head):
+                yield neighbor, edge_id
+
+    def cost_view(self, column: str = "weight") -> CostView:
+        return CostView(self.adjacencies, self.incident_edges, self.edges.column(column))
 
     def get_vertices(self) -> List[str]:
         return list(self.adjacencies.keys())
 
     def get_degree(self, node: str) -> int:
-        return len(self.adjacencies.get(node, set()))
+        return len(self.adjacencies.get(node, ()))
 
     def get_order(self) -> int:
         return len(self.adjacencies)
@@ -48,6 +74,9 @@ class Graph:
     def get_size(self) -> int:
         return sum(len(neighbors) for neighbors in self.adjacencies.values()) // 2
 
+    def get_edge_count(self) -> int:
+        return len(self.edges)
+
     def get_density(self) -> float:
         order = self.get_order()
 
@@ -84,8 +113,16 @@ class Graph:
             for v in self.adjacencies[u]:
                 if v in vertices:
                     if u <= v:
-                        weight = self.weights.get((u, v), 1.0)
-                        subgraph.add_edge(u, v, weight)
+                        for edge_id in reversed(self.get_edge_ids(u, v)):
+                            edge = self.edges.get(edge_id)
+                            subgraph.add_edge(
+                                u,
+                                v,
+                                edge["weight"],
+                                edge["logradouro"],
+                                edge["observacao"],
+                                edge["timestamp"],
+                            )
 
         return subgraph
 
@@ -98,13 +135,34 @@ class Graph:
             and second_node in self.adjacencies[first_node]
         )
 
-    def get_weight(self, first_node: str, second_node: str) -> float:
-        return self.weights.get((first_node, second_node), float("inf"))
+    def get_weight(self, first_node: str, second_node: str, column: str = "weight") -> float:
+        costs = self.edges.column(column)
+        return min(
+            (costs[edge_id] for edge_id in self.get_edge_ids(first_node, second_node)),
+            default=float("inf"),
+        )
 
-    def get_ego_network(self, node: str):
+    def get_ball(self, node: str, radius: int = 1) -> Set[str]:
+        if node not in self.adjacencies:
+            return set()
+
+        ball = {node}
+        frontier = [node]
+        for _ in range(radius):
+            next_frontier = []
+            for current in frontier:
+                for neighbor in self.adjacencies[current]:
+                    if neighbor not in ball:
+                        ball.add(neighbor)
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return ball
+
+    def get_ego_network(self, node: str, radius: int = 1):
         if node not in self.adjacencies:
             return Graph()
 
-        ego_vertices = {node} | self.get_neighbors(node)
-
-        return self.get_subgraph(ego_vertices)
+        return self.get_subgraph(self.get_ball(node, radius))
@@ -1,7 +1,7 @@
 import pandas as pd
 from pathlib import Path
 from typing import Optional
-from utils.normalize import normalize_name
+from utils.normalize import normalize_series
 from constants import BAIRROS_RECIFE_PATH, BAIRROS_UNIQUE_PATH
 
 
@@ -31,8 +31,7 @@ class CSVLoader:
             ["bairro", "microrregiao"]
         ]
         melted = melted.dropna(subset=["bairro"])
-        melted["bairro"] = melted["bairro"].apply(normalize_name)
-        melted["bairro"] = melted["bairro"].replace({"Setúbal": "Boa Viagem (Setúbal)"})
+        melted["bairro"] = normalize_series(melted["bairro"])
 
         bairros_unique = melted.drop_duplicates().reset_index(drop=True)
         return bairros_unique
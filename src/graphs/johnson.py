@@ -0,0 +1,131 @@
+import json
+from collections import deque
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+PathTree = Tuple[Dict[str, float], Dict[str, Optional[str]]]
+
+
+class NegativeCycleError(ValueError):
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(
+            "Ciclo negativo detectado (" + " -> ".join(cycle) + "); "
+            "caminhos mínimos entre todos os pares não estão definidos"
+        )
+
+
+def _parent_cycle(parents: Dict[str, Optional[str]]) -> Optional[List[str]]:
+    state: Dict[str, int] = {}
+    for start in parents:
+        if start in state:
+            continue
+        walk: List[str] = []
+        node: Optional[str] = start
+        while node is not None and node not in state:
+            state[node] = len(walk)
+            walk.append(node)
+            node = parents[node]
+        if node is not None and state[node] >= 0:
+            cycle = walk[state[node] :][::-1]
+            return cycle + [cycle[0]]
+        for member in walk:
+            state[member] = -1
+    return None
+
+
+def johnson_potentials(graph: Mapping) -> Dict[str, float]:
+    potentials: Dict[str, float] = {node: 0.0 for node in graph}
+    parents: Dict[str, Optional[str]] = {node: None for node in graph}
+    queue = deque(graph)
+    queued = set(graph)
+    check_every = max(len(graph), 1)
+    relaxations = 0
+
+    while queue:
+        node = queue.popleft()
+        queued.discard(node)
+        base = potentials[node]
+        for neighbor, weight in graph[node]:
+            candidate = base + weight
+            if candidate < potentials[neighbor]:
+                potentials[neighbor] = candidate
+                parents[neighbor] = node
+                relaxations += 1
+                if relaxations % check_every == 0:
+                    cycle = _parent_cycle(parents)
+                    if cycle is not None:
+                        raise NegativeCycleError(cycle)
+                if neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+
+    return potentials
+
+
+def reweight(graph: Mapping, potentials: Dict[str, float]) -> Dict[str, List[Tuple[str, float]]]:
+    return {
+        node: [
+            (neighbor, max(0.0, weight + potentials[node] - potentials[neighbor]))
+            for neighbor, weight in graph[node]
+        ]
+        for node in graph
+    }
+
+
+def save_potentials(directory: str, nodes: Sequence[str], potentials: Dict[str, float], key: str) -> None:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    np.save(directory / "potentials.npy", np.array([potentials[node] for node in nodes], dtype=np.float64))
+    with open(directory / "potentials.json", "w", encoding="utf-8") as f:
+        json.dump({"chave": key, "vertices": list(nodes)}, f, ensure_ascii=False)
+
+
+def load_potentials(directory: str, key: str) -> Optional[Dict[str, float]]:
+    directory = Path(directory)
+    meta_path = directory / "potentials.json"
+    if not meta_path.exists():
+        return None
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("chave") != key:
+        return None
+    values = np.load(directory / "potentials.npy")
+    return dict(zip(meta["vertices"], values.tolist()))
+
+
+def distance_rows(
+    search: Callable[[str], PathTree],
+    sources: Sequence[str],
+    index: Dict[str, int],
+    potentials: np.ndarray,
+    dtype=np.float64,
+) -> np.ndarray:
+    rows = np.full((len(sources), len(index)), np.inf, dtype=dtype)
+    for row, source in enumerate(sources):
+        distances, _ = search(source)
+        columns = np.fromiter((index[node] for node in distances), dtype=np.int64, count=len(distances))
+        costs = np.fromiter(distances.values(), dtype=np.float64, count=len(distances))
+        rows[row, columns] = costs - potentials[index[source]] + potentials[columns]
+    return rows
+
+
+def open_matrix(directory: str, sources: Sequence[str], targets: Sequence[str], dtype=np.float64) -> np.memmap:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / "matrix.json", "w", encoding="utf-8") as f:
+        json.dump({"origens": list(sources), "destinos": list(targets)}, f, ensure_ascii=False)
+    return np.lib.format.open_memmap(
+        directory / "distances.npy", mode="w+", dtype=dtype, shape=(len(sources), len(targets))
+    )
+
+
+def load_matrix(directory: str) -> Tuple[List[str], List[str], np.ndarray]:
+    directory = Path(directory)
+    with open(directory / "matrix.json", "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    return meta["origens"], meta["destinos"], np.load(directory / "distances.npy", mmap_mode="r")
@@ -0,0 +1,180 @@
+import heapq
+import json
+import time
+from collections import deque
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+INFINITY = float("inf")
+LABEL_METRICS = ("hops", "weight")
+
+Label = Tuple[List[int], List[float]]
+
+
+def _pruned_search(
+    graph: Mapping,
+    root: str,
+    rank: int,
+    ranks: Dict[str, int],
+    root_label: np.ndarray,
+    labels: Dict[str, Label],
+    weighted: bool,
+) -> None:
+    distances: Dict[str, float] = {root: 0.0}
+    if weighted:
+        frontier: List[Tuple[float, str]] = [(0.0, root)]
+        pop = lambda: heapq.heappop(frontier)
+    else:
+        frontier = deque([(0.0, root)])
+        pop = frontier.popleft
+    settled = set()
+
+    while frontier:
+        distance, node = pop()
+        if node in settled or distance > distances[node]:
+            continue
+        settled.add(node)
+
+        hubs, costs = labels[node]
+        if any(root_label[hub] + cost <= distance for hub, cost in zip(hubs, costs)):
+            continue
+        hubs.append(rank)
+        costs.append(distance)
+
+        for neighbor, weight in graph.get(node, ()):
+            if ranks[neighbor] <= rank:
+                continue
+            candidate = distance + (weight if weighted else 1.0)
+            if candidate < distances.get(neighbor, INFINITY):
+                distances[neighbor] = candidate
+                if weighted:
+                    heapq.heappush(frontier, (candidate, neighbor))
+                else:
+                    frontier.append((candidate, neighbor))
+
+
+def build_labels(
+    graph: Mapping, reverse: Mapping, order: Sequence[str], weighted: bool
+) -> Tuple[Dict[str, Label], Dict[str, Label]]:
+    ranks = {node: rank for rank, node in enumerate(order)}
+    out_labels: Dict[str, Label] = {node: ([], []) for node in order}
+    in_labels: Dict[str, Label] = {node: ([], []) for node in order}
+    root_label = np.full(len(order), INFINITY)
+
+    for rank, root in enumerate(order):
+        hubs, costs = out_labels[root]
+        root_label[hubs] = costs
+        _pruned_search(graph, root, rank, ranks, root_label, in_labels, weighted)
+        root_label[hubs] = INFINITY
+
+        hubs, costs = in_labels[root]
+        root_label[hubs] = costs
+        _pruned_search(reverse, root, rank, ranks, root_label, out_labels, weighted)
+        root_label[hubs] = INFINITY
+
+    return out_labels, in_labels
+
+
+def _pack(labels: Dict[str, Label], nodes: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(labels[node][0]) for node in nodes])
+    hubs = np.fromiter((hub for node in nodes for hub in labels[node][0]), dtype=np.int32, count=offsets[-1])
+    costs = np.fromiter((cost for node in nodes for cost in labels[node][1]), dtype=np.float64, count=offsets[-1])
+    return offsets, hubs, costs
+
+
+class LandmarkLabels:
+
+    def __init__(self, nodes: List[str], metric: str, arrays: Dict[str, np.ndarray], report: Optional[Dict] = None):
+        self.nodes = nodes
+        self.node_ids: Dict[str, int] = {node: i for i, node in enumerate(nodes)}
+        self.metric = metric
+        self.arrays = arrays
+        self.report = report or {}
+
+    @classmethod
+    def build(cls, graph: Mapping, reverse: Mapping, order: Sequence[str], metric: str = "hops") -> "LandmarkLabels":
+        if metric not in LABEL_METRICS:
+            raise ValueError(f"Métrica desconhecida: {metric}. Opções: {', '.join(LABEL_METRICS)}")
+        start_time = time.perf_counter()
+        out_labels, in_labels = build_labels(graph, reverse, order, weighted=metric == "weight")
+        elapsed = time.perf_counter() - start_time
+
+        nodes = list(order)
+        arrays: Dict[str, np.ndarray] = {}
+        for prefix, labels in (("out", out_labels), ("in", in_labels)):
+            offsets, hubs, costs = _pack(labels, nodes)
+            arrays[f"{prefix}_offsets"] = offsets
+            arrays[f"{prefix}_hubs"] = hubs
+            arrays[f"{prefix}_costs"] = costs
+
+        out_sizes = np.diff(arrays["out_offsets"])
+        in_sizes = np.diff(arrays["in_offsets"])
+        report = {
+            "metrica": metric,
+            "vertices": len(nodes),
+            "tempo_construcao_s": elapsed,
+            "entradas_saida": int(out_sizes.sum()),
+            "entradas_entrada": int(in_sizes.sum()),
+            "media_rotulo_saida": float(out_sizes.mean()) if len(nodes) else 0.0,
+            "media_rotulo_entrada": float(in_sizes.mean()) if len(nodes) else 0.0,
+            "maior_rotulo": int(max(out_sizes.max(initial=0), in_sizes.max(initial=0))),
+            "bytes": int(sum(array.nbytes for array in arrays.values())),
+        }
+        return cls(nodes, metric, arrays, report)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "LandmarkLabels":
+        directory = Path(directory)
+        with open(directory / "labels.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in ("out_offsets", "out_hubs", "out_costs", "in_offsets", "in_hubs", "in_costs")
+        }
+        return cls(meta["vertices"], meta["metrica"], arrays, meta.get("relatorio"))
+
+    def save(self, directory: str) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, array in self.arrays.items():
+            np.save(directory / f"{name}.npy", np.asarray(array))
+        with open(directory / "labels.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {"metrica": self.metric, "vertices": self.nodes, "relatorio": self.report}, f, ensure_ascii=False
+            )
+
+    def label(self, node: str, direction: str = "out") -> Tuple[List[int], List[float]]:
+        node_id = self.node_ids[node]
+        offsets = self.arrays[f"{direction}_offsets"]
+        start, stop = int(offsets[node_id]), int(offsets[node_id + 1])
+        return (
+            self.arrays[f"{direction}_hubs"][start:stop].tolist(),
+            self.arrays[f"{direction}_costs"][start:stop].tolist(),
+        )
+
+    def query(self, source: str, target: str) -> Tuple[float, Optional[str]]:
+        if source not in self.node_ids or target not in self.node_ids:
+            return INFINITY, None
+        if source == target:
+            return 0.0, source
+        out_hubs, out_costs = self.label(source, "out")
+        in_hubs, in_costs = self.label(target, "in")
+
+        best, hub = INFINITY, None
+        i = j = 0
+        while i < len(out_hubs) and j < len(in_hubs):
+            if out_hubs[i] == in_hubs[j]:
+                total = out_costs[i] + in_costs[j]
+                if total < best:
+                    best, hub = total, out_hubs[i]
+                i += 1
+                j += 1
+            elif out_hubs[i] < in_hubs[j]:
+                i += 1
+            else:
+                j += 1
+        return best, (self.nodes[hub] if hub is not None else None)
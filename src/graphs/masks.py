@@ -0,0 +1,105 @@
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+class SearchMask:
+
+    def __init__(self, num_edges: int = 0, num_nodes: int = 0):
+        self.edge_bits = bytearray(num_edges)
+        self.node_bits = bytearray(num_nodes)
+        self.edges: Set[int] = set()
+        self.nodes: Set[int] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self.edges or self.nodes)
+
+    @staticmethod
+    def _set(bits: bytearray, ids: Set[int], index: int, value: int) -> None:
+        if index >= len(bits):
+            bits.extend(bytes(index + 1 - len(bits)))
+        bits[index] = value
+        if value:
+            ids.add(index)
+        else:
+            ids.discard(index)
+
+    def block_edges(self, edge_ids: Iterable[int]) -> None:
+        for edge_id in edge_ids:
+            self._set(self.edge_bits, self.edges, edge_id, 1)
+
+    def block_nodes(self, node_ids: Iterable[int]) -> None:
+        for node_id in node_ids:
+            self._set(self.node_bits, self.nodes, node_id, 1)
+
+    def unblock_edges(self, edge_ids: Iterable[int]) -> None:
+        for edge_id in edge_ids:
+            if edge_id in self.edges:
+                self._set(self.edge_bits, self.edges, edge_id, 0)
+
+    def unblock_nodes(self, node_ids: Iterable[int]) -> None:
+        for node_id in node_ids:
+            if node_id in self.nodes:
+                self._set(self.node_bits, self.nodes, node_id, 0)
+
+    def clear(self) -> None:
+        for edge_id in self.edges:
+            self.edge_bits[edge_id] = 0
+        for node_id in self.nodes:
+            self.node_bits[node_id] = 0
+        self.edges.clear()
+        self.nodes.clear()
+
+    def edge_blocked(self, edge_id: int) -> bool:
+        return edge_id < len(self.edge_bits) and bool(self.edge_bits[edge_id])
+
+    def node_blocked(self, node_id: int) -> bool:
+        return node_id < len(self.node_bits) and bool(self.node_bits[node_id])
+
+    def signature(self) -> str:
+        return f"{hash((frozenset(self.edges), frozenset(self.nodes))):x}"
+
+
+class MaskedView(Mapping):
+
+    def __init__(
+        self,
+        graph: Mapping,
+        mask: SearchMask,
+        node_ids: Dict[str, int],
+        edge_ids: Optional[Callable[[str], Sequence[int]]] = None,
+    ):
+        self.graph = graph
+        self.mask = mask
+        self.node_ids = node_ids
+        self.edge_ids = edge_ids
+        self.name = f"mask:{mask.signature()}"
+
+    def _node_blocked(self, node: str) -> bool:
+        node_id = self.node_ids.get(node)
+        return node_id is not None and self.mask.node_blocked(node_id)
+
+    def __getitem__(self, node: str) -> List[Tuple[str, float]]:
+        neighbors = self.graph[node]
+        if self.mask.nodes and self._node_blocked(node):
+            return []
+
+        if self.edge_ids is not None and self.mask.edges:
+            bits = self.mask.edge_bits
+            size = len(bits)
+            neighbors = [
+                (neighbor, weight)
+                for (neighbor, weight), edge_id in zip(neighbors, self.edge_ids(node))
+                if edge_id >= size or not bits[edge_id]
+            ]
+        if self.mask.nodes:
+            neighbors = [(neighbor, weight) for neighbor, weight in neighbors if not self._node_blocked(neighbor)]
+        return list(neighbors)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.graph)
+
+    def __len__(self) -> int:
+        return len(self.graph)
+
+    def __contains__(self, node) -> bool:
+        return node in self.graph
@@ -0,0 +1,111 @@
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from graphs.floyd import matrix_path
+
+MATRIX_FORMATS = ("csv", "npy", "jsonl")
+
+
+def _cost(value: float) -> Optional[float]:
+    return None if np.isinf(value) else float(value)
+
+
+@dataclass
+class DistanceTable:
+    sources: List[str]
+    targets: List[str]
+    distances: np.ndarray
+    strategy: str
+    paths: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    predecessors: Optional[np.ndarray] = field(default=None, repr=False)
+    _rows: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _columns: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _tree_rows: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def get(self, source: str, target: str) -> float:
+        return float(self.distances[self.sources.index(source), self.targets.index(target)])
+
+    def positions(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        if len(self._rows) != len(self.sources):
+            self._rows = {source: i for i, source in enumerate(self.sources)}
+        if len(self._columns) != len(self.targets):
+            self._columns = {target: j for j, target in enumerate(self.targets)}
+        return self._rows, self._columns
+
+    def patch_row(
+        self, source: str, distances: Dict[str, float], parents: Dict[str, Optional[str]], nodes: Iterable[str]
+    ) -> int:
+        rows, columns = self.positions()
+        i = rows[source]
+        if self.predecessors is not None and source not in self._tree_rows:
+            nodes = columns
+            self._tree_rows.add(source)
+
+        updated = 0
+        for node in nodes:
+            j = columns.get(node)
+            if j is None:
+                continue
+            self.distances[i, j] = distances.get(node, np.inf)
+            if self.predecessors is not None:
+                parent = parents.get(node)
+                self.predecessors[i, j] = columns.get(parent, -1) if parent is not None else -1
+            updated += 1
+        return updated
+
+    def path(self, source: str, target: str) -> List[str]:
+        if self.predecessors is None:
+            raise ValueError("A matriz não guarda predecessores")
+        path = matrix_path(self.predecessors, self.targets.index(source), self.targets.index(target))
+        return [self.targets[node] for node in path]
+
+    def rows(self) -> Iterator[Tuple[str, str, float, Optional[str]]]:
+        for i, source in enumerate(self.sources):
+            row = self.distances[i].tolist()
+            for j, target in enumerate(self.targets):
+                yield source, target, row[j], self.paths.get((source, target))
+
+    def save(self, output_path: str, fmt: Optional[str] = None) -> str:
+        output_path = Path(output_path)
+        fmt = fmt or output_path.suffix.lstrip(".").lower()
+        if fmt not in MATRIX_FORMATS:
+            raise ValueError(f"Formato de saída desconhecido: {fmt}. Opções: {', '.join(MATRIX_FORMATS)}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if fmt == "npy":
+            np.save(output_path, self.distances)
+            labels_path = output_path.with_suffix(".json")
+            with open(labels_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "origens": self.sources,
+                        "destinos": self.targets,
+                        "estrategia": self.strategy,
+                        "caminhos": [
+                            {"origem": s, "destino": t, "caminho": path} for (s, t), path in self.paths.items()
+                        ],
+                    },
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
+        elif fmt == "csv":
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["origem", "destino", "custo", "caminho"])
+                for source, target, cost, path in self.rows():
+                    writer.writerow([source, target, cost, path or ""])
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                for source, target, cost, path in self.rows():
+                    record = {"origem": source, "destino": target, "custo": _cost(cost)}
+                    if path is not None:
+                        record["caminho"] = path
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        return str(output_path)
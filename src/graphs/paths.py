@@ -0,0 +1,144 @@
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+PathTree = Tuple[Dict[str, float], Dict[str, Optional[str]]]
+
+STRATEGIES = ("auto", "bfs", "dial", "dag", "dijkstra", "bellman_ford")
+DIAL_MAX_WEIGHT = 64
+
+
+@dataclass(frozen=True)
+class WeightStats:
+    edges: int
+    minimum: float
+    maximum: float
+    integral: bool
+    uniform: bool
+    negative: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "arestas": self.edges,
+            "minimo": self.minimum,
+            "maximo": self.maximum,
+            "inteiros": self.integral,
+            "todos_iguais": self.uniform,
+            "negativos": self.negative,
+        }
+
+
+def weight_stats(graph: Mapping) -> WeightStats:
+    edges = 0
+    low = float("inf")
+    high = float("-inf")
+    integral = True
+    for node in graph:
+        for _, weight in graph[node]:
+            edges += 1
+            if weight < low:
+                low = weight
+            if weight > high:
+                high = weight
+            if integral and not float(weight).is_integer():
+                integral = False
+
+    if not edges:
+        return WeightStats(0, 0.0, 0.0, True, True, False)
+    return WeightStats(edges, float(low), float(high), integral, low == high, low < 0)
+
+
+@dataclass
+class ShortestPaths:
+    source: str
+    distances: Dict[str, float]
+    parents: Dict[str, Optional[str]]
+    strategy: str
+    negative_cycle: bool = False
+    stats: Optional[WeightStats] = field(default=None, repr=False)
+
+    def distance(self, target: str) -> float:
+        return self.distances.get(target, float("inf"))
+
+    def path(self, target: str) -> List[str]:
+        if target not in self.parents:
+            return []
+        path = []
+        node: Optional[str] = target
+        while node is not None:
+            path.append(node)
+            node = self.parents[node]
+        return path[::-1]
+
+
+def bfs_paths(graph: Mapping, start: str, weight: float = 1.0) -> PathTree:
+    hops: Dict[str, int] = {start: 0}
+    parents: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor, _ in graph.get(node, ()):
+            if neighbor not in hops:
+                hops[neighbor] = hops[node] + 1
+                parents[neighbor] = node
+                queue.append(neighbor)
+    return {node: count * weight for node, count in hops.items()}, parents
+
+
+def dial_paths(graph: Mapping, start: str, max_weight: int) -> PathTree:
+    size = max_weight + 1
+    buckets: List[List[str]] = [[] for _ in range(size)]
+    distances: Dict[str, int] = {start: 0}
+    parents: Dict[str, Optional[str]] = {start: None}
+    neighbors_of = graph.get
+    known = distances.get
+    buckets[0].append(start)
+    pending = 1
+    current = 0
+
+    while pending:
+        bucket = buckets[current % size]
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+            if distances[node] != current:
+                continue
+            for neighbor, weight in neighbors_of(node, ()):
+                candidate = current + int(weight)
+                previous = known(neighbor)
+                if previous is None or candidate < previous:
+                    distances[neighbor] = candidate
+                    parents[neighbor] = node
+                    buckets[candidate % size].append(neighbor)
+                    pending += 1
+        current += 1
+
+    return {node: float(cost) for node, cost in distances.items()}, parents
+
+
+def bellman_ford_paths(graph: Mapping, start: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]], bool]:
+    distances: Dict[str, float] = {start: 0.0}
+    parents: Dict[str, Optional[str]] = {start: None}
+    relaxations: Dict[str, int] = {start: 0}
+    queue = deque([start])
+    queued = {start}
+    limit = len(graph)
+
+    while queue:
+        node = queue.popleft()
+        queued.discard(node)
+        base = distances[node]
+        for neighbor, weight in graph.get(node, ()):
+            candidate = base + weight
+            if neighbor not in distances or candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                parents[neighbor] = node
+                relaxations[neighbor] = relaxations[node] + 1
+                if relaxations[neighbor] >= limit:
+                    return distances, parents, True
+                if neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+
+    return distances, parents, False
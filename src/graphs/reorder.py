@@ -0,0 +1,130 @@
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from graphs.csr import CSRGraph
+
+
+def _symmetric_csr(csr: CSRGraph) -> Tuple[np.ndarray, np.ndarray]:
+    n = csr.num_nodes()
+    rows = np.repeat(np.arange(n, dtype=np.int64), csr.out_degrees())
+    columns = csr.indices.astype(np.int64)
+    keep = rows != columns
+    pairs = np.unique(
+        np.concatenate([rows[keep] * n + columns[keep], columns[keep] * n + rows[keep]])
+    )
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs // n, minlength=n), out=indptr[1:])
+    return indptr, pairs % n
+
+
+def _sort_rows_by_degree(indptr: np.ndarray, indices: np.ndarray, degrees: np.ndarray) -> np.ndarray:
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    return indices[np.lexsort((indices, degrees[indices], rows))]
+
+
+def _level_order(
+    indptr: np.ndarray, indices: np.ndarray, roots, visited: np.ndarray, peripheral=None
+) -> List[int]:
+    order: List[int] = []
+    for root in roots:
+        if visited[root]:
+            continue
+        if peripheral is not None:
+            root = peripheral(root)
+        visited[root] = True
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            neighbors = indices[indptr[u]:indptr[u + 1]]
+            fresh = neighbors[~visited[neighbors]]
+            visited[fresh] = True
+            queue.extend(fresh.tolist())
+    return order
+
+
+def degree_order(csr: CSRGraph) -> np.ndarray:
+    indptr, _ = _symmetric_csr(csr)
+    return np.argsort(-np.diff(indptr), kind="stable")
+
+
+def bfs_order(csr: CSRGraph, start: Optional[str] = None) -> np.ndarray:
+    indptr, indices = _symmetric_csr(csr)
+    roots = np.argsort(-np.diff(indptr), kind="stable").tolist()
+    if start is not None and start in csr.index:
+        roots.insert(0, csr.index[start])
+
+    visited = np.zeros(csr.num_nodes(), dtype=bool)
+    return np.array(_level_order(indptr, indices, roots, visited), dtype=np.int64)
+
+
+def reverse_cuthill_mckee(csr: CSRGraph) -> np.ndarray:
+    indptr, indices = _symmetric_csr(csr)
+    degrees = np.diff(indptr)
+    indices = _sort_rows_by_degree(indptr, indices, degrees)
+
+    roots = np.argsort(degrees, kind="stable").tolist()
+    visited = np.zeros(csr.num_nodes(), dtype=bool)
+    peripheral = lambda root: _pseudo_peripheral_node(root, indptr, indices, degrees)
+    order = _level_order(indptr, indices, roots, visited, peripheral)
+    return np.array(order[::-1], dtype=np.int64)
+
+
+def _pseudo_peripheral_node(root: int, indptr: np.ndarray, indices: np.ndarray, degrees: np.ndarray) -> int:
+    eccentricity = -1
+    levels = np.full(len(degrees), -1, dtype=np.int64)
+    while True:
+        levels.fill(-1)
+        levels[root] = 0
+        frontier = np.array([root], dtype=np.int64)
+        last_level = frontier
+        height = 0
+        while frontier.size:
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            reached = indices[positions]
+            frontier = np.unique(reached[levels[reached] < 0])
+            if frontier.size:
+                height += 1
+                levels[frontier] = height
+                last_level = frontier
+        if height <= eccentricity:
+            return root
+        eccentricity = height
+        candidate = int(last_level[np.argmin(degrees[last_level])])
+        if candidate == root:
+            return root
+        root = candidate
+
+
+ORDERINGS: Dict[str, Callable[[CSRGraph], np.ndarray]] = {
+    "original": lambda csr: np.arange(csr.num_nodes(), dtype=np.int64),
+    "rcm": reverse_cuthill_mckee,
+    "degree": degree_order,
+    "bfs": bfs_order,
+}
+
+
+def reorder(csr: CSRGraph, method: str = "rcm") -> CSRGraph:
+    if method not in ORDERINGS:
+        raise ValueError(
+            f"Ordenação desconhecida: {method}. Opções: {', '.join(ORDERINGS)}"
+        )
+    return csr.relabel(ORDERINGS[method](csr))
+
+
+def edge_span(csr: CSRGraph) -> float:
+    if csr.num_edges() == 0:
+        return 0.0
+    rows = np.repeat(np.arange(csr.num_nodes(), dtype=np.int64), csr.out_degrees())
+    return float(np.abs(rows - csr.indices).mean())
+
+
+def bandwidth(csr: CSRGraph) -> int:
+    if csr.num_edges() == 0:
+        return 0
+    rows = np.repeat(np.arange(csr.num_nodes(), dtype=np.int64), csr.out_degrees())
+    return int(np.abs(rows - csr.indices).max())
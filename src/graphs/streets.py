@@ -0,0 +1,155 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.resolver import fold_name
+
+STREET_ABBREVIATIONS: Dict[str, str] = {
+    "av": "avenida",
+    "r": "rua",
+    "pte": "ponte",
+    "estr": "estrada",
+    "dr": "doutor",
+    "prof": "professor",
+    "gov": "governador",
+    "gen": "general",
+    "cel": "coronel",
+    "cap": "capitao",
+    "mal": "marechal",
+    "pref": "prefeito",
+}
+
+
+def normalize_street(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    tokens = re.split(r"[^\w]+", fold_name(text))
+    return " ".join(STREET_ABBREVIATIONS.get(token, token) for token in tokens if token)
+
+
+@dataclass
+class StreetEdge:
+    edge_id: int
+    origem: str
+    destino: str
+    logradouro: str
+    observacao: str
+    peso: float
+
+    def to_dict(self) -> dict:
+        return {
+            "origem": self.origem,
+            "destino": self.destino,
+            "logradouro": self.logradouro,
+            "observacao": self.observacao,
+            "peso": self.peso,
+        }
+
+
+class StreetIndex:
+
+    def __init__(self):
+        self.edges: List[StreetEdge] = []
+        self.streets: Dict[str, List[int]] = {}
+        self.pairs: Dict[Tuple[str, str], List[int]] = {}
+        self.street_tokens: Dict[str, Set[int]] = {}
+        self.note_tokens: Dict[str, Set[int]] = {}
+        self._street_keys: List[str] = []
+        self._note_keys: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def add(
+        self, origem: str, destino: str, logradouro: str, observacao: str, peso: float
+    ) -> int:
+        edge_id = len(self.edges)
+        logradouro = (logradouro or "").strip()
+        observacao = (observacao or "").strip()
+        self.edges.append(StreetEdge(edge_id, origem, destino, logradouro, observacao, peso))
+
+        street_key = normalize_street(logradouro)
+        note_key = normalize_street(observacao)
+        self._street_keys.append(street_key)
+        self._note_keys.append(note_key)
+
+        if street_key:
+            self.streets.setdefault(street_key, []).append(edge_id)
+        for token in street_key.split():
+            self.street_tokens.setdefault(token, set()).add(edge_id)
+        for token in note_key.split():
+            self.note_tokens.setdefault(token, set()).add(edge_id)
+
+        self.pairs.setdefault(self._pair(origem, destino), []).append(edge_id)
+        return edge_id
+
+    def remove(self, edge_id: int) -> None:
+        edge = self.edges[edge_id]
+        street_key = self._street_keys[edge_id]
+        if edge_id in self.streets.get(street_key, ()):
+            self.streets[street_key].remove(edge_id)
+            if not self.streets[street_key]:
+                del self.streets[street_key]
+        for token in street_key.split():
+            self.street_tokens.get(token, set()).discard(edge_id)
+        for token in self._note_keys[edge_id].split():
+            self.note_tokens.get(token, set()).discard(edge_id)
+
+        pair = self._pair(edge.origem, edge.destino)
+        if edge_id in self.pairs.get(pair, ()):
+            self.pairs[pair].remove(edge_id)
+            if not self.pairs[pair]:
+                del self.pairs[pair]
+
+    @staticmethod
+    def _pair(first: str, second: str) -> Tuple[str, str]:
+        return (first, second) if first <= second else (second, first)
+
+    def _phrase_matches(self, query: str, tokens: Dict[str, Set[int]], keys: List[str]) -> Set[int]:
+        words = query.split()
+        if not words:
+            return set()
+        candidates = set(tokens.get(words[0], ()))
+        for word in words[1:]:
+            candidates &= tokens.get(word, set())
+        padded = f" {query} "
+        return {edge_id for edge_id in candidates if padded in f" {keys[edge_id]} "}
+
+    def lookup(self, street: str, include_notes: bool = False) -> List[StreetEdge]:
+        query = normalize_street(street)
+        if query in self.streets:
+            edge_ids = set(self.streets[query])
+        else:
+            edge_ids = self._phrase_matches(query, self.street_tokens, self._street_keys)
+
+        if include_notes:
+            edge_ids |= self._phrase_matches(query, self.note_tokens, self._note_keys)
+
+        return [self.edges[edge_id] for edge_id in sorted(edge_ids)]
+
+    def between(self, first: str, second: str) -> List[StreetEdge]:
+        edge_ids = self.pairs.get(self._pair(first, second), [])
+        return sorted((self.edges[edge_id] for edge_id in edge_ids), key=lambda e: e.peso)
+
+    def path_streets(
+        self,
+        path: List[str],
+        blocked: Optional[Callable[[int], bool]] = None,
+        preferred: Iterable[int] = (),
+    ) -> List[Dict]:
+        preferred = set(preferred)
+        hops = []
+        for first, second in zip(path, path[1:]):
+            edges = [
+                edge for edge in self.between(first, second) if blocked is None or not blocked(edge.edge_id)
+            ]
+            chosen = [edge for edge in edges if edge.edge_id in preferred] or edges
+            edge = chosen[0] if chosen else None
+            hops.append(
+                {
+                    "origem": first,
+                    "destino": second,
+                    "logradouros": [edge.logradouro] if edge is not None and edge.logradouro else [],
+                }
+            )
+        return hops
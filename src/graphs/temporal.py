@@ -0,0 +1,200 @@
+import csv
+import json
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from graphs.csr import CSRGraph
+from graphs.graph import Graph
+
+EDGE_DTYPE = np.dtype(
+    [("source", np.int32), ("target", np.int32), ("weight", np.float64), ("time", np.int64)]
+)
+
+
+class TemporalEdgeIndex:
+
+    def __init__(self, nodes: List[str], edges: np.ndarray):
+        self.nodes = nodes
+        self.node_ids: Dict[str, int] = {node: i for i, node in enumerate(nodes)}
+        self.edges = edges
+        self.sources = edges["source"]
+        self.targets = edges["target"]
+        self.weights = edges["weight"]
+        self.times = edges["time"]
+
+    @classmethod
+    def from_csv(cls, file_path: str) -> "TemporalEdgeIndex":
+        nodes: List[str] = []
+        node_ids: Dict[str, int] = {}
+        rows: List[Tuple[int, int, float, int]] = []
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            next(reader)
+            for row in reader:
+                if len(row) < 4:
+                    continue
+                ids = []
+                for node in (row[0].strip(), row[1].strip()):
+                    if node not in node_ids:
+                        node_ids[node] = len(nodes)
+                        nodes.append(node)
+                    ids.append(node_ids[node])
+                rows.append((ids[0], ids[1], float(row[2]), int(row[3])))
+
+        edges = np.array(rows, dtype=EDGE_DTYPE)
+        edges = edges[np.argsort(edges["time"], kind="stable")]
+        return cls(nodes, edges)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "TemporalEdgeIndex":
+        directory = Path(directory)
+        with open(directory / "nodes.json", "r", encoding="utf-8") as f:
+            nodes = json.load(f)
+        edges = np.load(directory / "edges.npy", mmap_mode="r" if mmap else None)
+        return cls(nodes, edges)
+
+    @classmethod
+    def cached(cls, file_path: str, directory: str) -> "TemporalEdgeIndex":
+        cache = Path(directory)
+        source = Path(file_path)
+        edges_path = cache / "edges.npy"
+        if not edges_path.exists() or edges_path.stat().st_mtime < source.stat().st_mtime:
+            cls.from_csv(file_path).save(directory)
+        return cls.load(directory, mmap=True)
+
+    def save(self, directory: str) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "edges.npy", np.asarray(self.edges))
+        with open(directory / "nodes.json", "w", encoding="utf-8") as f:
+            json.dump(self.nodes, f, ensure_ascii=False)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def time_range(self) -> Tuple[int, int]:
+        if len(self) == 0:
+            return 0, 0
+        return int(self.times[0]), int(self.times[-1])
+
+    def window_bounds(self, t0: int, t1: int) -> Tuple[int, int]:
+        lo = int(np.searchsorted(self.times, t0, side="left"))
+        hi = int(np.searchsorted(self.times, t1, side="left"))
+        return lo, max(lo, hi)
+
+    def window_graph(self, t0: int, t1: int) -> Dict[str, List[Tuple[str, float]]]:
+        lo, hi = self.window_bounds(t0, t1)
+        graph: Dict[str, List[Tuple[str, float]]] = {}
+        nodes = self.nodes
+        for source, target, weight in zip(
+            self.sources[lo:hi].tolist(), self.targets[lo:hi].tolist(), self.weights[lo:hi].tolist()
+        ):
+            source, target = nodes[source], nodes[target]
+            if source not in graph:
+                graph[source] = []
+            if target not in graph:
+                graph[target] = []
+            graph[source].append((target, weight))
+        return graph
+
+    def window_csr(self, t0: int, t1: int) -> CSRGraph:
+        lo, hi = self.window_bounds(t0, t1)
+        sources = np.asarray(self.sources[lo:hi], dtype=np.int64)
+        targets = np.asarray(self.targets[lo:hi], dtype=np.int64)
+
+        active = np.unique(np.concatenate([sources, targets]))
+        local = np.full(len(self.nodes), -1, dtype=np.int64)
+        local[active] = np.arange(len(active))
+
+        order = np.argsort(local[sources], kind="stable")
+        counts = np.bincount(local[sources], minlength=len(active))
+        indptr = np.zeros(len(active) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return CSRGraph(
+            [self.nodes[node] for node in active.tolist()],
+            indptr,
+            local[targets][order],
+            np.asarray(self.weights[lo:hi])[order],
+            np.arange(lo, hi, dtype=np.int64)[order],
+            directed=True,
+        )
+
+    def window_graph_obj(self, t0: int, t1: int) -> Graph:
+        lo, hi = self.window_bounds(t0, t1)
+        graph = Graph()
+        nodes = self.nodes
+        for source, target, weight, time in zip(
+            self.sources[lo:hi].tolist(),
+            self.targets[lo:hi].tolist(),
+            self.weights[lo:hi].tolist(),
+            self.times[lo:hi].tolist(),
+        ):
+            graph.add_edge(nodes[source], nodes[target], weight, timestamp=time)
+        return graph
+
+    def sliding_windows(
+        self, width: int, step: int, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Iterator[Tuple[int, int, "SlidingWindow"]]:
+        if width <= 0 or step <= 0:
+            raise ValueError("Largura e passo da janela devem ser positivos")
+
+        first, last = self.time_range()
+        t0 = first if start is None else start
+        end = last + 1 if end is None else end
+
+        window = SlidingWindow(self)
+        while t0 < end:
+            t1 = min(t0 + width, end)
+            window.advance_to(t0, t1)
+            yield t0, t1, window
+            t0 += step
+
+
+class SlidingWindow:
+
+    def __init__(self, index: TemporalEdgeIndex):
+        self.index = index
+        self.lo = 0
+        self.hi = 0
+        self.adjacency: Dict[str, Deque[Tuple[str, float]]] = {}
+        self._incidence: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self.hi - self.lo
+
+    def _touch(self, node: str, delta: int) -> None:
+        count = self._incidence.get(node, 0) + delta
+        if count:
+            self._incidence[node] = count
+            if node not in self.adjacency:
+                self.adjacency[node] = deque()
+        else:
+            del self._incidence[node]
+            del self.adjacency[node]
+
+    def advance_to(self, t0: int, t1: int) -> None:
+        new_lo, new_hi = self.index.window_bounds(t0, t1)
+        if new_lo < self.lo or new_hi < self.hi:
+            raise ValueError("A janela deslizante só pode avançar no tempo")
+
+        nodes = self.index.nodes
+        sources, targets, weights = self.index.sources, self.index.targets, self.index.weights
+
+        for position in range(max(self.hi, new_lo), new_hi):
+            source, target = nodes[sources[position]], nodes[targets[position]]
+            self._touch(source, 1)
+            self._touch(target, 1)
+            self.adjacency[source].append((target, float(weights[position])))
+
+        for position in range(self.lo, min(new_lo, self.hi)):
+            source, target = nodes[sources[position]], nodes[targets[position]]
+            self.adjacency[source].popleft()
+            self._touch(source, -1)
+            self._touch(target, -1)
+
+        self.lo, self.hi = new_lo, new_hi
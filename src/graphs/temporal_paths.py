@@ -0,0 +1,156 @@
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from graphs.temporal import TemporalEdgeIndex
+
+INFINITY = np.iinfo(np.int64).max
+
+
+class TemporalPaths:
+
+    def __init__(self, index: TemporalEdgeIndex, duration: int = 1, chunk_size: int = 65536):
+        if duration <= 0:
+            raise ValueError("A duração de cada aresta deve ser positiva")
+        self.index = index
+        self.duration = duration
+        self.chunk_size = chunk_size
+
+    def _bounds(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        first, last = self.index.time_range()
+        start = first if start is None else start
+        end = last + self.duration if end is None else end
+        return start, end
+
+    def _stream(self, start: int, end: int, reverse: bool = False) -> Iterator[Tuple[int, int, int]]:
+        lo, hi = self.index.window_bounds(start, end - self.duration + 1)
+        offsets = range(lo, hi, self.chunk_size)
+        if reverse:
+            offsets = reversed(offsets)
+
+        for offset in offsets:
+            chunk = self.index.edges[offset : min(offset + self.chunk_size, hi)]
+            rows = zip(
+                chunk["source"].tolist(), chunk["target"].tolist(), chunk["time"].tolist()
+            )
+            if reverse:
+                rows = reversed(list(rows))
+            yield from rows
+
+    def earliest_arrival(
+        self, source: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Tuple[Dict[str, int], Dict[str, Tuple[str, int]]]:
+        if source not in self.index.node_ids:
+            return {}, {}
+
+        start, end = self._bounds(start, end)
+        origin = self.index.node_ids[source]
+        arrival = {origin: start}
+        parents: Dict[int, Tuple[int, int]] = {}
+
+        for u, v, t in self._stream(start, end):
+            if t >= arrival.get(u, INFINITY):
+                reached = t + self.duration
+                if reached < arrival.get(v, INFINITY):
+                    arrival[v] = reached
+                    parents[v] = (u, t)
+
+        nodes = self.index.nodes
+        return (
+            {nodes[v]: time for v, time in arrival.items()},
+            {nodes[v]: (nodes[u], t) for v, (u, t) in parents.items()},
+        )
+
+    def latest_departure(
+        self, target: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Dict[str, int]:
+        if target not in self.index.node_ids:
+            return {}
+
+        start, end = self._bounds(start, end)
+        destination = self.index.node_ids[target]
+        departure = {destination: end}
+
+        for u, v, t in self._stream(start, end, reverse=True):
+            if t + self.duration <= departure.get(v, -INFINITY) and t > departure.get(u, -INFINITY):
+                departure[u] = t
+
+        nodes = self.index.nodes
+        return {nodes[u]: time for u, time in departure.items()}
+
+    def fastest(
+        self, source: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Dict[str, Tuple[int, int]]:
+        if source not in self.index.node_ids:
+            return {}
+
+        start, end = self._bounds(start, end)
+        origin = self.index.node_ids[source]
+        starts: Dict[int, List[int]] = {}
+        arrivals: Dict[int, List[int]] = {}
+        best: Dict[int, Tuple[int, int]] = {origin: (start, start)}
+
+        for u, v, t in self._stream(start, end):
+            if u == origin:
+                self._insert(starts, arrivals, origin, t, t)
+
+            position = bisect_right(arrivals.get(u, ()), t) - 1
+            if position < 0:
+                continue
+
+            departure = starts[u][position]
+            reached = t + self.duration
+            if v != origin and self._insert(starts, arrivals, v, departure, reached):
+                current = best.get(v)
+                if current is None or reached - departure < current[1] - current[0]:
+                    best[v] = (departure, reached)
+
+        nodes = self.index.nodes
+        return {nodes[v]: pair for v, pair in best.items()}
+
+    @staticmethod
+    def _insert(
+        starts: Dict[int, List[int]], arrivals: Dict[int, List[int]], node: int, departure: int, reached: int
+    ) -> bool:
+        node_starts = starts.setdefault(node, [])
+        node_arrivals = arrivals.setdefault(node, [])
+        if node_starts and node_starts[-1] >= departure:
+            return False
+        if node_arrivals and node_arrivals[-1] == reached:
+            node_starts[-1] = departure
+        else:
+            node_starts.append(departure)
+            node_arrivals.append(reached)
+        return True
+
+    def earliest_arrival_batch(
+        self, sources: Iterable[str], start: Optional[int] = None, end: Optional[int] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        sources = [source for source in sources if source in self.index.node_ids]
+        start, end = self._bounds(start, end)
+
+        arrival = np.full((len(self.index.nodes), len(sources)), INFINITY, dtype=np.int64)
+        columns = np.arange(len(sources))
+        arrival[[self.index.node_ids[source] for source in sources], columns] = start
+
+        for u, v, t in self._stream(start, end):
+            reached = np.where(arrival[u] <= t, t + self.duration, INFINITY)
+            np.minimum(arrival[v], reached, out=arrival[v])
+
+        return sources, arrival.T
+
+    @staticmethod
+    def build_path(
+        parents: Dict[str, Tuple[str, int]], source: str, target: str
+    ) -> List[Tuple[str, str, int]]:
+        if target != source and target not in parents:
+            return []
+
+        hops = []
+        node = target
+        while node != source:
+            previous, departure = parents[node]
+            hops.append((previous, node, departure))
+            node = previous
+        return hops[::-1]
@@ -0,0 +1,115 @@
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class WeightTransform:
+
+    def __init__(
+        self,
+        name: str,
+        scalar: Callable[[float], float],
+        vector: Callable[[np.ndarray], np.ndarray],
+    ):
+        self.name = name
+        self.scalar = scalar
+        self.vector = vector
+
+    def __call__(self, weight: float) -> float:
+        return self.scalar(weight)
+
+    def __repr__(self) -> str:
+        return f"WeightTransform({self.name})"
+
+
+IDENTITY = WeightTransform("identity", lambda w: w, lambda a: a)
+ABSOLUTE = WeightTransform("abs", abs, np.abs)
+INVERSE_TRUST = WeightTransform("inverse_trust", lambda w: 11 - w, lambda a: 11 - a)
+
+
+def shift(constant: float) -> WeightTransform:
+    return WeightTransform(f"shift({constant})", lambda w: w + constant, lambda a: a + constant)
+
+
+def clip(lower: Optional[float] = None, upper: Optional[float] = None) -> WeightTransform:
+    low = float("-inf") if lower is None else lower
+    high = float("inf") if upper is None else upper
+    return WeightTransform(
+        f"clip({lower},{upper})", lambda w: min(max(w, low), high), lambda a: np.clip(a, low, high)
+    )
+
+
+WEIGHT_TRANSFORMS: Dict[str, WeightTransform] = {
+    transform.name: transform for transform in (IDENTITY, ABSOLUTE, INVERSE_TRUST)
+}
+
+
+def get_transform(spec) -> WeightTransform:
+    if isinstance(spec, WeightTransform):
+        return spec
+    if spec is None:
+        return IDENTITY
+    if spec in WEIGHT_TRANSFORMS:
+        return WEIGHT_TRANSFORMS[spec]
+    if spec.startswith("shift:"):
+        return shift(float(spec.split(":", 1)[1]))
+    if spec.startswith("clip:"):
+        lower, upper = (float(value) if value else None for value in spec.split(":", 1)[1].split(","))
+        return clip(lower, upper)
+    raise ValueError(
+        f"Transformação de peso desconhecida: {spec}. "
+        f"Opções: {', '.join(WEIGHT_TRANSFORMS)}, shift:<c>, clip:<min>,<max>"
+    )
+
+
+class WeightedView(Mapping):
+
+    def __init__(
+        self,
+        graph: Mapping,
+        transform: WeightTransform,
+        cache: bool = False,
+    ):
+        self.graph = graph
+        self.transform = transform
+        self.name = transform.name
+        self._cache: Optional[Dict[str, List[Tuple[str, float]]]] = {} if cache else None
+
+    def __getitem__(self, node: str) -> List[Tuple[str, float]]:
+        if self._cache is not None and node in self._cache:
+            return self._cache[node]
+        scalar = self.transform.scalar
+        neighbors = [(neighbor, scalar(weight)) for neighbor, weight in self.graph[node]]
+        if self._cache is not None:
+            self._cache[node] = neighbors
+        return neighbors
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.graph)
+
+    def __len__(self) -> int:
+        return len(self.graph)
+
+    def __contains__(self, node) -> bool:
+        return node in self.graph
+
+
+class UndirectedView(Mapping):
+
+    def __init__(self, graph: Mapping, reverse: Mapping):
+        self.graph = graph
+        self.reverse = reverse
+        self.name = "undirected"
+
+    def __getitem__(self, node: str) -> List[Tuple[str, float]]:
+        return list(self.graph.get(node, ())) + list(self.reverse.get(node, ()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.graph)
+
+    def __len__(self) -> int:
+        return len(self.graph)
+
+    def __contains__(self, node) -> bool:
+        return node in self.graph
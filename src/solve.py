@@ -3,7 +3,9 @@ import json
 import pandas as pd
 from pathlib import Path
 from graphs.graph import Graph
-from utils.normalize import normalize_name
+from graphs.algorithms import Algorithms
+from graphs.connectivity import biconnectivity
+from utils.normalize import normalize_series
 from typing import Dict, List, Set, Optional
 
 from constants import (
@@ -12,8 +14,10 @@ from constants import (
     OUT_DIR,
     RECIFE_GLOBAL_PATH,
     MICRORREGIOES_PATH,
+    VORONOI_HUBS_PATH,
     EGO_BAIRRO_PATH,
     GRAUS_PATH,
+    CONECTIVIDADE_PATH,
 )
 
 class GraphAnalyzer:
@@ -28,8 +32,8 @@ class GraphAnalyzer:
         filepath = filepath or self.adjacencies_path
         df = pd.read_csv(filepath, encoding="utf-8")
 
-        df["bairro_origem"] = df["bairro_origem"].apply(normalize_name)
-        df["bairro_destino"] = df["bairro_destino"].apply(normalize_name)
+        df["bairro_origem"] = normalize_series(df["bairro_origem"])
+        df["bairro_destino"] = normalize_series(df["bairro_destino"])
 
         df = df.dropna(subset=["bairro_origem", "bairro_destino"])
 
@@ -38,7 +42,7 @@ class GraphAnalyzer:
     def load_neighborhoods_microregions(self, filepath: Optional[str] = None) -> Dict[str, str]:
         filepath = filepath or self.neighborhoods_path
         df = pd.read_csv(filepath, encoding="utf-8")
-        df["bairro"] = df["bairro"].apply(normalize_name)
+        df["bairro"] = normalize_series(df["bairro"])
         df = df.drop_duplicates(subset=["bairro"], keep="first")
 
         mapping = dict(zip(df["bairro"], df["microrregiao"]))
@@ -62,7 +66,12 @@ class GraphAnalyzer:
             else:
                 peso = float(peso)
 
-            graph.add_edge(origem, destino, peso)
+            logradouro = row.get("logradouro", "")
+            logradouro = "" if pd.isna(logradouro) else str(logradouro)
+            observacao = row.get("observacao", "")
+            observacao = "" if pd.isna(observacao) else str(observacao)
+
+            graph.add_edge(origem, destino, peso, logradouro, observacao)
 
         self.graph = graph
         return graph
@@ -156,7 +165,44 @@ class GraphAnalyzer:
         results.sort(key=lambda x: x["grau"], reverse=True)
         return results
 
-    def save_results(self, global_metrics: Dict, microregion_metrics: List[Dict], ego_metrics: List[Dict], rank_metrics: List[Dict], output_dir: str = OUT_DIR) -> None:
+    def compute_connectivity(self, graph: Optional[Graph] = None) -> Dict:
+        graph = graph or self.graph
+        if graph is None:
+            raise ValueError("Grafo não foi construído. Execute build_graph() primeiro.")
+
+        result = biconnectivity(sorted(graph.get_vertices()), graph.incident_edges)
+        bridges = []
+        for first, second, edge_id in result["pontes"]:
+            edge = graph.edges.get(edge_id)
+            bridges.append(
+                {
+                    "origem": first,
+                    "destino": second,
+                    "logradouro": edge["logradouro"],
+                    "peso": edge["weight"],
+                }
+            )
+
+        return {
+            "total_articulacoes": len(result["articulacoes"]),
+            "total_pontes": len(bridges),
+            "total_componentes_biconexos": len(result["componentes_biconexos"]),
+            "articulacoes": [
+                {"bairro": bairro, "grau": graph.get_degree(bairro)} for bairro in result["articulacoes"]
+            ],
+            "pontes": bridges,
+            "componentes_biconexos": result["componentes_biconexos"],
+        }
+
+    def compute_hub_voronoi(self, graph: Optional[Graph] = None, hubs: int = 5) -> Dict:
+        graph = graph or self.graph
+        if graph is None:
+            raise ValueError("Grafo não foi construído. Execute build_graph() primeiro.")
+
+        centers = [row["bairro"] for row in self.ranking_degree(graph)[:hubs]]
+        return Algorithms().voronoi_cells(centers, graph.cost_view())
+
+    def save_results(self, global_metrics: Dict, microregion_metrics: List[Dict], ego_metrics: List[Dict], rank_metrics: List[Dict], output_dir: str = OUT_DIR, voronoi: Optional[Dict] = None, connectivity: Optional[Dict] = None) -> None:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
         global_path = Path(RECIFE_GLOBAL_PATH)
@@ -169,6 +215,12 @@ class GraphAnalyzer:
         with open(microregion_path, "w", encoding="utf-8") as f:
             json.dump(microregion_metrics, f, indent=2, ensure_ascii=False)
 
+        if voronoi is not None:
+            voronoi_path = Path(VORONOI_HUBS_PATH)
+            voronoi_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(voronoi_path, "w", encoding="utf-8") as f:
+                json.dump(voronoi, f, indent=2, ensure_ascii=False)
+
         ego_path = Path(EGO_BAIRRO_PATH)
         ego_path.parent.mkdir(parents=True, exist_ok=True)
         with open(ego_path, "w", encoding="utf-8", newline="") as f:
@@ -186,6 +238,12 @@ class GraphAnalyzer:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(rank_metrics)
+
+        if connectivity is not None:
+            connectivity_path = Path(CONECTIVIDADE_PATH)
+            connectivity_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(connectivity_path, "w", encoding="utf-8") as f:
+                json.dump(connectivity, f, indent=2, ensure_ascii=False)
                 
         print(f"✓ Resultados salvos em {output_dir}/")
 
@@ -202,9 +260,13 @@ class GraphAnalyzer:
         microregion_metrics = self.compute_microregion_metrics()
         ego_metrics = self.compute_ego_metrics()
         ranking = self.ranking_degree()
+        voronoi = self.compute_hub_voronoi()
+        connectivity = self.compute_connectivity()
 
         print("Salvando resultados...")
-        self.save_results(global_metrics, microregion_metrics, ego_metrics, ranking)
+        self.save_results(
+            global_metrics, microregion_metrics, ego_metrics, ranking, voronoi=voronoi, connectivity=connectivity
+        )
         print("✓ Análise completa!")
 
 def main():
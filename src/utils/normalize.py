@@ -1,9 +1,45 @@
-from typing import Optional
+import sys
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
+NAME_ALIASES: Dict[str, str] = {
+    "Setúbal": "Boa Viagem (Setúbal)",
+}
+
+NAME_TABLE: Dict[str, str] = {}
+
+
+def _canonical(name: str) -> str:
+    name = " ".join(name.strip().title().split())
+    name = NAME_ALIASES.get(name, name)
+    return sys.intern(name)
+
+
 def normalize_name(name: str) -> Optional[str]:
-    if pd.isna(name) or name is None:
+    if name is None or pd.isna(name):
         return None
 
-    name = str(name).strip()
-    return " ".join(name.title().split())
\ No newline at end of file
+    name = str(name)
+    canonical = NAME_TABLE.get(name)
+    if canonical is None:
+        canonical = _canonical(name)
+        NAME_TABLE[name] = canonical
+    return canonical
+
+
+def normalize_series(series: pd.Series) -> pd.Series:
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, dtype=object).astype(str)
+
+    pending = ~uniques.isin(NAME_TABLE.keys())
+    if pending.any():
+        raw = uniques[pending]
+        normalized = (
+            raw.str.strip().str.title().str.split().str.join(" ").replace(NAME_ALIASES)
+        )
+        for key, value in zip(raw, normalized):
+            NAME_TABLE[key] = sys.intern(value)
+
+    table = np.array([NAME_TABLE[key] for key in uniques] + [None], dtype=object)
+    return pd.Series(table[codes], index=series.index, name=series.name)
@@ -0,0 +1,85 @@
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def fold_name(name: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", str(name))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class NameResolver:
+
+    def __init__(self, names: Iterable[str], min_score: float = 0.5, aliases: Optional[Dict[str, str]] = None):
+        self.min_score = min_score
+        self.names: List[str] = []
+        self.keys: List[str] = []
+        self.exact: Dict[str, int] = {}
+        self.folded: Dict[str, int] = {}
+        self.grams: List[Set[str]] = []
+        self.index: Dict[str, List[int]] = {}
+
+        for name in names:
+            if name in self.exact:
+                continue
+            name_id = len(self.names)
+            key = fold_name(name)
+            self.names.append(name)
+            self.keys.append(key)
+            self.exact[name] = name_id
+            self.folded.setdefault(key, name_id)
+
+            grams = trigrams(key)
+            self.grams.append(grams)
+            for gram in grams:
+                self.index.setdefault(gram, []).append(name_id)
+
+        for alias, name in (aliases or {}).items():
+            if name in self.exact:
+                self.folded.setdefault(fold_name(alias), self.exact[name])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def suggest(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        key = fold_name(query)
+        query_grams = trigrams(key)
+        if not query_grams:
+            return []
+
+        shared: Counter = Counter()
+        for gram in query_grams:
+            shared.update(self.index.get(gram, ()))
+
+        scored = []
+        for name_id, count in shared.items():
+            score = 2 * count / (len(query_grams) + len(self.grams[name_id]))
+            if self.keys[name_id].startswith(key):
+                score = max(score, 0.9)
+            scored.append((score, self.names[name_id]))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(name, round(score, 4)) for score, name in scored[:limit]]
+
+    def resolve(self, query: str, fuzzy: bool = True) -> Optional[str]:
+        if query in self.exact:
+            return query
+
+        name_id = self.folded.get(fold_name(query))
+        if name_id is not None:
+            return self.names[name_id]
+        if not fuzzy:
+            return None
+
+        suggestions = self.suggest(query, limit=2)
+        if not suggestions or suggestions[0][1] < self.min_score:
+            return None
+        if len(suggestions) > 1 and suggestions[1][1] == suggestions[0][1]:
+            return None
+        return suggestions[0][0]
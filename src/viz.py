@@ -1,7 +1,7 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
-from utils.normalize import normalize_name
+from utils.normalize import normalize_series
 from pyvis.network import Network
 import re
 
@@ -36,8 +36,8 @@ class GraphVisualizer:
         ego_df = pd.read_csv(ego_path)
         bairros_df = pd.read_csv(bairros_path)
 
-        bairros_df["bairro"] = bairros_df["bairro"].apply(normalize_name)
-        ego_df["bairro"] = ego_df["bairro"].apply(normalize_name)
+        bairros_df["bairro"] = normalize_series(bairros_df["bairro"])
+        ego_df["bairro"] = normalize_series(ego_df["bairro"])
 
         merged = ego_df.merge(bairros_df, on="bairro", how="left")
 
@@ -389,8 +389,8 @@ class GraphVisualizer:
         ego_df = pd.read_csv(ego_path)
         bairros_df = pd.read_csv(bairros_path)
 
-        ego_df["bairro"] = ego_df["bairro"].apply(normalize_name)
-        bairros_df["bairro"] = bairros_df["bairro"].apply(normalize_name)
+        ego_df["bairro"] = normalize_series(ego_df["bairro"])
+        bairros_df["bairro"] = normalize_series(bairros_df["bairro"])
 
         merged = ego_df.merge(bairros_df, on="bairro", how="left")
 
@@ -650,6 +650,7 @@ def generate_dijkstra_section(dijkstra_data: dict) -> str:
                                 <th>Peso</th>
                                 <th>Comprimento do Caminho</th>
                                 <th>Encontrado?</th>
+                                <th>Estratégia</th>
                                 <th>Tempo (s)</th>
                                 <th>Memória Pico (MB)</th>
                             </tr>
@@ -680,6 +681,7 @@ def generate_dijkstra_section(dijkstra_data: dict) -> str:
                                 <td class="number-cell">{weight_str}</td>
                                 <td class="number-cell">{result.get('path_length', 0)}</td>
                                 <td><strong>{found_badge}</strong></td>
+                                <td>{result.get('strategy', 'N/A')}</td>
                                 <td class="number-cell">{time_str}</td>
                                 <td class="number-cell">{memory_str}</td>
                             </tr>
@@ -732,6 +734,7 @@ def generate_bellman_ford_section(bellman_data: dict) -> str:
                                 <th>Total de Nós</th>
                                 <th>Nós Alcançáveis</th>
                                 <th>Ciclo Negativo?</th>
+                                <th>Estratégia</th>
                                 <th>Tempo (s)</th>
                                 <th>Memória (KB/MB)</th>
                             </tr>
@@ -772,6 +775,7 @@ def generate_bellman_ford_section(bellman_data: dict) -> str:
                                 <td class="number-cell">{result.get('total_nodes', 0)}</td>
                                 <td class="number-cell">{reachable_nodes}</td>
                                 <td><strong>{cycle_badge}</strong></td>
+                                <td>{result.get('strategy', 'N/A')}</td>
                                 <td class="number-cell">{time_str}</td>
                                 <td class="number-cell">{memory_str}</td>
                             </tr>
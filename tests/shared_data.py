@@ -0,0 +1,46 @@
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+
+BITCOIN_ALPHA_CSV = Path(__file__).parent.parent / "data" / "bitcoin_alpha.csv"
+
+
+@lru_cache(maxsize=None)
+def load_bitcoin_alpha() -> Algorithms:
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(BITCOIN_ALPHA_CSV))
+    return algo
+
+
+def bitcoin_dag():
+    source = load_bitcoin_alpha().graph
+    graph = {node: [] for node in source}
+    for node, neighbors in source.items():
+        for neighbor, weight in neighbors:
+            if int(node) < int(neighbor):
+                graph[node].append((neighbor, weight))
+    algo = Algorithms()
+    algo.graph = graph
+    algo.reverse_graph = Algorithms.reversed(graph)
+    algo.directed = True
+    return algo
+
+
+def relax_until_stable(graph, start, sign=1.0):
+    distances = {start: 0.0}
+    changed = True
+    while changed:
+        changed = False
+        for node in graph:
+            if node not in distances:
+                continue
+            for neighbor, weight in graph[node]:
+                candidate = distances[node] + weight
+                if neighbor not in distances or sign * candidate < sign * distances[neighbor]:
+                    distances[neighbor] = candidate
+                    changed = True
+    return distances
@@ -0,0 +1,103 @@
+import csv
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import bitcoin_dag
+from graphs.algorithms import ROUTE_CHUNK_PAIRS, ROUTE_CHUNKS_PER_WORKER, Algorithms
+from constants import ADJACENCIES_PATH
+
+
+def test_batch_routing_recife(tmp_path):
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+
+    rng = random.Random(42)
+    neighborhoods = sorted(algo.graph)
+    rows = [
+        (f"Rua {i}", f"Rua {i + 1}", rng.choice(neighborhoods), rng.choice(neighborhoods))
+        for i in range(200_000)
+    ]
+    rows.append(("Rua A", "Rua B", "Bairro Inexistente", neighborhoods[0]))
+
+    addresses_path = tmp_path / "enderecos.csv"
+    with open(addresses_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["X", "Y", "bairro_X", "Bairro_Y"])
+        writer.writerows(rows)
+
+    results = {}
+    for workers in (1, 2):
+        output_path = tmp_path / f"distancias_{workers}.csv"
+        start_time = time.perf_counter()
+        algo.compute_distances_batch(str(addresses_path), str(output_path), workers=workers)
+        results[workers] = time.perf_counter() - start_time
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            output = list(csv.reader(f))[1:]
+        assert len(output) == len(rows)
+        assert [row[:2] for row in output] == [list(row[:2]) for row in rows]
+        assert output[-1][5] == "Bairro não encontrado: Bairro Inexistente"
+
+        for row in output[:-1:len(output) // 50]:
+            expected = algo.dijkstra(row[2], row[3])
+            assert float(row[4]) == expected[0]
+            assert row[5] == expected[1]
+
+    return {"rows": len(rows), "serial_time_seconds": results[1], "parallel_time_seconds": results[2]}
+
+
+def test_route_pairs_streams_in_order():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    neighborhoods = sorted(algo.graph)
+    read = []
+
+    def pairs():
+        rng = random.Random(36)
+        while True:
+            pair = (rng.choice(neighborhoods), rng.choice(neighborhoods + [None]))
+            read.append(pair)
+            yield pair
+
+    for workers in (1, 2):
+        read.clear()
+        routes = algo.route_pairs(pairs(), workers=workers)
+        results = [next(routes) for _ in range(ROUTE_CHUNK_PAIRS + 1)]
+        routes.close()
+        assert len(read) <= ROUTE_CHUNK_PAIRS * (workers * ROUTE_CHUNKS_PER_WORKER + 2)
+        for (origin, target), route in list(zip(read, results))[::97]:
+            assert route == (None if target is None else algo.dijkstra(origin, target))
+    assert len(algo.path_cache) == 0
+
+
+def test_batch_routing_negative_dag():
+    algo = bitcoin_dag()
+    rng = random.Random(45)
+    nodes = sorted(algo.graph, key=lambda node: -len(algo.graph[node]))
+    sources, targets = nodes[:20], rng.sample(list(algo.graph), 91)
+    pairs = [(source, target) for source in sources for target in targets]
+
+    trees = {source: algo.dag_tree(source) for source in sources}
+    algo.path_cache.invalidate()
+    routes = list(algo.route_pairs(pairs, workers=1))
+    forward = algo.distance_table(sources, targets, strategy="forward")
+    reverse = algo.distance_table(sources, targets, strategy="reverse")
+    for (source, target), route in zip(pairs, routes):
+        expected = trees[source][0].get(target, float("inf"))
+        assert route[0] == expected
+        assert forward.get(source, target) == expected
+        assert reverse.get(source, target) == expected
+        assert algo.route_targets(source, [target])[target][0] == expected
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(test_batch_routing_recife(Path(directory)))
+    test_route_pairs_streams_in_order()
+    test_batch_routing_negative_dag()
@@ -4,9 +4,9 @@ import tracemalloc
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from graphs.algorithms import Algorithms
+from shared_data import load_bitcoin_alpha
 
 
 def create_graph_with_negative_weights() -> Dict[str, List[Tuple[str, float]]]:
@@ -63,10 +63,8 @@ def bellman_ford_with_cycle_detection(
 
 def test_bellman_ford_bitcoin_alpha():
 
-    algo = Algorithms()
-    
-    csv_path = Path(__file__).parent.parent / "data" / "bitcoin_alpha_no_negative.csv"
-    graph_positive = algo.load_graph_from_csv(str(csv_path))
+    algo = load_bitcoin_alpha()
+    graph_positive = algo.weight_view("abs", cache=True)
 
     all_nodes = list(graph_positive.keys())
     source = all_nodes[0]
@@ -91,6 +89,7 @@ def test_bellman_ford_bitcoin_alpha():
         "time_seconds": elapsed_time,
         "peak_memory_mb": peak / 1024 / 1024,
         "negative_cycle": False,
+        "strategy": "dag" if algo.topological_order(graph_positive) is not None else "bellman_ford",
     }
 
     graph_negative = create_graph_with_negative_cycle()
@@ -115,8 +114,7 @@ def test_bellman_ford_bitcoin_alpha():
         "peak_memory_kb": peak / 1024,
     }
 
-    csv_path_negative = Path(__file__).parent.parent / "data" / "bitcoin_alpha.csv"
-    graph_cycle = algo.load_graph_from_csv(str(csv_path_negative))
+    graph_cycle = algo.graph
 
     tracemalloc.start()
     start_time = time.perf_counter()
@@ -139,6 +137,7 @@ def test_bellman_ford_bitcoin_alpha():
         "time_seconds": elapsed_time,
         "peak_memory_mb": peak / 1024 / 1024,
         "negative_cycle": has_cycle ,
+        "strategy": "dag" if algo.topological_order(graph_cycle) is not None else "bellman_ford",
     }
 
     results = [result_1, result_2, result_3]
@@ -0,0 +1,66 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.graph import Graph
+
+
+def test_ego_network_radius():
+    graph = Graph()
+    for first, second in [("A", "B"), ("B", "C"), ("C", "D"), ("A", "E")]:
+        graph.add_edge(first, second)
+
+    assert set(graph.get_ego_network("A").get_vertices()) == {"A", "B", "E"}
+    assert set(graph.get_ego_network("A", radius=2).get_vertices()) == {"A", "B", "C", "E"}
+    assert graph.get_ego_network("A", radius=2).get_size() == 3
+    assert graph.get_ego_network("Z").get_order() == 0
+
+
+def test_bounded_search_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    graph = algo.weight_view("abs", cache=True)
+
+    all_nodes = list(graph.keys())
+    sources = [all_nodes[0], all_nodes[100], all_nodes[500]]
+    results = []
+
+    for source in sources:
+        start_time = time.perf_counter()
+        full, _ = algo.shortest_path_tree(source, graph)
+        full_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        bounded = algo.isochrone(source, max_cost=5, graph=graph)
+        bounded_time = time.perf_counter() - start_time
+
+        assert bounded == {node: cost for node, cost in full.items() if cost <= 5}
+
+        hops, _ = algo.bfs(source, algo.graph)
+        assert algo.isochrone(source, max_hops=3) == {
+            node: depth for node, depth in hops.items() if depth <= 3
+        }
+
+        ego = algo.ego_network(source, hops=2)
+        assert set(ego) == {node for node, depth in hops.items() if depth <= 2}
+        assert all(neighbor in ego for neighbors in ego.values() for neighbor, _ in neighbors)
+
+        results.append(
+            {
+                "source": source,
+                "reached": len(bounded),
+                "full_time_seconds": full_time,
+                "bounded_time_seconds": bounded_time,
+                "ego_2_hops_both_directions": len(algo.ego_network(source, hops=2, both_directions=True)),
+            }
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    test_ego_network_radius()
+    for result in test_bounded_search_bitcoin_alpha():
+        print(result)
@@ -0,0 +1,97 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.algorithms import Algorithms
+from graphs.components import Components
+
+
+def _reachable(graph, start):
+    seen = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for neighbor, _ in graph.get(node, ()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def test_condensation_is_acyclic():
+    graph = {
+        "A": [("B", 1.0)],
+        "B": [("C", 1.0)],
+        "C": [("A", 1.0), ("D", 1.0)],
+        "D": [("E", 1.0)],
+        "E": [("D", 1.0)],
+        "F": [],
+    }
+    components = Components(graph)
+    assert components.weak_count == 2
+    assert components.strong_count == 3
+    assert components.strong["A"] == components.strong["C"] != components.strong["D"]
+    assert components.condensation()[components.strong["A"]] == {components.strong["D"]}
+    assert components.may_reach("A", "E")
+    assert not components.may_reach("E", "A")
+    assert not components.may_reach("A", "F")
+
+
+def test_components_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+
+    start_time = time.perf_counter()
+    components = Components(algo.graph, directed=True)
+    elapsed = time.perf_counter() - start_time
+
+    rng = random.Random(44)
+    nodes = list(algo.graph)
+    undirected = algo.undirected_view()
+    for node in rng.sample(nodes, 20):
+        reach = _reachable(algo.graph, node)
+        back = _reachable(algo.reverse_graph, node)
+        strong = {other for other in nodes if components.strong[other] == components.strong[node]}
+        weak = {other for other in nodes if components.weak[other] == components.weak[node]}
+        assert strong == reach & back
+        assert weak == _reachable(undirected, node)
+        for other in reach:
+            assert components.strong[other] <= components.strong[node]
+
+    dag = components.condensation()
+    for component, targets in dag.items():
+        assert all(target < component for target in targets)
+
+    summary = components.summary()
+    summary["time_seconds"] = elapsed
+    return summary
+
+
+def test_dijkstra_skips_unreachable_pairs():
+    algo = load_bitcoin_alpha()
+    components = algo.components()
+    sizes = components.sizes(strong=True)
+    source = max(algo.graph, key=lambda node: sizes[components.strong[node]])
+    sink = next(node for node in algo.graph if not algo.graph[node] and algo.reverse_graph[node])
+    assert source not in _reachable(algo.graph, sink)
+    assert not algo.may_reach(sink, source)
+
+    fresh = Algorithms()
+    fresh.graph = algo.graph
+    fresh.directed = True
+    fresh.components()
+    start_time = time.perf_counter()
+    assert fresh.dijkstra(sink, source) == (float("inf"), "No path found")
+    elapsed = time.perf_counter() - start_time
+    assert fresh.path_cache.stats()["entries"] == 0
+
+    return {"unreachable_query_seconds": elapsed}
+
+
+if __name__ == "__main__":
+    test_condensation_is_acyclic()
+    print(test_components_bitcoin_alpha())
+    print(test_dijkstra_skips_unreachable_pairs())
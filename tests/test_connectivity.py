@@ -0,0 +1,104 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.connectivity import biconnectivity
+from graphs.graph import Graph
+from solve import GraphAnalyzer
+
+
+def _components(nodes, neighbors, removed_node=None, removed_edge=None):
+    seen = {removed_node} if removed_node is not None else set()
+    count = 0
+    for root in nodes:
+        if root in seen:
+            continue
+        count += 1
+        seen.add(root)
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for neighbor, key in neighbors(node):
+                if key == removed_edge or neighbor in seen:
+                    continue
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return count
+
+
+def test_parallel_edges_are_not_bridges():
+    graph = Graph()
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "A")
+    graph.add_edge("B", "C")
+    result = biconnectivity(graph.get_vertices(), graph.incident_edges)
+    assert [(u, v) for u, v, _ in result["pontes"]] == [("B", "C")]
+    assert result["articulacoes"] == ["B"]
+
+
+def test_biconnectivity_recife():
+    analyzer = GraphAnalyzer()
+    graph = analyzer.build_graph()
+    nodes = sorted(graph.get_vertices())
+    result = biconnectivity(nodes, graph.incident_edges)
+    base = _components(nodes, graph.incident_edges)
+
+    bridges = {edge_id for _, _, edge_id in result["pontes"]}
+    for edge_id in range(graph.get_edge_count()):
+        assert (edge_id in bridges) == (_components(nodes, graph.incident_edges, removed_edge=edge_id) > base)
+
+    for node in nodes:
+        others = [other for other in nodes if other != node]
+        expected = _components(others, graph.incident_edges, removed_node=node) > base
+        assert (node in result["articulacoes"]) == expected
+
+    covered = [edge for component in result["componentes_biconexos"] for edge in component]
+    assert set(covered) == {node for node in nodes if graph.get_degree(node) > 0}
+
+    connectivity = analyzer.compute_connectivity()
+    assert connectivity["total_pontes"] == len(bridges)
+
+
+def test_biconnectivity_bitcoin_alpha_undirected():
+    algo = load_bitcoin_alpha()
+    undirected = algo.undirected_view()
+
+    def neighbors(node):
+        return ((neighbor, tuple(sorted((node, neighbor)))) for neighbor, _ in undirected[node])
+
+    start_time = time.perf_counter()
+    result = algo.biconnectivity()
+    elapsed = time.perf_counter() - start_time
+
+    nodes = list(algo.graph)
+    base = _components(nodes, neighbors)
+    bridges = {key for _, _, key in result["pontes"]}
+    for _, _, key in result["pontes"][:30]:
+        assert _components(nodes, neighbors, removed_edge=key) > base
+    links = sorted({key for node in nodes for _, key in neighbors(node)} - bridges)
+    for key in random.Random(17).sample(links, 30):
+        assert _components(nodes, neighbors, removed_edge=key) == base
+
+    rng = random.Random(13)
+    articulation = set(result["articulacoes"])
+    for node in rng.sample(nodes, 40) + result["articulacoes"][:10]:
+        others = [other for other in nodes if other != node]
+        assert (node in articulation) == (_components(others, neighbors, removed_node=node) > base)
+
+    return {
+        "articulation_points": len(result["articulacoes"]),
+        "bridges": len(result["pontes"]),
+        "biconnected_components": len(result["componentes_biconexos"]),
+        "largest_component": len(result["componentes_biconexos"][0]),
+        "time_seconds": elapsed,
+    }
+
+
+if __name__ == "__main__":
+    test_parallel_edges_are_not_bridges()
+    test_biconnectivity_recife()
+    print(test_biconnectivity_bitcoin_alpha_undirected())
@@ -0,0 +1,78 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import bitcoin_dag, load_bitcoin_alpha, relax_until_stable
+from graphs.algorithms import Algorithms
+from graphs.dag import topological_order
+
+
+def test_cycles_are_detected():
+    assert topological_order({"A": [("B", 1.0)], "B": [("A", 1.0)]}) is None
+    assert topological_order({"A": [("A", 1.0)]}) is None
+    assert topological_order({"A": [("C", -1.0)], "B": [("C", 2.0)], "C": []})[-1] == "C"
+    assert load_bitcoin_alpha().path_strategy() == "dijkstra"
+
+
+def test_dag_paths_bitcoin_alpha():
+    algo = bitcoin_dag()
+    graph = algo.graph
+    assert algo.path_strategy() == "dag"
+    assert algo.path_strategy(algo.weight_view("abs")) == "dag"
+
+    rng = random.Random(45)
+    sources = rng.sample([node for node in graph if len(graph[node]) > 3], 5)
+
+    dag_time = 0.0
+    for source in sources:
+        expected = relax_until_stable(graph, source)
+        start_time = time.perf_counter()
+        distances = algo.bellman_ford(source)
+        dag_time += time.perf_counter() - start_time
+        assert {node: cost for node, cost in distances.items() if cost != float("inf")} == expected
+
+        target = max(expected, key=expected.get)
+        weight, path = algo.dijkstra(source, target)
+        assert weight == expected[target]
+        nodes = path.split(" -> ")
+        assert nodes[0] == source and nodes[-1] == target
+
+        longest, parents = algo.longest_paths(source)
+        assert longest == relax_until_stable(graph, source, sign=-1.0)
+        assert Algorithms.build_path(parents, target)[0] == source
+
+    positive = algo.weight_view("abs")
+    start_time = time.perf_counter()
+    for source in sources:
+        algo.shortest_path_tree(source, positive)
+    heap_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for source in sources:
+        algo.dag_tree(source, positive)
+    dag_positive_time = time.perf_counter() - start_time
+
+    return {
+        "strategy": algo.path_strategy(),
+        "sources": len(sources),
+        "dag_signed_seconds": dag_time,
+        "dijkstra_abs_seconds": heap_time,
+        "dag_abs_seconds": dag_positive_time,
+    }
+
+
+def test_cyclic_graph_rejects_longest_paths():
+    algo = load_bitcoin_alpha()
+    try:
+        algo.longest_paths(next(iter(algo.graph)))
+    except ValueError:
+        return
+    raise AssertionError("Esperava ValueError para grafo com ciclos")
+
+
+if __name__ == "__main__":
+    test_cycles_are_detected()
+    print(test_dag_paths_bitcoin_alpha())
+    test_cyclic_graph_rejects_longest_paths()
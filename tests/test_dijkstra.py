@@ -2,15 +2,14 @@ import sys
 import time
 import tracemalloc
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from graphs.algorithms import Algorithms
+from shared_data import load_bitcoin_alpha
 
 
 def test_dijkstra_bitcoin_alpha():
-    csv_path = Path(__file__).parent.parent / "data" / "bitcoin_alpha_no_negative.csv"
-    algo = Algorithms()
-    graph = algo.load_graph_from_csv(str(csv_path))
+    algo = load_bitcoin_alpha()
+    graph = algo.weight_view("abs")
 
     all_nodes = list(graph.keys())
     pairs = [
@@ -48,6 +47,7 @@ def test_dijkstra_bitcoin_alpha():
                 "time_seconds": elapsed_time,
                 "peak_memory_mb": peak / 1024 / 1024,
                 "found": weight != float("inf"),
+                "strategy": algo.path_strategy(graph),
             }
         )
 
@@ -0,0 +1,89 @@
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+
+
+def test_distance_table_bitcoin_alpha(tmp_path):
+    algo = load_bitcoin_alpha()
+    graph = algo.weight_view("abs", cache=True)
+
+    all_nodes = list(graph.keys())
+    sources = all_nodes[:40]
+    targets = all_nodes[200:205]
+    wanted = [(sources[0], targets[0]), (sources[5], targets[3])]
+
+    results = []
+    tables = {}
+    for strategy in ("forward", "reverse"):
+        start_time = time.perf_counter()
+        tables[strategy] = algo.distance_table(sources, targets, graph, strategy=strategy, paths=wanted)
+        results.append({"strategy": strategy, "time_seconds": time.perf_counter() - start_time})
+
+    assert np.array_equal(tables["forward"].distances, tables["reverse"].distances)
+    assert algo.distance_table(sources, targets, graph).strategy == "reverse"
+    assert algo.distance_table(targets, sources, graph).strategy == "forward"
+
+    table = tables["reverse"]
+    for i, source in enumerate(sources[:10]):
+        for j, target in enumerate(targets):
+            assert table.distances[i, j] == algo.dijkstra(source, target, graph)[0]
+
+    for source, target in wanted:
+        if np.isfinite(table.get(source, target)):
+            nodes = table.paths[(source, target)].split(" -> ")
+            assert nodes[0] == source and nodes[-1] == target
+            cost = sum(min(w for n, w in graph[u] if n == v) for u, v in zip(nodes, nodes[1:]))
+            assert cost == table.get(source, target)
+
+    table.save(str(tmp_path / "matriz.npy"))
+    assert np.array_equal(np.load(tmp_path / "matriz.npy"), table.distances)
+    with open(tmp_path / "matriz.json", "r", encoding="utf-8") as f:
+        assert json.load(f)["destinos"] == targets
+
+    table.save(str(tmp_path / "matriz.csv"))
+    with open(tmp_path / "matriz.csv", "r", encoding="utf-8") as f:
+        assert sum(1 for _ in csv.reader(f)) == len(sources) * len(targets) + 1
+
+    table.save(str(tmp_path / "matriz.jsonl"))
+    with open(tmp_path / "matriz.jsonl", "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == len(sources) * len(targets)
+
+    return results
+
+
+def test_distance_table_reverse_view_without_copy(monkeypatch):
+    algo = load_bitcoin_alpha()
+    graph = algo.weight_view("abs")
+    nodes = list(graph.keys())
+    sources, targets = nodes[:20], nodes[300:303]
+    blocked = [edge_id for node in sources[:5] for edge_id in algo.edge_ids[node][:1]]
+
+    forward = algo.distance_table(sources, targets, graph, strategy="forward").distances
+    with algo.masked(edges=blocked):
+        masked_forward = algo.distance_table(sources, targets, graph, strategy="forward").distances
+
+    def reversed_copy(graph):
+        raise AssertionError("a estratégia reversa não deve copiar o grafo")
+
+    monkeypatch.setattr(algo, "reversed", reversed_copy)
+    assert np.array_equal(algo.distance_table(sources, targets, graph, strategy="reverse").distances, forward)
+    with algo.masked(edges=blocked):
+        masked_reverse = algo.distance_table(sources, targets, graph, strategy="reverse").distances
+    assert np.array_equal(masked_reverse, masked_forward)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        for result in test_distance_table_bitcoin_alpha(Path(directory)):
+            print(result)
@@ -0,0 +1,299 @@
+import csv
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import BITCOIN_ALPHA_CSV
+from graphs.algorithms import Algorithms
+from graphs.components import Components
+from graphs.dag import topological_order
+from constants import ADJACENCIES_PATH
+
+
+def _path_cost(graph, path):
+    return sum(min(w for n, w in graph[u] if n == v) for u, v in zip(path, path[1:]))
+
+
+def _assert_tree(algo, source, graph, tree):
+    distances, parents = tree
+    expected, _ = algo.shortest_path_tree(source, graph)
+    assert distances.keys() == expected.keys()
+    for node, distance in expected.items():
+        assert math.isclose(distances[node], distance, rel_tol=1e-9, abs_tol=1e-9)
+        parent = parents[node]
+        if parent is not None:
+            assert any(
+                math.isclose(distances[parent] + weight, distance, rel_tol=1e-9, abs_tol=1e-9)
+                for neighbor, weight in graph[parent]
+                if neighbor == node
+            )
+
+
+def test_dynamic_updates_recife():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    nodes = list(algo.graph)
+    table = algo.all_pairs_shortest_paths()
+    for source in nodes:
+        algo.cached_tree(source)
+
+    rng = random.Random(50)
+    patch_time = rebuild_time = 0.0
+    affected = 0
+    for _ in range(40):
+        edge_id = rng.randrange(len(algo.edges))
+        previous = algo.edges.weight[edge_id]
+        weight = round(previous * rng.choice([0.25, 0.5, 2.0, 4.0]) + rng.choice([0.0, 0.1]), 2)
+
+        start_time = time.perf_counter()
+        report = algo.set_edge_weight(edge_id, weight, tables=[table])
+        patch_time += time.perf_counter() - start_time
+        assert report["arvores_descartadas"] == 0
+        assert report["arvores_atualizadas"] == len(nodes)
+        assert report["linhas_recalculadas"] == 0
+        affected += report["vertices_afetados"]
+
+        start_time = time.perf_counter()
+        fresh = algo.all_pairs_shortest_paths()
+        rebuild_time += time.perf_counter() - start_time
+        assert np.allclose(table.distances, fresh.distances)
+
+    for source in nodes:
+        _assert_tree(algo, source, algo.graph, algo.cached_tree(source))
+    for source in rng.sample(nodes, 10):
+        for target in rng.sample(nodes, 10):
+            cost, _ = algo.dijkstra(source, target)
+            path = table.path(source, target)
+            assert path[0] == source and path[-1] == target
+            assert math.isclose(_path_cost(algo.graph, path), cost, rel_tol=1e-9)
+
+    return {
+        "updates": 40,
+        "trees": len(nodes),
+        "affected_vertices": affected,
+        "patch_seconds": patch_time,
+        "floyd_seconds": rebuild_time,
+    }
+
+
+def test_dynamic_updates_bitcoin_alpha():
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(BITCOIN_ALPHA_CSV))
+    positive = algo.weight_view("abs")
+    rng = random.Random(50)
+    nodes = list(algo.graph)
+    sources = rng.sample(nodes, 30)
+    targets = rng.sample(nodes, 50)
+    edges = [rng.randrange(len(algo.edges)) for _ in range(60)]
+
+    for source in sources:
+        algo.cached_tree(source)
+    table = algo.distance_table(sources, targets, positive, strategy="forward", paths=[(sources[0], targets[0])])
+
+    patch_time = 0.0
+    affected = 0
+    for edge_id in edges:
+        weight = float(rng.choice([w for w in range(-10, 11) if w]))
+        start_time = time.perf_counter()
+        report = algo.set_edge_weight(edge_id, weight, tables=[table], graph=positive)
+        patch_time += time.perf_counter() - start_time
+        assert report["linhas_recalculadas"] == 0
+        affected += report["vertices_afetados"]
+
+    start_time = time.perf_counter()
+    fresh = algo.distance_table(sources, targets, positive, strategy="reverse", paths=[(sources[0], targets[0])])
+    rebuild_time = time.perf_counter() - start_time
+    assert np.array_equal(table.distances, fresh.distances)
+    assert table.paths.keys() == fresh.paths.keys()
+    for source in sources:
+        _assert_tree(algo, source, positive, algo.cached_tree(source, positive))
+    assert all(view == "abs" for *_, view in algo.path_cache._trees)
+
+    return {
+        "updates": len(edges),
+        "trees": len(sources),
+        "affected_vertices": affected,
+        "patch_seconds": patch_time,
+        "rebuild_seconds": rebuild_time,
+    }
+
+
+def test_weight_change_without_cached_trees():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    source, target = next(iter(algo.graph)), algo.graph[next(iter(algo.graph))][0][0]
+    report = algo.set_connection_weight(source, target, 0.01)[0]
+    assert report["arvores_atualizadas"] == 0
+    assert (target, 0.01) in algo.graph[source] and (source, 0.01) in algo.graph[target]
+    assert algo.dijkstra(source, target)[0] == 0.01
+
+
+def _partition(labels):
+    groups = {}
+    for node, label in labels.items():
+        groups.setdefault(label, set()).add(node)
+    return {frozenset(group) for group in groups.values()}
+
+
+def _assert_structure(algo):
+    fresh = Components(algo.graph, directed=algo.directed)
+    components = algo.components()
+    assert _partition(components.weak) == _partition(fresh.weak)
+    assert _partition(components.strong) == _partition(fresh.strong)
+    for node in algo.graph:
+        assert algo.out_degrees[node] == len(algo.graph[node])
+        assert algo.in_degrees[node] == len(algo.reverse_graph[node])
+        assert len(algo.edge_ids[node]) == len(algo.graph[node])
+        for (neighbor, weight), edge_id in zip(algo.graph[node], algo.edge_ids[node]):
+            assert algo.edges.weight[edge_id] == weight
+            assert edge_id in algo.parallel_edges(node, neighbor)
+    for (first, second), head in algo.edge_heads.items():
+        chained = list(algo.edges.parallel(head))
+        assert sorted(chained) == sorted(set(e for n, e in algo.incident_edges(first) if n == second))
+
+
+def test_edge_insertions_and_deletions_recife():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    nodes = list(algo.graph)
+    table = algo.all_pairs_shortest_paths()
+    for source in nodes:
+        algo.cached_tree(source)
+    algo.components()
+
+    rng = random.Random(51)
+    added = []
+    patch_time = rebuild_time = 0.0
+    for step in range(40):
+        start_time = time.perf_counter()
+        if step % 2:
+            first, second = rng.sample(nodes, 2)
+            report = algo.add_edge(first, second, round(rng.uniform(0.1, 3.0), 2), tables=[table], logradouro="Rua Nova")
+            added.append(report["aresta"])
+            assert report["peso_anterior"] is None
+        else:
+            edge_id = rng.choice([e for e in range(len(algo.edges)) if not math.isnan(algo.edges.weight[e])])
+            report = algo.remove_edge(edge_id, tables=[table])
+            assert report["peso"] is None
+        patch_time += time.perf_counter() - start_time
+        assert report["arvores_descartadas"] == 0 and report["linhas_recalculadas"] == 0
+
+        start_time = time.perf_counter()
+        fresh = algo.all_pairs_shortest_paths()
+        rebuild_time += time.perf_counter() - start_time
+        assert np.allclose(table.distances, fresh.distances)
+
+    _assert_structure(algo)
+    for edge_id in range(len(algo.edges)):
+        edge = algo.edges.get(edge_id)
+        listed = edge_id in {street.edge_id for street in algo.streets.between(edge["origem"], edge["destino"])}
+        assert listed != math.isnan(edge["weight"])
+    assert {street.edge_id for street in algo.streets.lookup("Rua Nova")} == {
+        edge_id for edge_id in added if not math.isnan(algo.edges.weight[edge_id])
+    }
+    for source in nodes:
+        _assert_tree(algo, source, algo.graph, algo.cached_tree(source))
+
+    leaf = min(nodes, key=lambda node: (len(algo.graph[node]), node))
+    for neighbor, edge_id in list(algo.incident_edges(leaf)):
+        algo.remove_edge(edge_id, tables=[table])
+    assert algo.components().weak_count == Components(algo.graph, directed=False).weak_count
+    assert algo.dijkstra(leaf, nodes[0] if nodes[0] != leaf else nodes[1]) == (float("inf"), "No path found")
+    assert np.isinf(table.distances[table.sources.index(leaf)]).sum() == len(nodes) - 1
+    try:
+        algo.set_edge_weight(edge_id, 1.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Esperava ValueError para aresta removida")
+
+    return {"updates": 40, "patch_seconds": patch_time, "floyd_seconds": rebuild_time}
+
+
+def test_edge_insertions_and_deletions_bitcoin_alpha():
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(BITCOIN_ALPHA_CSV))
+    positive = algo.weight_view("abs")
+    rng = random.Random(52)
+    nodes = list(algo.graph)
+    sources = rng.sample(nodes, 20)
+    for source in sources:
+        algo.cached_tree(source, positive)
+    algo.components()
+    algo.topological_order()
+
+    affected = 0
+    patch_time = 0.0
+    for step in range(60):
+        start_time = time.perf_counter()
+        if step % 2:
+            first, second = rng.sample(nodes, 2)
+            report = algo.add_edge(first, second, float(rng.choice([w for w in range(-10, 11) if w])), graph=positive)
+        else:
+            node = rng.choice([node for node in sources if algo.edge_ids[node]])
+            report = algo.remove_edge(rng.choice(algo.edge_ids[node]), graph=positive)
+        patch_time += time.perf_counter() - start_time
+        assert report["arvores_atualizadas"] == len(sources) and report["arvores_descartadas"] == 0
+        affected += report["vertices_afetados"]
+
+    _assert_structure(algo)
+    assert algo.topological_order() is None
+    for source in sources:
+        _assert_tree(algo, source, positive, algo.cached_tree(source, positive))
+
+    return {"updates": 60, "trees": len(sources), "affected_vertices": affected, "patch_seconds": patch_time}
+
+
+def test_insertions_keep_topological_order(tmp_path):
+    rng = random.Random(53)
+    path = tmp_path / "bitcoin_dag.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["SOURCE", "TARGET", "RATING", "TIME"])
+        for _ in range(600):
+            first, second = sorted(rng.sample(range(200), 2))
+            writer.writerow([first, second, rng.randint(1, 10), 0])
+
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(path))
+    nodes = list(algo.graph)
+    source = min(nodes, key=int)
+    assert algo.path_strategy() == "dag"
+    tree = algo.cached_tree(source)
+
+    for _ in range(300):
+        first, second = rng.sample(nodes, 2)
+        report = algo.add_edge(first, second, float(rng.randint(1, 10)))
+        order = algo.topological_order()
+        assert (order is None) == (topological_order(algo.graph) is None)
+        if order is None:
+            assert algo.path_strategy() == "dijkstra"
+            assert report["arvores_descartadas"] == 1
+            algo.remove_edge(report["aresta"])
+            assert algo.path_strategy() == "dag"
+            tree = algo.cached_tree(source)
+            continue
+        position = {node: i for i, node in enumerate(order)}
+        assert all(position[u] < position[v] for u in algo.graph for v, _ in algo.graph[u])
+        assert algo.cached_tree(source) is tree
+        _assert_tree(algo, source, algo.graph, tree)
+    _assert_structure(algo)
+
+
+if __name__ == "__main__":
+    print(test_dynamic_updates_recife())
+    print(test_dynamic_updates_bitcoin_alpha())
+    test_weight_change_without_cached_trees()
+    print(test_edge_insertions_and_deletions_recife())
+    print(test_edge_insertions_and_deletions_bitcoin_alpha())
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        test_insertions_keep_topological_order(Path(directory))
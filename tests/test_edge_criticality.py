@@ -0,0 +1,83 @@
+import csv
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+from constants import ADJACENCIES_PATH
+
+
+def test_edge_criticality_recife(tmp_path):
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+
+    rng = random.Random(11)
+    neighborhoods = sorted(algo.graph)
+    pairs = [tuple(rng.sample(neighborhoods, 2)) for _ in range(40)]
+    pairs += pairs[:5]
+
+    addresses_path = tmp_path / "enderecos.csv"
+    with open(addresses_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["X", "Y", "bairro_X", "Bairro_Y"])
+        writer.writerows((f"Rua {i}", f"Rua {i + 1}", x, y) for i, (x, y) in enumerate(pairs))
+
+    timings = {}
+    rankings = {}
+    for workers in (1, 2):
+        start_time = time.perf_counter()
+        rankings[workers] = algo.edge_criticality(
+            str(addresses_path), str(tmp_path / f"criticidade_{workers}.csv"), workers=workers
+        )
+        timings[workers] = time.perf_counter() - start_time
+    assert rankings[1] == rankings[2]
+
+    with algo.masked(streets=["Pte."]) as mask:
+        blocked = set(mask.edges)
+        assert blocked
+        masked = [
+            algo.edge_criticality(str(addresses_path), str(tmp_path / f"criticidade_ponte_{workers}.csv"), workers=workers)
+            for workers in (1, 2)
+        ]
+    assert masked[0] == masked[1]
+    assert masked[0] != rankings[1]
+    assert not {entry["aresta"] for entry in masked[0]} & blocked
+
+    baseline = {pair: algo.dijkstra(*pair)[0] for pair in set(pairs)}
+    ranked = {entry["aresta"]: entry for entry in rankings[1]}
+
+    start_time = time.perf_counter()
+    for edge_id in range(len(algo.edges)):
+        increase, disconnected = 0.0, 0
+        with algo.masked(edges=[edge_id]):
+            for pair in pairs:
+                cost = algo.dijkstra(*pair)[0]
+                if cost == float("inf"):
+                    disconnected += 1
+                else:
+                    increase += cost - baseline[pair]
+        entry = ranked.get(edge_id, {"aumento_total": 0.0, "rotas_desconectadas": 0})
+        assert entry["aumento_total"] == increase
+        assert entry["rotas_desconectadas"] == disconnected
+    naive_time = time.perf_counter() - start_time
+
+    totals = [(-entry["rotas_desconectadas"], -entry["aumento_total"]) for entry in rankings[1]]
+    assert totals == sorted(totals)
+
+    return {
+        "edges": len(algo.edges),
+        "candidate_edges": len(ranked),
+        "serial_time_seconds": timings[1],
+        "parallel_time_seconds": timings[2],
+        "naive_time_seconds": naive_time,
+    }
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(test_edge_criticality_recife(Path(directory)))
@@ -0,0 +1,101 @@
+import csv
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+from graphs.graph import Graph
+from graphs.edges import EdgeStore
+
+
+def test_parallel_edges_keep_attributes():
+    graph = Graph()
+    first = graph.add_edge("Recife", "Santo Amaro", 4.0, "Pte. do Limoeiro")
+    second = graph.add_edge("Santo Amaro", "Recife", 3.0, "Pte. Princesa Isabel")
+
+    assert graph.get_edge_ids("Recife", "Santo Amaro") == [second, first]
+    assert graph.get_size() == 1
+    assert graph.get_edge_count() == 2
+    assert graph.get_weight("Recife", "Santo Amaro") == 3.0
+    assert graph.edges.get(first)["logradouro"] == "Pte. do Limoeiro"
+
+    view = graph.cost_view()
+    assert sorted(view["Recife"]) == [("Santo Amaro", 3.0), ("Santo Amaro", 4.0)]
+
+    subgraph = graph.get_subgraph({"Recife", "Santo Amaro"})
+    assert subgraph.get_edge_count() == 2
+
+
+def test_loader_chains_parallel_edges(tmp_path):
+    adjacencies = tmp_path / "adjacencias.csv"
+    with open(adjacencies, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["bairro_origem", "bairro_destino", "logradouro", "observacao", "peso"])
+        writer.writerow(["Recife", "Santo Amaro", "Pte. do Limoeiro", "", "4"])
+        writer.writerow(["Santo Amaro", "Recife", "Pte. Princesa Isabel", "", "3"])
+        writer.writerow(["Recife", "Santo Amaro", "Pte. do Limoeiro", "", "4"])
+        writer.writerow(["Recife", "São José", "Pte. 12 de Setembro", "", "4"])
+
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(adjacencies))
+    assert algo.parallel_edges("Recife", "Santo Amaro") == [2, 1, 0]
+    assert algo.parallel_edges("Santo Amaro", "Recife") == [2, 1, 0]
+    assert algo.parallel_edges("Recife", "São José") == [3]
+    assert algo.parallel_edges("Recife", "Derby") == []
+    assert list(algo.edges.parallel(2)) == [2, 1, 0]
+
+    trust = tmp_path / "bitcoin_alpha.csv"
+    with open(trust, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["SOURCE", "TARGET", "RATING", "TIME"])
+        writer.writerows([["1", "2", "5", "10"], ["2", "1", "-1", "11"], ["1", "2", "3", "12"]])
+
+    algo.load_graph_from_csv(str(trust))
+    assert algo.parallel_edges("1", "2") == [2, 0]
+    assert algo.parallel_edges("2", "1") == [1]
+
+
+def test_edge_store_memory_bitcoin_alpha():
+    csv_path = Path(__file__).parent.parent / "data" / "bitcoin_alpha.csv"
+    with open(csv_path, "r", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        next(reader)
+        rows = [(row[0], row[1], float(row[2]), int(row[3])) for row in reader]
+
+    tracemalloc.start()
+    weights = {}
+    for source, target, rating, _ in rows:
+        weights[(source, target)] = rating
+        weights[(target, source)] = rating
+    dict_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del weights
+
+    tracemalloc.start()
+    store = EdgeStore()
+    for source, target, rating, timestamp in rows:
+        store.add(source, target, rating, timestamp=timestamp)
+    store_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "edges": len(store),
+        "dict_bytes_per_edge": dict_bytes / len(rows),
+        "store_bytes_per_edge": store_bytes / len(rows),
+        "column_bytes_per_edge": store.bytes_per_edge(),
+    }
+
+    assert result["store_bytes_per_edge"] < result["dict_bytes_per_edge"]
+
+    return result
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_parallel_edges_keep_attributes()
+    with tempfile.TemporaryDirectory() as directory:
+        test_loader_chains_parallel_edges(Path(directory))
+    print(test_edge_store_memory_bitcoin_alpha())
@@ -0,0 +1,116 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.algorithms import Algorithms
+from graphs.floyd import dense_weights, floyd_warshall, matrix_path
+from graphs.johnson import NegativeCycleError
+from constants import ADJACENCIES_PATH
+from solve import GraphAnalyzer
+
+
+def _path_cost(graph, path):
+    return sum(min(w for n, w in graph[u] if n == v) for u, v in zip(path, path[1:]))
+
+
+def test_floyd_matches_dijkstra_recife():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    nodes = list(algo.graph)
+
+    start_time = time.perf_counter()
+    table = algo.all_pairs_shortest_paths()
+    floyd_time = time.perf_counter() - start_time
+    assert table.strategy == "floyd"
+
+    start_time = time.perf_counter()
+    forward = algo.distance_table(nodes, nodes, strategy="forward")
+    forward_time = time.perf_counter() - start_time
+    assert np.array_equal(table.distances, forward.distances)
+
+    for source in nodes:
+        for target in random.Random(source).sample(nodes, 10):
+            cost, _ = algo.dijkstra(source, target)
+            assert table.get(source, target) == cost
+            path = table.path(source, target)
+            assert path[0] == source and path[-1] == target
+            assert _path_cost(algo.graph, path) == cost
+
+    return {"nodes": len(nodes), "floyd_seconds": floyd_time, "dijkstra_seconds": forward_time}
+
+
+def test_floyd_microregions():
+    analyzer = GraphAnalyzer()
+    analyzer.load_neighborhoods_microregions()
+    analyzer.build_graph()
+    for region in analyzer.compute_microregion_metrics():
+        subgraph = analyzer.graph.get_subgraph(set(region["bairros"])).cost_view()
+        algo = Algorithms()
+        table = algo.all_pairs_shortest_paths(subgraph)
+        assert table.strategy == "floyd"
+        for source in region["bairros"]:
+            distances, _ = algo.shortest_path_tree(source, subgraph)
+            for target in region["bairros"]:
+                assert table.get(source, target) == distances.get(target, float("inf"))
+
+
+def test_blocked_floyd_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    assert not algo.prefers_floyd(algo.weight_view("abs"))
+
+    nodes = sorted(algo.graph, key=lambda node: -algo.out_degrees.get(node, 0))[:300]
+    keep = set(nodes)
+    graph = {node: [(n, abs(w)) for n, w in algo.graph[node] if n in keep] for node in nodes}
+    weights = dense_weights(graph, nodes)
+
+    start_time = time.perf_counter()
+    dist, pred = floyd_warshall(weights)
+    plain_time = time.perf_counter() - start_time
+    blocked, blocked_pred = floyd_warshall(weights, block=64)
+    assert np.array_equal(dist, blocked)
+
+    reference = Algorithms(graph)
+    start_time = time.perf_counter()
+    for i, source in enumerate(nodes):
+        distances, _ = reference.shortest_path_tree(source, graph)
+        expected = np.array([distances.get(target, np.inf) for target in nodes])
+        assert np.array_equal(dist[i], expected)
+    dijkstra_time = time.perf_counter() - start_time
+
+    for i, j in random.Random(48).sample([(i, j) for i in range(300) for j in range(300)], 200):
+        for predecessors in (pred, blocked_pred):
+            path = matrix_path(predecessors, i, j)
+            if np.isfinite(dist[i, j]):
+                assert _path_cost(graph, [nodes[k] for k in path]) == dist[i, j]
+            else:
+                assert path == []
+
+    return {"nodes": len(nodes), "floyd_seconds": plain_time, "dijkstra_seconds": dijkstra_time}
+
+
+def test_floyd_negative_weights():
+    graph = {"A": [("B", 4.0), ("C", 2.0)], "B": [("D", -3.0)], "C": [("B", -1.0)], "D": []}
+    nodes = list(graph)
+    dist, pred = floyd_warshall(dense_weights(graph, nodes))
+    assert dist[0, 3] == -2.0
+    assert [nodes[k] for k in matrix_path(pred, 0, 3)] == ["A", "C", "B", "D"]
+
+    graph["D"] = [("C", 1.0)]
+    try:
+        floyd_warshall(dense_weights(graph, nodes))
+    except NegativeCycleError:
+        return
+    raise AssertionError("Esperava NegativeCycleError")
+
+
+if __name__ == "__main__":
+    print(test_floyd_matches_dijkstra_recife())
+    test_floyd_microregions()
+    print(test_blocked_floyd_bitcoin_alpha())
+    test_floyd_negative_weights()
@@ -0,0 +1,74 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import bitcoin_dag, load_bitcoin_alpha, relax_until_stable
+from graphs.johnson import johnson_potentials, load_matrix
+
+
+def test_negative_cycle_is_reported(tmp_path):
+    algo = load_bitcoin_alpha()
+    report = algo.all_pairs_johnson(output_dir=str(tmp_path))
+    cycle = report["ciclo_negativo"]
+    assert report["matriz"] is None
+    assert cycle[0] == cycle[-1]
+    assert sum(min(w for n, w in algo.graph[u] if n == v) for u, v in zip(cycle, cycle[1:])) < 0
+    assert not (tmp_path / "distances.npy").exists()
+
+
+def test_johnson_matches_relaxation_bitcoin_dag(tmp_path):
+    algo = bitcoin_dag()
+    graph = algo.graph
+    rng = random.Random(47)
+    sources = rng.sample([node for node in graph if graph[node]], 96)
+
+    potentials = johnson_potentials(graph)
+    for node in graph:
+        for neighbor, weight in graph[node]:
+            assert weight + potentials[node] - potentials[neighbor] >= 0
+
+    start_time = time.perf_counter()
+    serial = algo.all_pairs_johnson(output_dir=str(tmp_path / "serial"), sources=sources, workers=1)
+    serial_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    parallel = algo.all_pairs_johnson(
+        output_dir=str(tmp_path / "parallel"), sources=sources, workers=2, chunk_rows=16
+    )
+    parallel_time = time.perf_counter() - start_time
+    assert parallel["ciclo_negativo"] is None
+
+    origins, targets, matrix = load_matrix(str(tmp_path / "parallel"))
+    _, _, serial_matrix = load_matrix(str(tmp_path / "serial"))
+    assert origins == sources
+    assert np.array_equal(matrix, serial_matrix)
+
+    index = {node: i for i, node in enumerate(targets)}
+    for row, source in enumerate(sources[:10]):
+        expected = np.full(len(targets), np.inf)
+        for node, cost in relax_until_stable(graph, source).items():
+            expected[index[node]] = cost
+        assert np.array_equal(matrix[row], expected)
+
+    reused = algo.all_pairs_johnson(output_dir=str(tmp_path / "serial"), sources=sources[:4], workers=1)
+    assert reused["potenciais_reutilizados"]
+
+    return {
+        "sources": len(sources),
+        "serial_seconds": serial_time,
+        "parallel_seconds": parallel_time,
+        "potentials_seconds": serial["tempo_potenciais_s"],
+        "reachable_fraction": float(np.isfinite(matrix).mean()),
+    }
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        test_negative_cycle_is_reported(Path(directory) / "cycle")
+        print(test_johnson_matches_relaxation_bitcoin_dag(Path(directory) / "dag"))
@@ -0,0 +1,75 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+from constants import ADJACENCIES_PATH
+
+
+def _simple_path_costs(graph, start, end):
+    costs = []
+
+    def visit(node, path, cost):
+        if node == end:
+            costs.append(cost)
+            return
+        best = {}
+        for neighbor, weight in graph.get(node, []):
+            best[neighbor] = min(weight, best.get(neighbor, float("inf")))
+        for neighbor, weight in best.items():
+            if neighbor not in path:
+                path.add(neighbor)
+                visit(neighbor, path, cost + weight)
+                path.remove(neighbor)
+
+    visit(start, {start}, 0.0)
+    return sorted(costs)
+
+
+def test_k_shortest_paths_match_enumeration():
+    rng = random.Random(7)
+    for trial in range(30):
+        nodes = [str(i) for i in range(8)]
+        graph = {node: [] for node in nodes}
+        for _ in range(20):
+            u, v = rng.sample(nodes, 2)
+            graph[u].append((v, float(rng.randint(1, 5))))
+
+        algo = Algorithms(graph)
+        algo.directed = True
+        algo.reverse_graph = algo.reversed(graph)
+
+        expected = _simple_path_costs(graph, "0", "7")[:10]
+        paths = algo.k_shortest_paths("0", "7", 10)
+
+        assert [cost for cost, _ in paths] == expected
+        assert len({tuple(path) for _, path in paths}) == len(paths)
+        for _, path in paths:
+            assert len(set(path)) == len(path)
+
+
+def test_k_shortest_paths_recife():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+
+    results = []
+    for k in (1, 10, 50, 100):
+        start_time = time.perf_counter()
+        paths = algo.k_shortest_paths("Nova Descoberta", "Boa Viagem (Setúbal)", k)
+        elapsed = time.perf_counter() - start_time
+
+        assert len(paths) == k
+        assert paths[0][0] == algo.dijkstra("Nova Descoberta", "Boa Viagem (Setúbal)")[0]
+        assert [cost for cost, _ in paths] == sorted(cost for cost, _ in paths)
+        results.append({"k": k, "time_seconds": elapsed, "longest_cost": paths[-1][0]})
+
+    return results
+
+
+if __name__ == "__main__":
+    test_k_shortest_paths_match_enumeration()
+    for result in test_k_shortest_paths_recife():
+        print(result)
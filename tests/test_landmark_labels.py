@@ -0,0 +1,72 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.labeling import LandmarkLabels
+
+
+def test_landmark_labels_bitcoin_alpha(tmp_path):
+    algo = load_bitcoin_alpha()
+    positive = algo.weight_view("abs", cache=True)
+    rng = random.Random(49)
+    nodes = list(algo.graph)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(500)]
+    results = []
+
+    for metric in ("hops", "weight"):
+        built = algo.landmark_labels(metric)
+        built.save(str(tmp_path / metric))
+        labels = LandmarkLabels.load(str(tmp_path / metric))
+        assert labels.report == built.report
+
+        references = {}
+        start_time = time.perf_counter()
+        for source, _ in pairs:
+            if source not in references:
+                if metric == "hops":
+                    references[source] = algo.bfs(source, algo.graph)[0]
+                else:
+                    references[source] = algo.shortest_path_tree(source, positive)[0]
+        search_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        answers = [labels.query(source, target) for source, target in pairs]
+        query_time = time.perf_counter() - start_time
+
+        for (source, target), (distance, hub) in zip(pairs, answers):
+            assert distance == references[source].get(target, float("inf"))
+            if hub is not None:
+                assert references[source][hub] <= distance
+
+        results.append(
+            {
+                **built.report,
+                "queries": len(pairs),
+                "query_seconds": query_time,
+                "search_seconds": search_time,
+            }
+        )
+
+    return results
+
+
+def test_weighted_labels_reject_negative_weights():
+    algo = load_bitcoin_alpha()
+    try:
+        algo.landmark_labels("weight", transform="identity")
+    except ValueError:
+        return
+    raise AssertionError("Esperava ValueError para pesos negativos")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        for result in test_landmark_labels_bitcoin_alpha(Path(directory)):
+            print(result)
+    test_weighted_labels_reject_negative_weights()
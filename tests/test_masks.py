@@ -0,0 +1,96 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import BITCOIN_ALPHA_CSV
+from graphs.algorithms import Algorithms
+from constants import ADJACENCIES_PATH
+
+
+def _without(graph, edge_ids_by_node, blocked_edges, blocked_nodes=()):
+    return {
+        node: [
+            (neighbor, weight)
+            for (neighbor, weight), edge_id in zip(neighbors, edge_ids_by_node[node])
+            if edge_id not in blocked_edges and neighbor not in blocked_nodes
+        ]
+        if node not in blocked_nodes
+        else []
+        for node, neighbors in graph.items()
+    }
+
+
+def test_bridge_closures_recife():
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    reference = Algorithms()
+    nodes = sorted(algo.graph)
+    baseline = algo.dijkstra("Santo Amaro", "Recife")
+
+    closed = algo.block_street("Pte.")
+    assert closed
+    expected = _without(algo.graph, algo.edge_ids, set(closed))
+    for source in nodes[:10]:
+        for target in nodes[-10:]:
+            assert algo.dijkstra(source, target)[0] == reference.dijkstra(source, target, expected)[0]
+    assert algo.dijkstra("Santo Amaro", "Recife")[0] >= baseline[0]
+
+    algo.clear_mask()
+    assert not algo.mask
+    assert algo.dijkstra("Santo Amaro", "Recife") == baseline
+
+    with algo.masked(nodes=["Boa Vista"]):
+        _, path = algo.dijkstra("Santo Amaro", "São José")
+        assert "Boa Vista" not in path.split(" -> ")
+        assert "Boa Vista" not in algo.isochrone("Santo Amaro", max_hops=3)
+        assert all("Boa Vista" not in route for _, route in algo.k_shortest_paths("Santo Amaro", "São José", 5))
+    assert not algo.mask
+
+    rng = random.Random(3)
+    all_edges = range(len(algo.edges))
+    scenarios = 500
+    start_time = time.perf_counter()
+    for _ in range(scenarios):
+        with algo.masked(edges=rng.sample(all_edges, 3)):
+            algo.dijkstra("Nova Descoberta", "Boa Viagem (Setúbal)")
+    elapsed = time.perf_counter() - start_time
+
+    return {"scenarios": scenarios, "scenarios_per_second": scenarios / elapsed}
+
+
+def test_masks_bitcoin_alpha():
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(BITCOIN_ALPHA_CSV))
+    graph = algo.weight_view("abs", cache=True)
+    reference = Algorithms()
+
+    rng = random.Random(5)
+    blocked_edges = set(rng.sample(range(len(algo.edges)), 2000))
+    blocked_nodes = set(rng.sample(list(algo.graph), 50))
+    source = next(node for node, degree in algo.degree_ranking("out") if node not in blocked_nodes)
+
+    start_time = time.perf_counter()
+    with algo.masked(edges=blocked_edges, nodes=blocked_nodes):
+        apply_time = time.perf_counter() - start_time
+        masked, _ = algo.shortest_path_tree(source, graph)
+        backward, _ = algo.backward_shortest_path_tree(source)
+    start_time = time.perf_counter()
+    algo.clear_mask()
+    clear_time = time.perf_counter() - start_time
+
+    rebuilt = _without(graph, algo.edge_ids, blocked_edges, blocked_nodes)
+    assert masked == reference.shortest_path_tree(source, rebuilt)[0]
+    reverse = _without(algo.reverse_graph, algo.reverse_edge_ids, blocked_edges, blocked_nodes)
+    assert backward == reference.shortest_path_tree(source, reverse)[0]
+
+    assert algo.shortest_path_tree(source, graph)[0] != masked
+
+    return {"apply_time_seconds": apply_time, "clear_time_seconds": clear_time, "reached": len(masked)}
+
+
+if __name__ == "__main__":
+    print(test_bridge_closures_recife())
+    print(test_masks_bitcoin_alpha())
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.normalize import NAME_ALIASES, normalize_name, normalize_series
+
+
+def _assert_parity(series: pd.Series) -> None:
+    expected = series.map(normalize_name)
+    result = normalize_series(series)
+    assert result.index.equals(series.index)
+    assert result.name == series.name
+    assert result.tolist() == expected.tolist()
+
+
+def test_normalize_series_matches_normalize_name():
+    series = pd.Series(
+        [
+            "  boa viagem  ",
+            "BOA   VIAGEM",
+            "Boa Viagem",
+            "graças",
+            "Várzea\t",
+            "setúbal",
+            " Setúbal ",
+            np.nan,
+            None,
+            "jardim são paulo",
+            "Boa Viagem",
+        ],
+        index=range(10, 21),
+        name="bairro",
+    )
+    _assert_parity(series)
+
+    result = normalize_series(series)
+    assert result[10] == result[11] == result[12] == "Boa Viagem"
+    assert result[13] == "Graças" and result[14] == "Várzea"
+    assert result[15] == result[16] == NAME_ALIASES["Setúbal"]
+    assert pd.isna(result[17]) and pd.isna(result[18])
+
+
+def test_normalize_series_reuses_name_table():
+    series = pd.Series(["derby", "Derby", "  DERBY"] * 3)
+    _assert_parity(series)
+    first = normalize_series(series)
+    second = normalize_series(series)
+    assert all(a is b for a, b in zip(first, second))
+    assert len(set(map(id, first))) == 1
+
+
+def test_normalize_series_aliases():
+    for alias, canonical in NAME_ALIASES.items():
+        series = pd.Series([alias, alias.lower(), f"  {alias.upper()}  ", canonical])
+        _assert_parity(series)
+        assert set(normalize_series(series)) == {canonical}
+
+
+if __name__ == "__main__":
+    test_normalize_series_matches_normalize_name()
+    test_normalize_series_reuses_name_table()
+    test_normalize_series_aliases()
@@ -0,0 +1,115 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.algorithms import Algorithms
+from graphs.cache import ShortestPathCache
+
+
+def test_cache_single_flight_and_eviction():
+    cache = ShortestPathCache(max_entries=4)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"a": 0.0, "b": 1.0}, {"a": None, "b": "a"}
+
+    key = cache.key("fp", "a")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute(key, compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 7
+
+    cache.get_or_compute(cache.key("fp", "b"), compute)
+    cache.get_or_compute(cache.key("fp", "c"), compute)
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] <= 4
+    assert key not in cache
+
+
+def test_cached_dijkstra_matches_search_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    graph = algo.weight_view("abs", cache=True)
+    reference = Algorithms()
+
+    all_nodes = list(graph.keys())
+    sources = [all_nodes[0], all_nodes[50], all_nodes[200]]
+    targets = all_nodes[:: max(1, len(all_nodes) // 25)]
+
+    start_time = time.perf_counter()
+    uncached = {
+        source: reference.shortest_path_tree(source, graph)[0] for source in sources
+    }
+    uncached_time = (time.perf_counter() - start_time) * len(targets)
+
+    entries = len(algo.path_cache)
+    for source in sources:
+        for target in targets:
+            weight, _ = algo.dijkstra(source, target, graph)
+            assert weight == uncached[source].get(target, float("inf"))
+    assert len(algo.path_cache) == entries
+
+    before = algo.path_cache.stats()
+    start_time = time.perf_counter()
+    for source in sources:
+        algo.cached_tree(source, graph)
+        for target in targets:
+            weight, _ = algo.dijkstra(source, target, graph)
+            assert weight == uncached[source].get(target, float("inf"))
+    cached_time = time.perf_counter() - start_time
+    after = algo.path_cache.stats()
+
+    assert after["misses"] - before["misses"] <= len(sources)
+    searched = sum(algo.may_reach(source, target, graph) for source in sources for target in targets)
+    assert after["hits"] + after["misses"] - before["hits"] - before["misses"] == searched + len(sources)
+    assert after["hits"] - before["hits"] >= searched
+
+    return {
+        "queries": len(sources) * len(targets),
+        "uncached_time_seconds": uncached_time,
+        "cached_time_seconds": cached_time,
+        **after,
+    }
+
+
+def test_fingerprint_follows_graph_mutation():
+    graph = {"a": [("b", 1.0)], "b": [("c", 2.0)], "c": []}
+    algo = Algorithms(graph)
+    view = algo.weight_view("abs", graph={"x": [("y", -1.0)], "y": []})
+    first, other = algo.fingerprint(), algo.fingerprint(view)
+    assert algo.fingerprint(graph) == first and algo.fingerprint(view) == other
+    assert len(algo._fingerprints) == 2
+
+    tree = algo.cached_tree("a")
+    graph["c"].append(("a", 1.0))
+    assert algo.fingerprint() != first
+    assert algo.cached_tree("a") is not tree
+
+    grown = algo.fingerprint()
+    graph["a"][0] = ("b", 5.0)
+    assert algo.fingerprint() == grown
+    algo.graph_changed(graph)
+    assert algo.fingerprint() != grown
+    assert algo.dijkstra("a", "c") == (7.0, "a -> b -> c")
+
+
+if __name__ == "__main__":
+    test_cache_single_flight_and_eviction()
+    print(test_cached_dijkstra_matches_search_bitcoin_alpha())
+    test_fingerprint_follows_graph_mutation()
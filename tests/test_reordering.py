@@ -0,0 +1,74 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+from graphs.reorder import ORDERINGS, reorder, edge_span, bandwidth
+from graphs.weights import ABSOLUTE
+
+
+def test_reordering_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    csr = algo.build_csr(ordering="original").view(ABSOLUTE)
+
+    all_nodes = list(algo.graph.keys())
+    sources = [all_nodes[0], all_nodes[100], all_nodes[500]]
+
+    baseline = None
+    results = []
+
+    for method in ORDERINGS:
+        start_time = time.perf_counter()
+        reordered = reorder(csr, method)
+        reorder_time = time.perf_counter() - start_time
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        bfs_results = [reordered.bfs(source) for source in sources]
+        bfs_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        dijkstra_results = [reordered.dijkstra(source) for source in sources]
+        dijkstra_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        ranks = reordered.pagerank()
+        pagerank_time = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if baseline is None:
+            baseline = (bfs_results, dijkstra_results, ranks)
+        else:
+            assert bfs_results == baseline[0]
+            assert dijkstra_results == baseline[1]
+            assert all(abs(ranks[node] - baseline[2][node]) < 1e-9 for node in ranks)
+
+        built = algo.build_csr(ordering=method)
+        assert built.nodes == reordered.nodes
+        assert (built.indices == reordered.indices).all()
+
+        results.append(
+            {
+                "ordering": method,
+                "total_nodes": reordered.num_nodes(),
+                "total_edges": reordered.num_edges(),
+                "edge_span": edge_span(reordered),
+                "bandwidth": bandwidth(reordered),
+                "reorder_time_seconds": reorder_time,
+                "bfs_time_seconds": bfs_time,
+                "dijkstra_time_seconds": dijkstra_time,
+                "pagerank_time_seconds": pagerank_time,
+                "peak_memory_mb": peak / 1024 / 1024,
+            }
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    for result in test_reordering_bitcoin_alpha():
+        print(result)
@@ -0,0 +1,80 @@
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+from utils.normalize import NAME_ALIASES
+from utils.resolver import NameResolver, fold_name
+from constants import ADJACENCIES_PATH
+
+NAMES = ["Boa Viagem", "Boa Vista", "Boa Viagem (Setúbal)", "Graças", "Várzea", "Casa Forte", "Casa Amarela"]
+
+
+def test_exact_and_folded_matches():
+    resolver = NameResolver(NAMES)
+    assert fold_name("  VÁRZEA ") == "varzea"
+    assert resolver.resolve("Graças") == "Graças"
+    assert resolver.resolve("gracas") == "Graças"
+    assert resolver.resolve("BOA   viagem") == "Boa Viagem"
+    assert resolver.resolve("varzea", fuzzy=False) == "Várzea"
+
+
+def test_suggestion_ranking():
+    resolver = NameResolver(NAMES)
+    suggestions = resolver.suggest("boa viag")
+    assert suggestions[0][0] == "Boa Viagem"
+    assert [score for _, score in suggestions] == sorted((score for _, score in suggestions), reverse=True)
+    assert suggestions[0][1] > dict(suggestions)["Boa Vista"]
+
+    assert resolver.suggest("Grasas")[0][0] == "Graças"
+    assert resolver.resolve("Grasas") == "Graças"
+    assert resolver.resolve("Grasas", fuzzy=False) is None
+    assert resolver.resolve("Xyzzy") is None
+    assert resolver.suggest("") == []
+
+
+def test_tie_resolves_to_none():
+    resolver = NameResolver(NAMES)
+    first, second = resolver.suggest("casa", limit=2)
+    assert first[1] == second[1]
+    assert {first[0], second[0]} == {"Casa Forte", "Casa Amarela"}
+    assert resolver.resolve("casa") is None
+
+
+def test_aliases():
+    resolver = NameResolver(NAMES, aliases=NAME_ALIASES)
+    for alias, canonical in NAME_ALIASES.items():
+        assert resolver.resolve(alias, fuzzy=False) == canonical
+        assert resolver.resolve(fold_name(alias).upper(), fuzzy=False) == canonical
+    assert NameResolver(NAMES).resolve("setubal", fuzzy=False) is None
+    assert NameResolver(["Boa Viagem"], aliases=NAME_ALIASES).resolve("Setúbal", fuzzy=False) is None
+
+
+def test_batch_mode_rejects_fuzzy_matches(tmp_path):
+    algo = Algorithms()
+    algo.load_graph_from_csv(ADJACENCIES_PATH)
+    addresses = tmp_path / "enderecos.csv"
+    with open(addresses, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["X", "Y", "bairro_X", "Bairro_Y"])
+        writer.writerow(["a", "b", "boa viagem", "GRACAS"])
+        writer.writerow(["a", "b", "Setúbal", "Derby"])
+        writer.writerow(["a", "b", "Boa Viajem", "Derby"])
+
+    assert algo.resolve_name("Boa Viajem") == "Boa Viagem"
+    records = [(origin, target) for _, origin, target in algo.read_address_pairs(str(addresses))]
+    assert records == [("Boa Viagem", "Graças"), ("Boa Viagem (Setúbal)", "Derby"), (None, "Derby")]
+    assert algo.resolved_pairs(str(addresses)) == records[:2]
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_exact_and_folded_matches()
+    test_suggestion_ranking()
+    test_tie_resolves_to_none()
+    test_aliases()
+    with tempfile.TemporaryDirectory() as directory:
+        test_batch_mode_rejects_fuzzy_matches(Path(directory))
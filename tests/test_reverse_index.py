@@ -0,0 +1,58 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+
+
+def test_reverse_index_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    graph = algo.graph
+
+    all_nodes = list(graph.keys())
+    targets = [all_nodes[0], all_nodes[100], all_nodes[500]]
+    results = []
+
+    for target in targets:
+        start_time = time.perf_counter()
+        scanned = sorted(
+            (source, weight)
+            for source, neighbors in graph.items()
+            for neighbor, weight in neighbors
+            if neighbor == target
+        )
+        scan_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        indexed = sorted(algo.predecessors(target))
+        index_time = time.perf_counter() - start_time
+
+        assert indexed == scanned
+        assert algo.in_degrees[target] == len(scanned)
+
+        results.append(
+            {
+                "target": target,
+                "in_degree": algo.in_degrees[target],
+                "out_degree": algo.out_degrees[target],
+                "scan_time_seconds": scan_time,
+                "index_time_seconds": index_time,
+            }
+        )
+
+    csr = algo.build_csr()
+    reverse = csr.reverse()
+    assert (csr.in_degrees() == reverse.out_degrees()).all()
+    assert sorted(reverse.to_adjacency()[targets[0]]) == sorted(algo.predecessors(targets[0]))
+
+    top_in = algo.degree_ranking("in", top=10)
+    assert [degree for _, degree in top_in] == sorted(algo.in_degrees.values(), reverse=True)[:10]
+
+    return results
+
+
+if __name__ == "__main__":
+    for result in test_reverse_index_bitcoin_alpha():
+        print(result)
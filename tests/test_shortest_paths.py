@@ -0,0 +1,96 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import bitcoin_dag, load_bitcoin_alpha, relax_until_stable
+from graphs.algorithms import Algorithms
+
+
+def test_weight_stats_are_cached():
+    algo = load_bitcoin_alpha()
+    stats = algo.weight_stats()
+    assert stats.negative and stats.integral and not stats.uniform
+    assert stats.minimum == -10 and stats.maximum == 10
+    assert algo.weight_stats() is stats
+
+    positive = algo.weight_stats(algo.weight_view("abs"))
+    assert not positive.negative and positive.minimum == 1
+    assert algo.weight_stats(algo.weight_view("abs")) is positive
+
+
+def test_dispatch_matches_dijkstra_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    reference = Algorithms()
+    rng = random.Random(46)
+    sources = rng.sample(list(algo.graph), 5)
+    timings = {}
+
+    views = {
+        "dial": algo.weight_view("abs"),
+        "bfs": algo.weight_view("clip:3,3"),
+        "dijkstra": algo.weight_view("shift:10.5"),
+    }
+    for expected_strategy, graph in views.items():
+        assert algo.choose_strategy(graph) == expected_strategy
+        elapsed = 0.0
+        for source in sources:
+            start_time = time.perf_counter()
+            result = algo.shortest_paths(source, graph)
+            elapsed += time.perf_counter() - start_time
+            distances, _ = reference.shortest_path_tree(source, graph)
+            assert result.strategy == expected_strategy
+            assert result.distances == distances
+            target = rng.choice(list(distances))
+            path = result.path(target)
+            assert path[0] == source and path[-1] == target
+            assert sum(dict(graph[u])[v] for u, v in zip(path, path[1:])) == distances[target]
+        timings[f"{expected_strategy}_seconds"] = elapsed
+
+        start_time = time.perf_counter()
+        for source in sources:
+            reference.shortest_path_tree(source, graph)
+        timings[f"{expected_strategy}_heap_seconds"] = time.perf_counter() - start_time
+
+    return timings
+
+
+def test_negative_weights_dispatch():
+    algo = load_bitcoin_alpha()
+    source = next(iter(algo.graph))
+    result = algo.shortest_paths(source)
+    assert result.strategy == "bellman_ford"
+    assert result.negative_cycle
+
+    dag = bitcoin_dag()
+    source = max(dag.graph, key=lambda node: len(dag.graph[node]))
+    result = dag.shortest_paths(source)
+    assert result.strategy == "dag"
+    assert result.distances == relax_until_stable(dag.graph, source)
+
+    forced = dag.shortest_paths(source, strategy="bellman_ford")
+    assert not forced.negative_cycle
+    assert forced.distances == result.distances
+
+
+def test_recife_uses_dial():
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(Path(__file__).parent.parent / "data" / "adjacencias_bairros.csv"))
+    result = algo.shortest_paths("Boa Viagem")
+    assert result.strategy == "dial"
+    for target, cost in result.distances.items():
+        assert algo.dijkstra("Boa Viagem", target)[0] == cost
+
+    forced = algo.shortest_paths("Boa Viagem", strategy="dijkstra")
+    assert forced.strategy == "dijkstra"
+    assert forced.distances == result.distances
+    assert len(algo.path_cache) == 0
+
+
+if __name__ == "__main__":
+    test_weight_stats_are_cached()
+    print(test_dispatch_matches_dijkstra_bitcoin_alpha())
+    test_negative_weights_dispatch()
+    test_recife_uses_dial()
@@ -0,0 +1,97 @@
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+from graphs.streets import StreetIndex, normalize_street
+
+ROWS = [
+    ("Recife", "Santo Amaro", "Pte. do Limoeiro", "Acesso pela Avenida Norte", "4"),
+    ("Santo Amaro", "Boa Vista", "R. da Aurora", "", "2"),
+    ("Santo Amaro", "Boa Vista", "Av. Cruz Cabugá", "", "3"),
+    ("Boa Vista", "Derby", "Av. Gov. Agamenon Magalhães", "", "2"),
+    ("Recife", "Derby", "Av. Norte", "", "9"),
+]
+
+
+def _index() -> StreetIndex:
+    index = StreetIndex()
+    for origem, destino, logradouro, observacao, peso in ROWS:
+        index.add(origem, destino, logradouro, observacao, float(peso))
+    return index
+
+
+def test_normalize_street_expands_abbreviations():
+    assert normalize_street("R. da Aurora") == "rua da aurora"
+    assert normalize_street("Av. Gov. Agamenon Magalhães") == "avenida governador agamenon magalhaes"
+    assert normalize_street("Pte.  do   Limoeiro") == "ponte do limoeiro"
+    assert normalize_street("Avenida Norte") == normalize_street("av norte")
+    assert normalize_street(None) == ""
+
+
+def test_lookup_exact_and_abbreviated():
+    index = _index()
+    assert [edge.edge_id for edge in index.lookup("Rua da Aurora")] == [1]
+    assert [edge.edge_id for edge in index.lookup("r. DA AURORA")] == [1]
+    assert [edge.edge_id for edge in index.lookup("Avenida Governador Agamenon Magalhães")] == [3]
+    assert [edge.edge_id for edge in index.lookup("Ponte do Limoeiro")] == [0]
+    assert index.lookup("Rua Inexistente") == []
+
+
+def test_phrase_matching():
+    index = _index()
+    assert [edge.edge_id for edge in index.lookup("Agamenon Magalhães")] == [3]
+    assert [edge.edge_id for edge in index.lookup("Cruz Cabuga")] == [2]
+    assert index.lookup("Magalhães Agamenon") == []
+    assert index.lookup("Aurora da") == []
+    assert [edge.edge_id for edge in index.lookup("Av. Norte")] == [4]
+    assert [edge.edge_id for edge in index.lookup("Av. Norte", include_notes=True)] == [0, 4]
+
+
+def test_between_sorts_parallel_edges_by_weight():
+    index = _index()
+    assert [edge.logradouro for edge in index.between("Boa Vista", "Santo Amaro")] == ["R. da Aurora", "Av. Cruz Cabugá"]
+    assert index.between("Recife", "Boa Vista") == []
+
+
+def test_algorithms_path_streets(tmp_path):
+    adjacencies = tmp_path / "adjacencias.csv"
+    with open(adjacencies, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["bairro_origem", "bairro_destino", "logradouro", "observacao", "peso"])
+        writer.writerows(ROWS)
+
+    algo = Algorithms()
+    algo.load_graph_from_csv(str(adjacencies))
+    cost, path = algo.dijkstra("Recife", "Derby")
+    assert cost == 8.0 and path == "Recife -> Santo Amaro -> Boa Vista -> Derby"
+
+    hops = algo.path_streets(path)
+    assert [hop["logradouros"] for hop in hops] == [
+        ["Pte. do Limoeiro"],
+        ["R. da Aurora"],
+        ["Av. Gov. Agamenon Magalhães"],
+    ]
+    assert algo.path_streets(["Recife", "Derby"])[0]["logradouros"] == ["Av. Norte"]
+
+    with algo.masked(streets=["Aurora"]):
+        assert algo.path_streets(path)[1]["logradouros"] == ["Av. Cruz Cabugá"]
+    with algo.masked(streets=["Aurora", "Cruz Cabugá"]):
+        assert algo.path_streets(path)[1]["logradouros"] == []
+
+    cost, path = algo.route_via_street("Recife", "Derby", "Cruz Cabugá")
+    assert cost == 9.0 and path == "Recife -> Santo Amaro -> Boa Vista -> Derby"
+    assert algo.path_streets(path, "Cruz Cabugá")[1]["logradouros"] == ["Av. Cruz Cabugá"]
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_normalize_street_expands_abbreviations()
+    test_lookup_exact_and_abbreviated()
+    test_phrase_matching()
+    test_between_sorts_parallel_edges_by_weight()
+    with tempfile.TemporaryDirectory() as directory:
+        test_algorithms_path_streets(Path(directory))
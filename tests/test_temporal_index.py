@@ -0,0 +1,79 @@
+import csv
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.algorithms import Algorithms
+
+DAY = 24 * 60 * 60
+
+
+def load_rows(csv_path: Path):
+    with open(csv_path, "r", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        next(reader)
+        return [(row[0], row[1], float(row[2]), int(row[3])) for row in reader]
+
+
+def brute_force_window(rows, t0: int, t1: int):
+    graph = {}
+    for source, target, rating, timestamp in sorted(rows, key=lambda row: row[3]):
+        if t0 <= timestamp < t1:
+            graph.setdefault(source, [])
+            graph.setdefault(target, [])
+            graph[source].append((target, rating))
+    return graph
+
+
+def normalized(graph):
+    return {node: sorted(neighbors) for node, neighbors in graph.items()}
+
+
+def test_temporal_index_bitcoin_alpha():
+    csv_path = Path(__file__).parent.parent / "data" / "bitcoin_alpha.csv"
+    rows = load_rows(csv_path)
+
+    algo = Algorithms()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    index = algo.load_temporal_index(str(csv_path))
+    build_time = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    first, last = index.time_range()
+    t0, t1 = first + 365 * DAY, first + 730 * DAY
+
+    start_time = time.perf_counter()
+    window = index.window_graph(t0, t1)
+    window_time = time.perf_counter() - start_time
+    assert normalized(window) == normalized(brute_force_window(rows, t0, t1))
+
+    csr = index.window_csr(t0, t1)
+    assert normalized(csr.to_adjacency()) == normalized(window)
+
+    start_time = time.perf_counter()
+    windows = 0
+    for w0, w1, sliding in index.sliding_windows(90 * DAY, 30 * DAY):
+        windows += 1
+        if windows % 10 == 0:
+            assert normalized(sliding.adjacency) == normalized(index.window_graph(w0, w1))
+    sliding_time = time.perf_counter() - start_time
+
+    return {
+        "total_edges": len(index),
+        "total_nodes": len(index.nodes),
+        "window_edges": sum(len(neighbors) for neighbors in window.values()),
+        "build_time_seconds": build_time,
+        "window_time_seconds": window_time,
+        "sliding_windows": windows,
+        "sliding_time_seconds": sliding_time,
+        "peak_memory_mb": peak / 1024 / 1024,
+    }
+
+
+if __name__ == "__main__":
+    print(test_temporal_index_bitcoin_alpha())
@@ -0,0 +1,78 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphs.temporal import TemporalEdgeIndex
+from graphs.temporal_paths import TemporalPaths, INFINITY
+
+
+def brute_force_earliest_arrival(index: TemporalEdgeIndex, source: str, duration: int):
+    first, _ = index.time_range()
+    edges = list(zip(index.sources.tolist(), index.targets.tolist(), index.times.tolist()))
+    arrival = {index.node_ids[source]: first}
+    changed = True
+    while changed:
+        changed = False
+        for u, v, t in edges:
+            if t >= arrival.get(u, INFINITY) and t + duration < arrival.get(v, INFINITY):
+                arrival[v] = t + duration
+                changed = True
+    return {index.nodes[v]: value for v, value in arrival.items()}
+
+
+def test_temporal_paths_bitcoin_alpha():
+    csv_path = Path(__file__).parent.parent / "data" / "bitcoin_alpha.csv"
+    index = TemporalEdgeIndex.from_csv(str(csv_path))
+    engine = TemporalPaths(index)
+
+    sources = [index.nodes[0], index.nodes[100], index.nodes[500]]
+    results = []
+
+    for source in sources:
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        arrival, parents = engine.earliest_arrival(source)
+        earliest_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        fastest = engine.fastest(source)
+        fastest_time = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert arrival == brute_force_earliest_arrival(index, source, engine.duration)
+        assert set(fastest) == set(arrival)
+
+        for target in list(arrival)[:20]:
+            hops = engine.build_path(parents, source, target)
+            times = [departure for _, _, departure in hops]
+            assert times == sorted(times)
+
+        results.append(
+            {
+                "source": source,
+                "reachable_nodes": len(arrival),
+                "total_nodes": len(index.nodes),
+                "earliest_time_seconds": earliest_time,
+                "fastest_time_seconds": fastest_time,
+                "peak_memory_mb": peak / 1024 / 1024,
+            }
+        )
+
+    start_time = time.perf_counter()
+    batch_sources, batch = engine.earliest_arrival_batch(sources)
+    batch_time = time.perf_counter() - start_time
+    for row, source in enumerate(batch_sources):
+        arrival, _ = engine.earliest_arrival(source)
+        assert int((batch[row] < INFINITY).sum()) == len(arrival)
+
+    results.append({"batch_sources": len(batch_sources), "batch_time_seconds": batch_time})
+    return results
+
+
+if __name__ == "__main__":
+    for result in test_temporal_paths_bitcoin_alpha():
+        print(result)
@@ -0,0 +1,47 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared_data import load_bitcoin_alpha
+
+
+def test_multi_source_dijkstra_bitcoin_alpha():
+    algo = load_bitcoin_alpha()
+    graph = algo.weight_view("abs", cache=True)
+    hubs = [node for node, _ in algo.degree_ranking("out", top=5)]
+
+    start_time = time.perf_counter()
+    trees = [algo.shortest_path_tree(hub, graph)[0] for hub in hubs]
+    per_hub_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    distances, nearest, parents = algo.multi_source_dijkstra(hubs, graph)
+    multi_source_time = time.perf_counter() - start_time
+
+    for node, distance in distances.items():
+        assert distance == min(tree.get(node, float("inf")) for tree in trees)
+        assert trees[hubs.index(nearest[node])][node] == distance
+        root = node
+        while parents[root] is not None:
+            root = parents[root]
+        assert root == nearest[node]
+    assert set(distances) == set().union(*trees)
+
+    summary = algo.voronoi_cells(hubs, graph)
+    assert sum(cell["tamanho"] for cell in summary["celulas"]) == len(distances)
+    assert all(edge["celula_origem"] != edge["celula_destino"] for edge in summary["fronteira"])
+    assert sum(cell["arestas_fronteira"] for cell in summary["celulas"]) == 2 * len(summary["fronteira"])
+
+    return {
+        "hubs": hubs,
+        "reached": len(distances),
+        "boundary_edges": len(summary["fronteira"]),
+        "per_hub_time_seconds": per_hub_time,
+        "multi_source_time_seconds": multi_source_time,
+    }
+
+
+if __name__ == "__main__":
+    print(test_multi_source_dijkstra_bitcoin_alpha())
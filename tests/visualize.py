@@ -260,7 +260,7 @@ def visualize_distance_heatmap(
     distance_matrix = np.full((n, n), np.inf)
 
     for i, source in enumerate(sample_nodes):
-        distances, _ = algo.bfs(source, graph_dict)
+        distances, _ = algo.hop_tree(source)
         for j, target in enumerate(sample_nodes):
             if i == j:
                 distance_matrix[i][j] = 0